@@ -6,22 +6,834 @@ Extends the SubjectiveDataSource abstract base class to provide YouTube-specific
 
 import os
 import re
+import asyncio
+import hashlib
+import importlib.util
+import inspect
 import json
-import glob
+import sqlite3
+import subprocess
+import threading
+import multiprocessing
+import pickle
+import queue
+import random
+import shutil
+import socket
+import sys
 import tempfile
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache, partial
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from types import ModuleType, SimpleNamespace
+from multiprocessing import shared_memory
+from typing import Dict, List, NamedTuple, Optional, Any, Iterator, Iterable
+import numpy as np
 from yt_dlp import YoutubeDL
-import whisper
+from faster_whisper import BatchedInferencePipeline, WhisperModel
+from faster_whisper.audio import pad_or_trim
+from faster_whisper.feature_extractor import FeatureExtractor
+from faster_whisper.tokenizer import Tokenizer
 import logging
-from pydub import AudioSegment
 
 # Import from the abstract base class package
 from subjective_abstract_data_source_package import SubjectiveDataSource
 from brainboost_data_source_logger_package import BBLogger
 from brainboost_configuration_package import BBConfig
 
+# Single alternation covering watch, live, shorts and youtu.be URLs; leading
+# whitespace is tolerated so callers need not strip, and group 1 is the 11-character video id
+_YOUTUBE_URL_PATTERN = r'^\s*(?:https?://)?(?:www\.)?(?:youtube\.com/(?:watch\?v=|live/|shorts/)|youtu\.be/)([\w-]{11})'
+_YOUTUBE_RE = re.compile(_YOUTUBE_URL_PATTERN)
+# Every prefix _YOUTUBE_RE can match (after leading whitespace), for a str.startswith pre-check
+_YOUTUBE_PREFIXES = tuple(
+    scheme + www + host
+    for scheme in ('https://', 'http://', '')
+    for www in ('www.', '')
+    for host in ('youtube.com/', 'youtu.be/')
+)
+
+# Playlist and channel URLs, expanded into their videos before downloading
+_PLAYLIST_RE = re.compile(r'^\s*(?:https?://)?(?:www\.|m\.)?youtube\.com/(?:playlist\?|@|channel/|c/|user/)')
+
+# Known, long-lived video whose metadata the connection test asks yt-dlp for
+_CONNECTION_TEST_URL = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+
+# Filename sanitizing: spaces become underscores, anything else outside [\w-] is dropped
+_SPACE_TABLE = str.maketrans(' ', '_')
+_SANITIZE_RE = re.compile(r'[^\w\-]')
+
+# Dependency name reported by _check_dependencies_status -> importable module
+_PYTHON_DEPENDENCIES = {
+    'yt-dlp': 'yt_dlp',
+    'openai-whisper': 'whisper',
+    'faster-whisper': 'faster_whisper',
+    'opencv-python': 'cv2',
+    'mediapipe': 'mediapipe',
+    'pydub': 'pydub',
+    'ffmpeg-python': 'ffmpeg',
+}
+
+# Fallback icon when icon.svg is missing
+_DEFAULT_ICON_SVG = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24"><rect width="24" height="24" rx="4" fill="#ff0000"/><path fill="#fff" d="M10 8l6 4-6 4z"/></svg>'
+
+# yt-dlp error fragments that are worth remembering for a short while
+_CACHEABLE_ERRORS = ('HTTP Error 429', 'HTTP Error 404', 'Video unavailable', 'Private video')
+# yt-dlp errors no retry can fix; the remaining attempts are skipped
+_TERMINAL_ERRORS = ('HTTP Error 404', 'Video unavailable', 'Private video', 'Sign in to confirm your age')
+
+# Whisper consumes 16 kHz mono float32 audio
+_WHISPER_SAMPLE_RATE = 16000
+# Length of one Whisper input window; clips up to this long fit a single encoder pass
+_WHISPER_WINDOW_SECONDS = 30
+
+# Process-wide loaded models keyed by their load settings, so new data source
+# instances and repeated batches reuse a model instead of reloading it
+_WHISPER_CACHE: Dict[tuple, WhisperModel] = {}
+_WHISPER_CACHE_LOCK = threading.Lock()
+
+class _CachedTranscript(NamedTuple):
+    """A transcript answered from the transcript cache, handed through process_batch's pipeline."""
+    metadata: Dict[str, Any]
+    transcript: str
+    language: str
+
+
+class _SQLiteCache:
+    """Small persistent key/value cache with per-entry expiry, safe to share between threads."""
+    
+    def __init__(self, path: str, table: str):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._table = table
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires REAL)"
+            )
+    
+    def get(self, key: str) -> Any:
+        """Return the cached value for key, or None when missing or expired."""
+        with self._lock:
+            row = self._conn.execute(f"SELECT value, expires FROM {self._table} WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        value, expires = row
+        if expires is not None and expires < time.time():
+            return None
+        return json.loads(value)
+    
+    def set(self, key: str, value: Any, expire: Optional[float] = None):
+        """Store a JSON-serializable value, optionally expiring after `expire` seconds."""
+        expires = time.time() + expire if expire else None
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO {self._table} (key, value, expires) VALUES (?, ?, ?)",
+                (key, json.dumps(value), expires)
+            )
+    
+    def clear(self):
+        """Remove every entry from the cache."""
+        with self._lock, self._conn:
+            self._conn.execute(f"DELETE FROM {self._table}")
+
+
+class _TokenBucket:
+    """Thread-safe token bucket allowing `rate` acquisitions per `period` seconds, bursting up to `rate`."""
+    
+    def __init__(self, rate: float, period: float = 60.0):
+        self._capacity = float(rate)
+        self._fill_rate = rate / period
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a token is available, then consume it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._fill_rate)
+                self._updated = now
+                if now >= self._paused_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = max(self._paused_until - now, (1 - self._tokens) / self._fill_rate)
+            time.sleep(wait)
+    
+    def pause(self, seconds: float):
+        """Hold back every caller for the given number of seconds (e.g. after an HTTP 429)."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+class _TorchFeatureExtractor(FeatureExtractor):
+    """
+    Log-mel feature extractor computing the STFT and mel projection with torch on the
+    GPU instead of NumPy on the CPU. Output matches faster-whisper's FeatureExtractor.
+    """
+    
+    def __init__(self, base: FeatureExtractor, device: str):
+        import torch
+        super().__init__(
+            feature_size=base.mel_filters.shape[0],
+            sampling_rate=base.sampling_rate,
+            hop_length=base.hop_length,
+            chunk_length=base.chunk_length,
+            n_fft=base.n_fft,
+        )
+        self._torch = torch
+        self._device = device
+        # Cached on the device once; reused for every call
+        self._window = torch.hann_window(self.n_fft, device=device)
+        self._mel_filters = torch.from_numpy(self.mel_filters).to(device)
+    
+    def __call__(self, waveform: np.ndarray, padding=160, chunk_length=None):
+        torch = self._torch
+        if chunk_length is not None:
+            self.n_samples = chunk_length * self.sampling_rate
+            self.nb_max_frames = self.n_samples // self.hop_length
+        
+        with torch.inference_mode():
+            audio = torch.from_numpy(np.asarray(waveform, dtype=np.float32)).to(self._device)
+            if padding:
+                audio = torch.nn.functional.pad(audio, (0, padding))
+            stft = torch.stft(audio, self.n_fft, self.hop_length, window=self._window, return_complex=True)
+            magnitudes = stft[..., :-1].abs() ** 2
+            mel_spec = self._mel_filters @ magnitudes
+            log_spec = torch.clamp(mel_spec, min=1e-10).log10()
+            log_spec = torch.maximum(log_spec, log_spec.max() - 8.0)
+            return ((log_spec + 4.0) / 4.0).cpu().numpy()
+
+
+def _enable_gpu_features(model: WhisperModel, device: str) -> bool:
+    """Swap the model's CPU feature extractor for the torch/CUDA one; returns True on success."""
+    if device != "cuda":
+        return False
+    try:
+        model.feature_extractor = _TorchFeatureExtractor(model.feature_extractor, device)
+        return True
+    except ImportError:
+        return False
+
+
+class _OpenVINOWhisper:
+    """
+    openvino_genai.WhisperPipeline behind the subset of WhisperModel.transcribe used here.
+    
+    Compiled kernels are persisted in cache_dir, so only the first start pays the
+    model compile. faster-whisper-only options (beam_size, VAD, ...) are ignored.
+    """
+    
+    def __init__(self, model_dir: str, device: str, cache_dir: str):
+        import openvino_genai
+        self._pipeline = openvino_genai.WhisperPipeline(model_dir, device, CACHE_DIR=cache_dir)
+    
+    def transcribe(self, audio: np.ndarray, language: Optional[str] = None,
+                   initial_prompt: Optional[str] = None, **_options):
+        config = {'task': 'transcribe'}
+        if language:
+            config['language'] = f"<|{language}|>"
+        if initial_prompt:
+            config['initial_prompt'] = initial_prompt
+        result = self._pipeline.generate(audio.tolist(), **config)
+        segments = [SimpleNamespace(text=result.texts[0])]
+        return segments, SimpleNamespace(language=language)
+
+
+class _ONNXWhisper:
+    """
+    Whisper exported to ONNX Runtime through optimum, behind the subset of
+    WhisperModel.transcribe used here.
+    
+    The export runs once per model size and device into cache_dir. On CPU the
+    exported graphs are then quantized to INT8 weights (dynamic quantization of
+    MatMul/Gemm). faster-whisper-only options (beam_size, VAD, ...) are ignored.
+    """
+    
+    def __init__(self, model_size: str, device: str, cache_dir: str):
+        from optimum.onnxruntime import ORTModelForSpeechSeq2Seq
+        from transformers import AutoProcessor, pipeline
+        
+        model_id = f"openai/whisper-{model_size}"
+        model_dir = os.path.join(cache_dir, f"{model_size}-{'fp32' if device == 'cuda' else 'int8'}")
+        if not os.path.isdir(model_dir):
+            self._export(model_id, model_dir, quantize=device != 'cuda')
+        
+        provider = 'CUDAExecutionProvider' if device == 'cuda' else 'CPUExecutionProvider'
+        processor = AutoProcessor.from_pretrained(model_dir)
+        model = ORTModelForSpeechSeq2Seq.from_pretrained(model_dir, provider=provider)
+        self._pipeline = pipeline(
+            'automatic-speech-recognition',
+            model=model,
+            tokenizer=processor.tokenizer,
+            feature_extractor=processor.feature_extractor,
+            chunk_length_s=_WHISPER_WINDOW_SECONDS,
+            batch_size=8,
+        )
+    
+    @staticmethod
+    def _export(model_id: str, model_dir: str, quantize: bool):
+        """Export model_id to ONNX in model_dir, written to a temporary directory first."""
+        from optimum.onnxruntime import ORTModelForSpeechSeq2Seq
+        from transformers import AutoProcessor
+        
+        os.makedirs(os.path.dirname(model_dir), exist_ok=True)
+        staging = tempfile.mkdtemp(dir=os.path.dirname(model_dir))
+        try:
+            ORTModelForSpeechSeq2Seq.from_pretrained(model_id, export=True).save_pretrained(staging)
+            AutoProcessor.from_pretrained(model_id).save_pretrained(staging)
+            if quantize:
+                from onnxruntime.quantization import QuantType, quantize_dynamic
+                for name in os.listdir(staging):
+                    if name.endswith('.onnx'):
+                        path = os.path.join(staging, name)
+                        quantize_dynamic(path, path + '.int8', weight_type=QuantType.QInt8)
+                        os.replace(path + '.int8', path)
+            os.replace(staging, model_dir)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+    
+    def transcribe(self, audio: np.ndarray, language: Optional[str] = None, **_options):
+        generate_kwargs = {'task': 'transcribe'}
+        if language:
+            generate_kwargs['language'] = language
+        result = self._pipeline(
+            {'raw': audio, 'sampling_rate': _WHISPER_SAMPLE_RATE},
+            generate_kwargs=generate_kwargs,
+        )
+        return [SimpleNamespace(text=result['text'])], SimpleNamespace(language=language)
+
+
+def _run_transcription(model, audio: np.ndarray, options: Dict[str, Any]) -> tuple[str, str]:
+    """Run a faster-whisper model (or batched pipeline) over audio and return (text, language)."""
+    segments, info = model.transcribe(audio, **options)
+    # Segments are produced lazily; joining them runs the decoder
+    transcript = "".join(segment.text for segment in segments)
+    return transcript, info.language or "unknown"
+
+
+def _run_clip_batch(model: WhisperModel, clips: List[np.ndarray], beam_size: int) -> List[tuple[str, str]]:
+    """
+    Transcribe clips of at most one Whisper window each with a single encoder call and
+    a single decoder call for the whole batch; returns (text, language) per clip.
+    """
+    extractor = model.feature_extractor
+    n_frames = extractor.nb_max_frames
+    features = np.stack([pad_or_trim(extractor(clip)[..., :n_frames], n_frames) for clip in clips])
+    encoder_output = model.encode(features)
+    
+    multilingual = model.model.is_multilingual
+    if multilingual:
+        # Best language token per clip, e.g. '<|en|>' -> 'en'
+        languages = [result[0][0][2:-2] for result in model.model.detect_language(encoder_output)]
+    else:
+        languages = ['en'] * len(clips)
+    
+    tokenizers = [
+        Tokenizer(model.hf_tokenizer, multilingual, task='transcribe', language=language)
+        for language in languages
+    ]
+    prompts = [model.get_prompt(tokenizer, [], without_timestamps=True) for tokenizer in tokenizers]
+    outputs = model.model.generate(encoder_output, prompts, beam_size=beam_size, max_length=model.max_length)
+    return [
+        (tokenizer.decode(output.sequences_ids[0]), language)
+        for tokenizer, output, language in zip(tokenizers, outputs, languages)
+    ]
+
+
+def _transcriber_main(model_kwargs: Dict[str, Any], gpu_features: bool, jobs, results):
+    """Entry point of the transcriber process: load the model once, then serve jobs until None arrives."""
+    model = WhisperModel(**model_kwargs)
+    if gpu_features:
+        _enable_gpu_features(model, model_kwargs['device'])
+    pipeline = None
+    for job in iter(jobs.get, None):
+        shm_name, n_samples, options = job
+        shm = shared_memory.SharedMemory(name=shm_name)
+        try:
+            audio = np.ndarray((n_samples,), dtype=np.float32, buffer=shm.buf)
+            target = model
+            if 'batch_size' in options:
+                pipeline = pipeline or BatchedInferencePipeline(model=model)
+                target = pipeline
+            text, language = _run_transcription(target, audio, options)
+            results.put((text, language, None))
+        except Exception as e:
+            results.put(("", "unknown", str(e)))
+        finally:
+            audio = None
+            shm.close()
+
+
+# Processing scripts imported by a script worker process, keyed by absolute path.
+# Only populated inside those processes (see _script_worker_main).
+_SCRIPT_MODULE_CACHE: Dict[str, ModuleType] = {}
+
+
+def _load_script_module(script_path: str) -> ModuleType:
+    """Import a processing script by path, reusing the module on later calls."""
+    module = _SCRIPT_MODULE_CACHE.get(script_path)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(os.path.splitext(os.path.basename(script_path))[0], script_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _SCRIPT_MODULE_CACHE[script_path] = module
+    return module
+
+
+def _script_worker_main(jobs, results):
+    """
+    Entry point of a script worker process: run (script path, input, cwd) jobs until None arrives.
+    
+    Scripts load their openai-whisper model inside main(); whisper.load_model is
+    memoized here so the model stays in memory between calls instead of being
+    reloaded for every video.
+    """
+    if importlib.util.find_spec('whisper') is not None:
+        import whisper
+        whisper.load_model = lru_cache(maxsize=4)(whisper.load_model)
+    
+    for script_path, input_data, cwd in iter(jobs.get, None):
+        error = None
+        return_value = None
+        try:
+            os.chdir(cwd)
+            module = _load_script_module(script_path)
+            # Scripts whose main() takes the input get it directly; CLI-style
+            # scripts read it from sys.argv as when run from a shell
+            takes_input = bool(inspect.signature(module.main).parameters)
+            sys.argv = [script_path] + ([input_data] if input_data and not takes_input else [])
+            return_value = module.main(input_data) if takes_input else module.main()
+        except SystemExit as e:
+            if e.code not in (None, 0):
+                error = f"{os.path.basename(script_path)} exited with status {e.code}"
+        except BaseException as e:
+            error = f"{type(e).__name__}: {e}"
+        try:
+            pickle.dumps(return_value)
+        except Exception:
+            # Only picklable results can be sent back
+            return_value = repr(return_value)
+        results.put((error, return_value))
+
+
+class _TranscriberWorker:
+    """
+    Keeps the Whisper model in a separate process so downloads and decoding in this
+    process overlap with inference. Audio is handed over through shared memory.
+    """
+    
+    # How often a waiting caller checks that the worker process is still alive
+    POLL_INTERVAL = 1.0
+    
+    def __init__(self, model_kwargs: Dict[str, Any], gpu_features: bool = False):
+        self._ctx = multiprocessing.get_context('spawn')
+        self._model_kwargs = model_kwargs
+        self._gpu_features = gpu_features
+        # One job in flight at a time keeps results paired with their requests
+        self._lock = threading.Lock()
+        self._start()
+    
+    def _start(self):
+        """Start a worker process with fresh queues."""
+        self._jobs = self._ctx.Queue()
+        self._results = self._ctx.Queue()
+        self._process = self._ctx.Process(
+            target=_transcriber_main,
+            args=(self._model_kwargs, self._gpu_features, self._jobs, self._results),
+            daemon=True
+        )
+        self._process.start()
+    
+    def _wait_result(self) -> tuple[str, str, Optional[str]]:
+        """Wait for the current job's result; restart the worker and raise if it died."""
+        while True:
+            try:
+                return self._results.get(timeout=self.POLL_INTERVAL)
+            except queue.Empty:
+                if self._process.is_alive():
+                    continue
+            # The worker crashed (CUDA OOM, segfault, killed by the OS); its queues may be
+            # left in a broken state, so replace the process and queues for later callers
+            exitcode = self._process.exitcode
+            self._start()
+            raise RuntimeError(f"Transcriber process exited unexpectedly (exit code {exitcode})")
+    
+    def transcribe(self, audio: np.ndarray, **options) -> tuple[str, str]:
+        """Transcribe a 16 kHz mono float32 array in the worker process."""
+        audio = np.ascontiguousarray(audio, dtype=np.float32)
+        shm = shared_memory.SharedMemory(create=True, size=max(audio.nbytes, 1))
+        try:
+            np.ndarray(audio.shape, dtype=np.float32, buffer=shm.buf)[:] = audio
+            with self._lock:
+                self._jobs.put((shm.name, audio.shape[0], options))
+                text, language, error = self._wait_result()
+        finally:
+            shm.close()
+            shm.unlink()
+        if error:
+            raise RuntimeError(error)
+        return text, language
+    
+    def close(self):
+        """Stop the worker process."""
+        self._jobs.put(None)
+        self._process.join(timeout=10)
+
+
+class _ScriptWorker:
+    """
+    Long-lived process that runs the external processing scripts in-process for
+    itself, so each script is imported once and its Whisper model stays loaded
+    between calls. The scripts' logging setup, sys.exit() calls, crashes and
+    hangs stay out of the data source process.
+    """
+    
+    # How often a waiting caller checks that the worker process is still alive
+    POLL_INTERVAL = 1.0
+    
+    def __init__(self):
+        self._ctx = multiprocessing.get_context('spawn')
+        self._start()
+    
+    def _start(self):
+        """Start a worker process with fresh queues."""
+        self._jobs = self._ctx.Queue()
+        self._results = self._ctx.Queue()
+        self._process = self._ctx.Process(target=_script_worker_main, args=(self._jobs, self._results), daemon=True)
+        self._process.start()
+    
+    def run(self, script_path: str, input_data: str, timeout: Optional[float] = None) -> Any:
+        """Run a script's main() in the worker and return its result; raises on failure or timeout."""
+        self._jobs.put((script_path, input_data, os.getcwd()))
+        deadline = time.monotonic() + timeout if timeout else None
+        while True:
+            try:
+                error, return_value = self._results.get(timeout=self.POLL_INTERVAL)
+                break
+            except queue.Empty:
+                pass
+            if not self._process.is_alive():
+                exitcode = self._process.exitcode
+                self._start()
+                raise RuntimeError(f"{os.path.basename(script_path)} crashed its worker process (exit code {exitcode})")
+            if deadline is not None and time.monotonic() >= deadline:
+                # The script is stuck; its process (and everything it loaded) is replaced
+                self._process.terminate()
+                self._process.join(timeout=10)
+                self._start()
+                raise TimeoutError(f"{os.path.basename(script_path)} did not finish within {timeout} seconds")
+        if error:
+            raise RuntimeError(error)
+        return return_value
+    
+    def close(self):
+        """Stop the worker process."""
+        self._jobs.put(None)
+        self._process.join(timeout=10)
+
+
+# Static parts of the connection data, built once at import time instead of per
+# get_connection_data() call. Treat them as read-only: they are shared by every call.
+_CONNECTION_FORM = {
+    'input_type': {
+        'type': 'select',
+        'label': 'Input Type',
+        'required': True,
+        'options': [
+            {'value': 'single_url', 'label': 'Single YouTube URL'},
+            {'value': 'url_list_file', 'label': 'File with YouTube URLs (Batch Processing)'},
+            {'value': 'search_query', 'label': 'YouTube Search Query'},
+            {'value': 'hardcoded_list', 'label': 'Predefined URL List'}
+        ],
+        'default': 'single_url',
+        'description': 'Choose how you want to provide YouTube content to process'
+    },
+    
+    'processing_mode': {
+        'type': 'select',
+        'label': 'Processing Mode',
+        'required': True,
+        'options': [
+            {'value': 'audio_only', 'label': 'Audio Download Only', 'script': 'youtube_download_audio.py'},
+            {'value': 'transcription_english', 'label': 'Transcription + Summary (English)', 'script': 'youtube_extractor_english.py'},
+            {'value': 'transcription_spanish', 'label': 'Transcription + Summary (Spanish)', 'script': 'youtube_extractor_spanish.py'},
+            {'value': 'transcription_auto', 'label': 'Transcription + Summary (Auto Language)', 'script': 'youtube_text_extract.py'},
+            {'value': 'transcription_improved', 'label': 'Enhanced Multi-language + Translation', 'script': 'youtube_text_extract_improved.py'},
+            {'value': 'context_generation', 'label': 'BrainBoost Context Files', 'script': 'youtube_to_context.py'},
+            {'value': 'body_language', 'label': 'Body Language Analysis', 'script': 'youtube_bodylanguage_extractor.py'},
+            {'value': 'body_language_live', 'label': 'Real-time Body Language Analysis', 'script': 'youtube_bodylanguage_extractor_1.py'},
+            {'value': 'search_summary', 'label': 'Search Results Summary', 'script': 'youtube_summary.py'},
+            {'value': 'custom_class', 'label': 'Use SubjectiveYouTubeDataSource Class', 'script': 'SubjectiveYouTubeDataSource.py'}
+        ],
+        'default': 'context_generation',
+        'description': 'Select the type of processing you want to perform'
+    },
+    
+    'input_data': {
+        'type': 'textarea',
+        'label': 'Input Data',
+        'required': True,
+        'placeholder': 'Enter YouTube URL, search query, or file path...',
+        'description': 'Provide the input based on your selected input type',
+        'validation': {
+            'single_url': _YOUTUBE_URL_PATTERN,
+            'search_query': r'.{3,}',  # At least 3 characters
+            'url_list_file': r'.*\.txt$',  # File path ending in .txt
+        }
+    },
+    
+    'whisper_model': {
+        'type': 'select',
+        'label': 'Whisper Model Size',
+        'required': False,
+        'options': [
+            {'value': 'tiny', 'label': 'Tiny (fastest, least accurate)'},
+            {'value': 'base', 'label': 'Base (balanced)'},
+            {'value': 'small', 'label': 'Small (good accuracy)'},
+            {'value': 'medium', 'label': 'Medium (better accuracy)'},
+            {'value': 'large', 'label': 'Large (best accuracy, slowest)'}
+        ],
+        'default': 'base',
+        'description': 'Select Whisper model size for transcription (applicable to transcription modes)',
+        'show_when': ['transcription_english', 'transcription_spanish', 'transcription_auto', 'transcription_improved', 'context_generation', 'custom_class']
+    },
+    
+    'batch_options': {
+        'type': 'group',
+        'label': 'Batch Processing Options',
+        'show_when': ['url_list_file'],
+        'fields': {
+            'batch_size': {
+                'type': 'number',
+                'label': 'Batch Size',
+                'default': 10,
+                'min': 1,
+                'max': 50,
+                'description': 'Number of videos to process in each batch'
+            },
+            'start_index': {
+                'type': 'number',
+                'label': 'Start Index',
+                'default': 0,
+                'min': 0,
+                'description': 'Index to start processing from (for resume capability)'
+            },
+            'interactive_mode': {
+                'type': 'checkbox',
+                'label': 'Interactive Mode',
+                'default': True,
+                'description': 'Enable progress bars and interactive feedback'
+            },
+            'continue_on_error': {
+                'type': 'checkbox',
+                'label': 'Continue on Error',
+                'default': True,
+                'description': 'Continue processing even if some videos fail'
+            },
+            'max_concurrent': {
+                'type': 'number',
+                'label': 'Concurrent Videos',
+                'default': 1,
+                'min': 1,
+                'max': 8,
+                'description': 'Number of videos downloaded and transcribed at the same time'
+            }
+        }
+    },
+    
+    'search_options': {
+        'type': 'group',
+        'label': 'Search Options',
+        'show_when': ['search_summary'],
+        'fields': {
+            'max_results': {
+                'type': 'number',
+                'label': 'Maximum Results',
+                'default': 10,
+                'min': 1,
+                'max': 50,
+                'description': 'Maximum number of videos to process from search results'
+            }
+        }
+    },
+    
+    'output_options': {
+        'type': 'group',
+        'label': 'Output Options',
+        'fields': {
+            'output_format': {
+                'type': 'select',
+                'label': 'Output Format',
+                'options': [
+                    {'value': 'text', 'label': 'Text Files (.txt)'},
+                    {'value': 'json', 'label': 'JSON Files (.json)'},
+                    {'value': 'both', 'label': 'Both Text and JSON'}
+                ],
+                'default': 'json',
+                'description': 'Choose output file format'
+            },
+            'include_metadata': {
+                'type': 'checkbox',
+                'label': 'Include Video Metadata',
+                'default': True,
+                'description': 'Include video title, duration, views, etc. in output'
+            },
+            'clean_urls_first': {
+                'type': 'checkbox',
+                'label': 'Clean URLs Before Processing',
+                'default': True,
+                'description': 'Test and filter URLs before processing (recommended for batch)',
+                'show_when': ['url_list_file']
+            },
+            'convert_live_urls': {
+                'type': 'checkbox',
+                'label': 'Convert Live URLs to Video URLs',
+                'default': True,
+                'description': 'Automatically convert live stream URLs to video URLs',
+                'show_when': ['url_list_file']
+            }
+        }
+    },
+    
+    'advanced_options': {
+        'type': 'group',
+        'label': 'Advanced Options',
+        'collapsed': True,
+        'fields': {
+            'audio_quality': {
+                'type': 'select',
+                'label': 'Audio Quality',
+                'options': [
+                    {'value': '128', 'label': '128 kbps (lower quality, faster)'},
+                    {'value': '192', 'label': '192 kbps (balanced)'},
+                    {'value': '256', 'label': '256 kbps (higher quality)'},
+                    {'value': '320', 'label': '320 kbps (highest quality)'}
+                ],
+                'default': '192',
+                'description': 'Audio quality for downloaded files'
+            },
+            'whisper_compute_type': {
+                'type': 'select',
+                'label': 'Whisper Compute Type',
+                'options': [
+                    {'value': '', 'label': 'Auto (FP16 on GPU, INT8 on CPU)'},
+                    {'value': 'float16', 'label': 'FP16 (GPU, full accuracy, fast)'},
+                    {'value': 'int8_float16', 'label': 'INT8 weights + FP16 (GPU, less memory)'},
+                    {'value': 'int8_float32', 'label': 'INT8 weights + FP32 (CPU with VNNI)'},
+                    {'value': 'int8', 'label': 'INT8 (fastest on CPU, slight accuracy loss)'},
+                    {'value': 'float32', 'label': 'FP32 (reference accuracy, slowest)'}
+                ],
+                'default': '',
+                'description': 'Numeric precision used by the Whisper backend; lower precision trades a little accuracy for speed and memory'
+            },
+            'vad_filter': {
+                'type': 'checkbox',
+                'label': 'Skip Silence (VAD)',
+                'default': True,
+                'description': 'Drop non-speech audio with Silero VAD before decoding; faster on interviews and avoids hallucinated text on silence'
+            },
+            'max_retries': {
+                'type': 'number',
+                'label': 'Maximum Retries',
+                'default': 3,
+                'min': 1,
+                'max': 10,
+                'description': 'Number of retry attempts for failed downloads'
+            },
+            'rpm': {
+                'type': 'number',
+                'label': 'Requests per Minute',
+                'default': 30,
+                'min': 1,
+                'max': 120,
+                'description': 'Maximum YouTube requests per minute; short bursts are allowed, so fast videos are not held back by a fixed delay'
+            }
+        }
+    }
+}
+
+_FEATURES_MAPPING = {
+    'single_url': {
+        'audio_only': {'script': 'youtube_download_audio.py', 'output': 'MP3 file'},
+        'transcription_english': {'script': 'youtube_extractor_english.py', 'output': 'Text file with English transcription + summary'},
+        'transcription_spanish': {'script': 'youtube_extractor_spanish.py', 'output': 'Text file with Spanish transcription + summary'},
+        'transcription_auto': {'script': 'youtube_text_extract.py', 'output': 'Text file with auto-language transcription + summary'},
+        'transcription_improved': {'script': 'youtube_text_extract_improved.py', 'output': 'Text file with enhanced multi-language processing'},
+        'context_generation': {'script': 'youtube_to_context.py', 'output': 'JSON context files for BrainBoost'},
+        'body_language': {'script': 'youtube_bodylanguage_extractor.py', 'output': 'Video analysis + body language report'},
+        'body_language_live': {'script': 'youtube_bodylanguage_extractor_1.py', 'output': 'Real-time body language analysis'},
+        'custom_class': {'script': 'SubjectiveYouTubeDataSource.py', 'output': 'Structured data via Python class'}
+    },
+    'url_list_file': {
+        'context_generation': {'script': 'process_youtube_batch.py + youtube_to_context.py', 'output': 'Multiple JSON context files'},
+        'custom_class': {'script': 'SubjectiveYouTubeDataSource.py', 'output': 'Batch processing via Python class'}
+    },
+    'search_query': {
+        'search_summary': {'script': 'youtube_summary.py', 'output': 'Combined summary of search results'}
+    },
+    'hardcoded_list': {
+        'transcription_dual': {'script': 'youtube_batch_interviews.py', 'output': 'Both Spanish and English processing'}
+    }
+}
+
+# Processing mode -> external script for single URLs ('custom_class' runs in this class)
+# batch_options the concurrent URL-list path (max_concurrent > 1) applies; it rejects
+# any other option that is not left at its form default
+_PARALLEL_BATCH_OPTIONS = ('continue_on_error', 'interactive_mode')
+
+_SINGLE_URL_SCRIPTS = {
+    'audio_only': 'youtube_download_audio.py',
+    'transcription_english': 'youtube_extractor_english.py',
+    'transcription_spanish': 'youtube_extractor_spanish.py',
+    'transcription_auto': 'youtube_text_extract.py',
+    'transcription_improved': 'youtube_text_extract_improved.py',
+    'context_generation': 'youtube_to_context.py',
+    'body_language': 'youtube_bodylanguage_extractor.py',
+    'body_language_live': 'youtube_bodylanguage_extractor_1.py'
+}
+
+_UTILITY_SCRIPTS = {
+    'clean_youtube_links.py': 'Test and filter YouTube URLs for accessibility',
+    'convert_live_to_video_urls.py': 'Convert live stream URLs to video URLs'
+}
+
+_CAPABILITIES = {
+    'supported_formats': ['youtube.com/watch', 'youtu.be', 'youtube.com/live', 'youtube.com/shorts'],
+    'languages_supported': ['Auto-detect', 'English', 'Spanish', 'Multi-language with translation'],
+    'output_formats': ['MP3', 'TXT', 'JSON', 'Video frames', 'Analysis reports'],
+    'batch_processing': True,
+    'real_time_analysis': True,
+    'search_integration': True,
+    'body_language_analysis': True,
+    'brainboost_integration': True
+}
+
+
+# Static part of get_connection_data(); only the connection status fields vary per call
+_CONNECTION_DATA_TEMPLATE = {
+    'service_name': 'YouTube Data Processor',
+    'service_url': 'https://www.youtube.com',
+    'description': 'Comprehensive YouTube content processing with multiple output formats and analysis options',
+    
+    # Connection form fields for user input
+    'connection_form': _CONNECTION_FORM,
+    
+    # Available features mapping
+    'features_mapping': _FEATURES_MAPPING,
+    
+    # Utility scripts information
+    'utility_scripts': _UTILITY_SCRIPTS,
+    
+    # Service capabilities
+    'capabilities': _CAPABILITIES,
+}
+
+
 class SubjectiveYouTubeDataSource(SubjectiveDataSource):
     """
     YouTube Data Source implementation that processes YouTube videos for transcription and analysis.
@@ -33,6 +845,27 @@ class SubjectiveYouTubeDataSource(SubjectiveDataSource):
     - Batch processing capabilities
     """
     
+    # Seconds a connection test result stays fresh, shared by all instances
+    CONNECTION_TEST_TTL = 60
+    # Seconds a script directory scan stays fresh, so scripts added while running show up
+    SCRIPT_SCAN_TTL = 30
+    # Downloaded files waiting for the transcriber in process_batch
+    PIPELINE_QUEUE_SIZE = 4
+    # Decoded audio chunks ffmpeg may run ahead of the model in _transcribe_audio
+    DECODE_AHEAD_CHUNKS = 2
+    _connection_test_cache: Optional[tuple] = None  # (monotonic time, checks dict, ISO timestamp)
+    # Installed dependencies and scripts do not change while the process runs
+    _dependencies_status_cache: Optional[Dict[str, bool]] = None
+    _script_availability_cache: Dict[str, tuple] = {}  # working directory -> (monotonic time, result)
+    _icon_svg: Optional[str] = None  # icon.svg contents, read on first get_icon()
+    # Connection form input_type -> handler method, called as handler(input_data, processing_mode, form_data)
+    _INPUT_HANDLERS = {
+        'single_url': '_process_single_url',
+        'url_list_file': '_process_url_list_file',
+        'search_query': '_process_search_query',
+        'hardcoded_list': '_process_hardcoded_list',
+    }
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         Initialize the YouTube data source.
@@ -48,32 +881,121 @@ class SubjectiveYouTubeDataSource(SubjectiveDataSource):
         # Configuration
         bb_config = BBConfig()
         self.config = config or bb_config.read_config()
+        
+        # Standard logger used as a level gate so disabled messages are never formatted
+        self._logger_gate = logging.getLogger("SubjectiveYouTube")
+        self._logger_gate.setLevel(self.config.get('log_level', logging.INFO))
+        
         self.whisper_model_size = self.config.get('whisper_model_size', 'base')
+        # 'faster-whisper', 'onnx' (ONNX Runtime via optimum), or 'openvino' to run an
+        # exported OpenVINO model (Intel CPU/iGPU/NPU)
+        self.whisper_backend = self.config.get('whisper_backend', 'faster-whisper')
+        self.openvino_model_dir = self.config.get('openvino_model_dir')
+        self.openvino_device = self.config.get('openvino_device', 'CPU')
         self.max_retries = self.config.get('max_retries', 3)
+        # Retry delay doubles from retry_base_delay seconds, plus up to retry_jitter of itself at random
+        self.retry_base_delay = self.config.get('retry_base_delay', 1.0)
+        self.retry_jitter = self.config.get('retry_jitter', 0.5)
         self.audio_quality = self.config.get('audio_quality', '192')
+        # Truncate video descriptions in metadata to this many characters (None = full text)
+        self.description_max_chars = self.config.get('description_max_chars')
+        self.device = self.config.get('whisper_device') or self._detect_device()
+        self.compute_type = self.config.get('whisper_compute_type') or self._resolve_compute_type(self.device)
+        self.whisper_warmup = self.config.get('whisper_warmup', self.device == 'cuda')
+        self.flash_attention = self.config.get('flash_attention', self._supports_flash_attention(self.device))
+        self.beam_size = self.config.get('beam_size', 1)
+        self.vad_filter = self.config.get('vad_filter', True)
+        self.vad_min_silence_ms = self.config.get('vad_min_silence_ms', 500)
+        # Seconds of audio decoded and transcribed at a time (0 = whole file)
+        self.stream_chunk_seconds = self.config.get('stream_chunk_seconds', 300)
+        # Run Whisper in a separate process fed through shared memory
+        self.use_transcriber_process = self.config.get('transcriber_process', False)
+        self._transcriber = None
+        # Compute log-mel features on the GPU with torch.stft when running on CUDA
+        self.gpu_features = self.config.get('gpu_features', True)
+        # Encode batches of videos no longer than one Whisper window together in process_batch
+        self.batch_short_clips = self.config.get('batch_short_clips', True)
+        # Concurrent transcribe() calls the shared model accepts (CTranslate2 num_workers)
+        self.whisper_num_workers = self.config.get('whisper_num_workers', 1)
+        # Keep the model loaded after process_batch; False frees it (and its GPU memory) once a batch ends
+        self.keep_loaded = self.config.get('keep_loaded', True)
+        # Seconds an external processing script may run before it is killed; None waits indefinitely
+        self.script_timeout = self.config.get('script_timeout')
+        # Script worker processes (see _ScriptWorker): up to script_workers scripts run at once,
+        # idle workers are kept with their imported scripts and loaded models
+        self.script_workers = max(1, self.config.get('script_workers', 2))
+        self._script_worker_slots = threading.BoundedSemaphore(self.script_workers)
+        self._idle_script_workers = queue.SimpleQueue()
+        
+        # Shared metadata extractor, built once so extractor setup is not paid per URL
+        self._ydl = YoutubeDL({
+            'quiet': True,
+            'skip_download': True,
+            'forcejson': True,
+            'extractor_retries': self.max_retries,
+        })
+        self.download_buffer_size = self.config.get('download_buffer_size', 1 << 16)
+        # Parallel fragment fetches for fragmented (DASH/HLS) formats
+        self.fragment_downloads = self.config.get('concurrent_fragment_downloads', 8)
+        # Lists playlist entries without resolving each video; built on first use
+        self._flat_ydl = None
+        # Per-thread pool of audio downloaders (see _get_audio_downloader)
+        self._ydl_local = threading.local()
+        
+        # Requests per minute against YouTube, shared by every worker thread
+        rpm = self.config.get('rpm', 30)
+        self._limiter = _TokenBucket(rpm, 60) if rpm else None
+        
+        # Persistent metadata cache keyed by video_id
+        self.cache_dir = os.path.expanduser(self.config.get('cache_dir', '~/.cache/sytds'))
+        self.metadata_cache_ttl = self.config.get('metadata_cache_ttl', 86400)
+        self.metadata_error_ttl = self.config.get('metadata_error_ttl', 600)
+        self._meta_cache = self._open_cache('metadata') if self.config.get('metadata_cache', True) else None
+        # Finished transcripts keyed by video_id and model, so re-runs skip download and inference;
+        # SUBJECTIVE_NO_TRANSCRIPT_CACHE=1 turns it off without touching the config
+        use_transcript_cache = (self.config.get('transcript_cache', True)
+                                and os.environ.get('SUBJECTIVE_NO_TRANSCRIPT_CACHE') != '1')
+        self._transcript_cache = self._open_cache('transcripts') if use_transcript_cache else None
+        self._model_fingerprint = self._transcription_fingerprint()
         
         # Internal state
         self.whisper_model = None
+        self._stats_lock = threading.Lock()
         self._stats = {
             'processed': 0,
             'successful': 0,
-            'failed': 0,
-            'total_duration': 0
+            'failed': 0
         }
+        # Durations of successfully processed videos; grown by doubling, first _n_durations valid
+        self._durations = np.empty(1024, dtype=np.float32)
+        self._n_durations = 0
         
-        self._log_info(f"Initialized SubjectiveYouTubeDataSource with Whisper model: {self.whisper_model_size}")
+        self._log_info("Initialized SubjectiveYouTubeDataSource with Whisper model: %s", self.whisper_model_size)
     
-    def _log_info(self, message: str):
+    def _open_cache(self, table: str) -> Optional[_SQLiteCache]:
+        """Open a table in the on-disk cache, or return None when the cache is unusable."""
+        try:
+            return _SQLiteCache(os.path.join(self.cache_dir, 'cache.sqlite3'), table)
+        except (OSError, sqlite3.Error) as e:
+            self._log_warning("Disabling %s cache: %s", table, e)
+            return None
+    
+    def _log(self, level: int, message: str, args: tuple):
+        """Format a %-style message only when its level is enabled, then hand it to BBLogger."""
+        if self._logger_gate.isEnabledFor(level):
+            self.logger.log(f"{logging.getLevelName(level)}: {message % args if args else message}")
+    
+    def _log_info(self, message: str, *args):
         """Helper method for info logging."""
-        self.logger.log(f"INFO: {message}")
+        self._log(logging.INFO, message, args)
     
-    def _log_warning(self, message: str):
+    def _log_warning(self, message: str, *args):
         """Helper method for warning logging."""
-        self.logger.log(f"WARNING: {message}")
+        self._log(logging.WARNING, message, args)
     
-    def _log_error(self, message: str):
+    def _log_error(self, message: str, *args):
         """Helper method for error logging."""
-        self.logger.log(f"ERROR: {message}")
+        self._log(logging.ERROR, message, args)
     
     def get_data_source_type(self) -> str:
         """Return the type identifier for this data source."""
@@ -100,66 +1022,157 @@ class SubjectiveYouTubeDataSource(SubjectiveDataSource):
         """
         if not isinstance(input_data, str):
             return False
-            
-        youtube_patterns = [
-            r'(?:https?://)?(?:www\.)?youtube\.com/watch\?v=[\w-]+',
-            r'(?:https?://)?(?:www\.)?youtu\.be/[\w-]+',
-            r'(?:https?://)?(?:www\.)?youtube\.com/live/[\w-]+',
-            r'(?:https?://)?(?:www\.)?youtube\.com/shorts/[\w-]+'
-        ]
-        
-        return any(re.match(pattern, input_data.strip()) for pattern in youtube_patterns)
+        # Cheap prefix test rejects non-YouTube input before the regex runs
+        if not input_data.lstrip().startswith(_YOUTUBE_PREFIXES):
+            return False
+        return _YOUTUBE_RE.match(input_data) is not None
     
-    def extract_metadata(self, source_input: str) -> Dict[str, Any]:
+    def extract_metadata(self, source_input: str, refresh: bool = False) -> Dict[str, Any]:
         """
         Extract metadata from a YouTube video.
         
         Args:
             source_input: YouTube URL
+            refresh: Skip the metadata cache and query YouTube again
             
         Returns:
             Dict containing video metadata
         """
-        try:
-            with YoutubeDL({'quiet': True, 'skip_download': True, 'forcejson': True}) as ydl:
-                info_dict = ydl.extract_info(source_input, download=False)
-                
-                # Parse upload date from YouTube format (YYYYMMDD) to ISO format
-                upload_date_str = info_dict.get('upload_date', '')
-                upload_date_iso = None
-                if upload_date_str and len(upload_date_str) == 8:
-                    try:
-                        year = upload_date_str[:4]
-                        month = upload_date_str[4:6]
-                        day = upload_date_str[6:8]
-                        upload_date_iso = f"{year}-{month}-{day}T12:00:00"
-                    except Exception as e:
-                        self._log_warning(f"Could not parse upload date '{upload_date_str}': {e}")
-                
-                metadata = {
-                    'video_id': info_dict.get('id', ''),
-                    'title': info_dict.get('title', 'Unknown_Video'),
-                    'duration': info_dict.get('duration', 0),
-                    'upload_date': upload_date_str,
-                    'upload_date_iso': upload_date_iso,
-                    'uploader': info_dict.get('uploader', 'Unknown'),
-                    'uploader_id': info_dict.get('uploader_id', ''),
-                    'view_count': info_dict.get('view_count', 0),
-                    'like_count': info_dict.get('like_count', 0),
-                    'description': info_dict.get('description', '')[:1000],  # First 1000 chars
-                    'tags': info_dict.get('tags', []),
-                    'categories': info_dict.get('categories', []),
-                    'url': source_input,
-                    'thumbnail': info_dict.get('thumbnail', ''),
-                    'language': info_dict.get('language', 'unknown')
-                }
-                
-                self._log_info(f"Extracted metadata for video: {metadata['title']}")
-                return metadata
-                
-        except Exception as e:
-            self._log_error(f"Error extracting metadata for {source_input}: {e}")
+        video_id = self._extract_video_id(source_input)
+        refresh = refresh or self.config.get('refresh_metadata', False)
+        if self._meta_cache is not None and video_id and not refresh:
+            cached = self._meta_cache.get(video_id)
+            if cached is not None:
+                if 'error' in cached:
+                    self._log_warning("Skipping %s, recently failed: %s", source_input, cached['error'])
+                    return {}
+                return {**cached, 'url': source_input}
+        
+        info_dict, _ = self._fetch_and_download(source_input, None)
+        if not info_dict:
             return {}
+        
+        metadata = self._build_metadata(info_dict, source_input)
+        self._cache_metadata(metadata)
+        
+        self._log_info("Extracted metadata for video: %s", metadata['title'])
+        return metadata
+    
+    def clear_metadata_cache(self):
+        """Drop every cached metadata entry, including remembered failures."""
+        if self._meta_cache is not None:
+            self._meta_cache.clear()
+            self._log_info("Cleared metadata cache")
+    
+    def _throttle(self):
+        """Wait for the shared rate limiter before issuing a YouTube request."""
+        if self._limiter is not None:
+            self._limiter.acquire()
+    
+    @staticmethod
+    def _extract_video_id(source_input: str) -> Optional[str]:
+        """Return the video id embedded in a YouTube URL, if any."""
+        match = _YOUTUBE_RE.match(source_input) if isinstance(source_input, str) else None
+        return match.group(1) if match else None
+    
+    def _cache_metadata(self, metadata: Dict[str, Any]):
+        """Store freshly extracted metadata in the on-disk cache."""
+        if self._meta_cache is not None and metadata.get('video_id'):
+            self._meta_cache.set(metadata['video_id'], metadata, expire=self.metadata_cache_ttl)
+    
+    def _transcription_fingerprint(self) -> str:
+        """
+        Hash of the settings that change transcription output, computed once per instance.
+        
+        Covers the backend, model, decoding and VAD options and the streaming chunk
+        length (chunks are prompted with the previous chunk's text); a model given
+        as a local path also contributes its modification time, so re-exported
+        weights miss the cache.
+        """
+        model = self.openvino_model_dir if self.whisper_backend == 'openvino' else self.whisper_model_size
+        parts = [self.whisper_backend, str(model), str(self.compute_type), str(self.beam_size), str(self.vad_filter),
+                 str(self.vad_min_silence_ms), str(self.stream_chunk_seconds)]
+        if model and os.path.exists(model):
+            parts.append(str(os.path.getmtime(model)))
+        return hashlib.sha256('\0'.join(parts).encode()).hexdigest()[:16]
+    
+    def _transcript_cache_key(self, video_id: str) -> str:
+        """Key of a video's transcript in the transcript cache."""
+        return f"{video_id}:{self._model_fingerprint}"
+    
+    def _get_cached_transcript(self, source_input: str) -> Optional[tuple[Dict[str, Any], str, str]]:
+        """Return (metadata, transcript, language) when a transcript is cached for this URL, else None."""
+        video_id = self._extract_video_id(source_input)
+        if self._transcript_cache is None or not video_id:
+            return None
+        try:
+            cached = self._transcript_cache.get(self._transcript_cache_key(video_id))
+        except (sqlite3.Error, ValueError) as e:
+            # A damaged entry only costs a re-transcription
+            self._log_warning("Ignoring unreadable cached transcript for %s: %s", video_id, e)
+            return None
+        if cached is None:
+            return None
+        # The metadata is stored with the transcript, so a hit doesn't depend on the metadata TTL;
+        # entries written before that fall back to the metadata cache
+        metadata = cached.get('metadata')
+        if metadata is None and self._meta_cache is not None:
+            metadata = self._meta_cache.get(video_id)
+        if metadata is None or 'error' in metadata:
+            return None
+        return {**metadata, 'url': source_input}, cached['text'], cached['language']
+    
+    def _cache_transcript(self, metadata: Dict[str, Any], transcript: str, language: str):
+        """Store a finished transcript in the on-disk cache."""
+        if self._transcript_cache is None or not metadata.get('video_id'):
+            return
+        try:
+            self._transcript_cache.set(
+                self._transcript_cache_key(metadata['video_id']),
+                {'text': transcript, 'language': language, 'model': self.whisper_model_size,
+                 'created': datetime.now().isoformat(),
+                 'metadata': {k: v for k, v in metadata.items() if k != 'url'}}
+            )
+        except sqlite3.Error as e:
+            self._log_warning("Could not cache transcript for %s: %s", metadata['video_id'], e)
+    
+    def _build_metadata(self, info_dict: Dict[str, Any], source_input: str) -> Dict[str, Any]:
+        """Build the metadata dictionary from a yt-dlp info dict."""
+        # Parse upload date from YouTube format (YYYYMMDD) to ISO format
+        upload_date_str = info_dict.get('upload_date', '')
+        upload_date_iso = None
+        if upload_date_str and len(upload_date_str) == 8:
+            try:
+                year = upload_date_str[:4]
+                month = upload_date_str[4:6]
+                day = upload_date_str[6:8]
+                upload_date_iso = f"{year}-{month}-{day}T12:00:00"
+            except Exception as e:
+                self._log_warning("Could not parse upload date '%s': %s", upload_date_str, e)
+        
+        # Take the description out of the info dict; it is only copied when a
+        # length limit is configured
+        description = info_dict.pop('description', None) or ''
+        if self.description_max_chars is not None:
+            description = description[:self.description_max_chars]
+        
+        return {
+            'video_id': info_dict.get('id', ''),
+            'title': info_dict.get('title', 'Unknown_Video'),
+            'duration': info_dict.get('duration', 0),
+            'upload_date': upload_date_str,
+            'upload_date_iso': upload_date_iso,
+            'uploader': info_dict.get('uploader', 'Unknown'),
+            'uploader_id': info_dict.get('uploader_id', ''),
+            'view_count': info_dict.get('view_count', 0),
+            'like_count': info_dict.get('like_count', 0),
+            'description': description,
+            'tags': info_dict.get('tags', []),
+            'categories': info_dict.get('categories', []),
+            'url': source_input,
+            'thumbnail': info_dict.get('thumbnail', ''),
+            'language': info_dict.get('language', 'unknown')
+        }
     
     def process_source(self, source_input: str) -> Dict[str, Any]:
         """
@@ -174,111 +1187,349 @@ class SubjectiveYouTubeDataSource(SubjectiveDataSource):
         if not self.validate_input(source_input):
             raise ValueError(f"Invalid YouTube URL: {source_input}")
         
-        self._log_info(f"Processing YouTube video: {source_input}")
+        self._log_info("Processing YouTube video: %s", source_input)
         start_time = time.time()
         
         try:
-            # Extract metadata
-            metadata = self.extract_metadata(source_input)
-            if not metadata:
-                raise Exception("Failed to extract video metadata")
+            cached = self._get_cached_transcript(source_input)
+            if cached is not None:
+                metadata, transcript, detected_language = cached
+                self._log_info("Using cached transcript for %s", source_input)
+                processed_data = self._build_processed_data(source_input, metadata, transcript, detected_language, start_time)
+                self._record_success(metadata)
+                return processed_data
             
-            # Load Whisper model
-            model = self._load_whisper_model()
+            # Load Whisper model (held by the worker process when one is used)
+            model = None if self.use_transcriber_process else self._load_whisper_model()
             
             # Process audio and transcription
             with tempfile.TemporaryDirectory() as temp_dir:
-                # Download audio
-                audio_file = self._download_audio(source_input, temp_dir)
-                if not audio_file:
-                    raise Exception("Failed to download audio")
-                
-                # Convert to WAV for better transcription
-                wav_path = os.path.join(temp_dir, "audio_mono.wav")
-                converted_audio = self._convert_to_mono_wav(audio_file, wav_path)
-                if not converted_audio:
-                    raise Exception("Failed to convert audio to WAV")
+                # Resolve metadata and download audio with one yt-dlp call
+                metadata, audio_file = self._prepare_source(source_input, temp_dir)
                 
                 # Transcribe audio
-                transcript, detected_language = self._transcribe_audio(converted_audio, model)
+                transcript, detected_language = self._transcribe_audio(audio_file, model)
                 if not transcript.strip():
                     raise Exception("No transcript was generated")
             
-            # Create processed data structure
-            processed_data = {
-                'source_url': source_input,
-                'metadata': metadata,
-                'transcription': {
-                    'text': transcript,
-                    'language': detected_language,
-                    'model_used': self.whisper_model_size,
-                    'transcription_time': datetime.now().isoformat()
-                },
-                'processing_info': {
-                    'processed_at': datetime.now().isoformat(),
-                    'processing_duration': time.time() - start_time,
-                    'data_source_type': self.get_data_source_type()
-                }
-            }
-            
-            # Update statistics
-            self._stats['processed'] += 1
-            self._stats['successful'] += 1
-            self._stats['total_duration'] += metadata.get('duration', 0)
-            
-            self._log_info(f"Successfully processed video: {metadata['title']}")
+            self._cache_transcript(metadata, transcript, detected_language)
+            processed_data = self._build_processed_data(source_input, metadata, transcript, detected_language, start_time)
+            self._record_success(metadata)
             return processed_data
             
         except Exception as e:
-            self._stats['processed'] += 1
-            self._stats['failed'] += 1
-            self._log_error(f"Error processing {source_input}: {e}")
+            self._record_failure(source_input, e)
             raise
     
-    def process_batch(self, source_inputs: List[str], **kwargs) -> List[Dict[str, Any]]:
+    def process_batch(self, source_inputs: Iterable[str], **kwargs) -> List[Dict[str, Any]]:
         """
         Process multiple YouTube videos in batch.
         
+        Downloads run on a background thread and hand finished audio files to the
+        transcriber through a bounded queue, so the network and the model work at
+        the same time and only a few downloaded files exist on disk at once.
+        
         Args:
-            source_inputs: List of YouTube URLs to process
-            **kwargs: Additional processing options
+            source_inputs: YouTube URLs to process; any iterable, read once
+            **kwargs: Additional processing options: batch_size (inference batch),
+                download_workers (concurrent downloads, default batch_size),
+                warm_up (load the model while downloads start, default True),
+                continue_on_error
             
         Returns:
-            List of processed data dictionaries
+            List of processed data dictionaries, in input order
         """
+        return self._run_batch(source_inputs, **kwargs)[0]
+    
+    def _run_batch(self, source_inputs: Iterable[str], **kwargs) -> tuple[List[Dict[str, Any]], List[Dict[str, str]]]:
+        """process_batch, also returning the failures as {'url', 'error'} dicts."""
         batch_size = kwargs.get('batch_size', 10)
+        download_workers = kwargs.get('download_workers') or batch_size
+        warm_up = kwargs.get('warm_up', True)
         continue_on_error = kwargs.get('continue_on_error', True)
         
-        self._log_info(f"Starting batch processing of {len(source_inputs)} YouTube videos")
-        
         results = []
         failed_urls = []
+        # Counted as videos arrive: the inputs (and expanded playlists) are read lazily
+        total = 0
+        reused = 0
+        
+        self._log_info("Starting batch processing of YouTube videos")
         
-        for i, url in enumerate(source_inputs, 1):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # Stage 1: on a background thread, read the inputs, answer videos transcribed on
+            # an earlier run from the cache, and fetch metadata and download audio for the rest
+            handoff = queue.Queue(maxsize=self.PIPELINE_QUEUE_SIZE)
+            stop = threading.Event()
+            downloader = threading.Thread(
+                target=self._download_stage,
+                args=(self._expand_playlists(source_inputs), temp_dir, download_workers, handoff, stop),
+                daemon=True,
+            )
+            downloader.start()
+            
+            # Bind the per-video steps once for the chosen backend so the loop
+            # below doesn't re-check the configuration for every video
+            if self.use_transcriber_process:
+                transcribe = partial(self._transcribe_audio, model=None, batch_size=batch_size)
+            elif warm_up:
+                # Load the model while the first downloads are in flight
+                transcribe = partial(self._transcribe_audio, model=self._batch_pipeline(), batch_size=batch_size)
+            else:
+                def transcribe(audio_file):
+                    # Load on the first long video, then rebind to the loaded pipeline
+                    nonlocal transcribe
+                    transcribe = partial(self._transcribe_audio, model=self._batch_pipeline(), batch_size=batch_size)
+                    return transcribe(audio_file)
+            is_short_clip = self._is_short_clip
+            iter_audio_chunks = self._iter_audio_chunks
+            cache_transcript = self._cache_transcript
+            build_processed_data = self._build_processed_data
+            record_success = self._record_success
+            
+            # Stage 2: transcribe each file as it arrives with batched inference.
+            # Results are (index, data) pairs: held-back short clips finish out of order
+            short_clips = []
+            stopped = False
             try:
-                self._log_info(f"Processing video {i}/{len(source_inputs)}: {url}")
-                result = self.process_source(url)
-                results.append(result)
-                
-                # Small delay to avoid rate limiting
-                if i < len(source_inputs):
-                    time.sleep(2)
-                    
-            except Exception as e:
-                failed_urls.append({'url': url, 'error': str(e)})
-                self._log_error(f"Failed to process video {i}: {url} - {e}")
+                while (item := handoff.get()) is not None:
+                    if isinstance(item, BaseException):
+                        raise item
+                    i, url, outcome = item
+                    total += 1
+                    start_time = time.time()
+                    if isinstance(outcome, _CachedTranscript):
+                        results.append((i, build_processed_data(url, outcome.metadata, outcome.transcript,
+                                                                outcome.language, start_time)))
+                        record_success(outcome.metadata)
+                        reused += 1
+                        continue
+                    try:
+                        self._log_info("Processing video %d: %s", i, url)
+                        if isinstance(outcome, BaseException):
+                            raise outcome
+                        metadata, audio_file = outcome
+                        
+                        if is_short_clip(metadata):
+                            # Held back and encoded together with other short videos
+                            clip = np.concatenate(list(iter_audio_chunks(audio_file)))
+                            short_clips.append((i, url, metadata, start_time, clip))
+                            if len(short_clips) >= batch_size:
+                                self._transcribe_short_clips(short_clips, results, failed_urls)
+                                short_clips = []
+                            continue
+                        
+                        transcript, detected_language = transcribe(audio_file)
+                        if not transcript.strip():
+                            raise Exception("No transcript was generated")
+                        
+                        cache_transcript(metadata, transcript, detected_language)
+                        results.append((i, build_processed_data(url, metadata, transcript, detected_language, start_time)))
+                        record_success(metadata)
+                        
+                    except Exception as e:
+                        self._record_failure(url, e)
+                        failed_urls.append({'url': url, 'error': str(e)})
+                        self._log_error("Failed to process video %d: %s - %s", i, url, e)
+                        
+                        if not continue_on_error:
+                            stopped = True
+                            break
+                    finally:
+                        if not isinstance(outcome, BaseException):
+                            shutil.rmtree(os.path.dirname(outcome[1]), ignore_errors=True)
                 
-                if not continue_on_error:
-                    break
+                # After an early stop the held-back clips are dropped like the unread inputs
+                if short_clips and not stopped:
+                    self._transcribe_short_clips(short_clips, results, failed_urls)
+            finally:
+                # Unblock the downloader if we stopped early, then wait for it
+                stop.set()
+                while downloader.is_alive():
+                    try:
+                        handoff.get(timeout=0.1)
+                    except queue.Empty:
+                        pass
+        
+        results = [data for _, data in sorted(results, key=lambda pair: pair[0])]
         
         # Log batch processing summary
+        if reused:
+            self._log_info("Reused %d cached transcripts", reused)
         success_count = len(results)
         failure_count = len(failed_urls)
-        success_rate = (success_count / len(source_inputs)) * 100 if source_inputs else 0
+        success_rate = (success_count / total) * 100 if total else 0
+        
+        self._log_info("Batch processing complete: %d successful, %d failed (%.1f%% success rate)", success_count, failure_count, success_rate)
         
-        self._log_info(f"Batch processing complete: {success_count} successful, {failure_count} failed ({success_rate:.1f}% success rate)")
+        if not self.keep_loaded:
+            self._release_whisper_model()
         
-        return results
+        return results, failed_urls
+    
+    def _batch_pipeline(self):
+        """Model wrapper used by process_batch: faster-whisper's batched pipeline when available."""
+        model = self._load_whisper_model()
+        # Other backends have no batched pipeline; their model is used directly
+        return BatchedInferencePipeline(model=model) if isinstance(model, WhisperModel) else model
+    
+    def _is_short_clip(self, metadata: Dict[str, Any]) -> bool:
+        """Whether process_batch should encode this video together with other short ones."""
+        duration = metadata.get('duration') or 0
+        return (self.batch_short_clips and not self.use_transcriber_process
+                and self.whisper_backend == 'faster-whisper'
+                and 0 < duration <= _WHISPER_WINDOW_SECONDS)
+    
+    def _transcribe_short_clips(self, clips: List[tuple], results: List[tuple],
+                                failed_urls: List[Dict[str, str]]):
+        """Transcribe (index, url, metadata, start_time, audio) clips in one batch and record each outcome as (index, data)."""
+        self._log_info("Transcribing %d short videos in one batch", len(clips))
+        model = self._load_whisper_model()
+        try:
+            outputs = _run_clip_batch(model, [clip[4] for clip in clips], self.beam_size)
+        except Exception as e:
+            # The batch path relies on lower-level faster-whisper APIs; fall back to the
+            # regular per-clip transcription rather than failing the whole group
+            self._log_error("Batched transcription of short videos failed, transcribing them one by one: %s", e)
+            outputs = [self._transcribe_clip(model, clip[4]) for clip in clips]
+        
+        for (i, url, metadata, start_time, _), outcome in zip(clips, outputs):
+            if isinstance(outcome, Exception):
+                self._record_failure(url, outcome)
+                failed_urls.append({'url': url, 'error': str(outcome)})
+                continue
+            transcript, detected_language = outcome
+            if not transcript.strip():
+                error = Exception("No transcript was generated")
+                self._record_failure(url, error)
+                failed_urls.append({'url': url, 'error': str(error)})
+                continue
+            self._cache_transcript(metadata, transcript, detected_language)
+            results.append((i, self._build_processed_data(url, metadata, transcript, detected_language, start_time)))
+            self._record_success(metadata)
+    
+    def _transcribe_clip(self, model: WhisperModel, audio: np.ndarray):
+        """Transcribe one in-memory clip; returns (text, language), or the exception raised."""
+        options = {
+            'beam_size': self.beam_size,
+            'vad_filter': self.vad_filter,
+            'vad_parameters': {'min_silence_duration_ms': self.vad_min_silence_ms},
+        }
+        try:
+            return _run_transcription(model, audio, options)
+        except Exception as e:
+            return e
+    
+    def _download_stage(self, source_inputs: Iterable[str], temp_dir: str, max_workers: int,
+                        handoff: queue.Queue, stop: threading.Event):
+        """
+        Producer for process_batch: read source_inputs lazily, run _prepare_source on
+        a thread pool and put (index, url, outcome) on handoff in input order,
+        followed by None.
+        
+        outcome is a _CachedTranscript for videos already in the transcript cache
+        (nothing is downloaded), otherwise a (metadata, audio_file) tuple or the
+        exception raised for that URL. At most max_workers URLs are in flight ahead
+        of the queue.
+        """
+        max_workers = max(1, max_workers)
+        pending = deque()
+        input_error = None
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            try:
+                try:
+                    for i, url in enumerate(source_inputs, 1):
+                        cached = self._get_cached_transcript(url)
+                        if cached is not None:
+                            future = Future()
+                            future.set_result(_CachedTranscript(*cached))
+                        else:
+                            future = pool.submit(self._prepare_source, url, tempfile.mkdtemp(dir=temp_dir))
+                        pending.append((i, url, future))
+                        if len(pending) < max_workers:
+                            continue
+                        if not self._hand_off(pending.popleft(), handoff, stop):
+                            return
+                except Exception as e:
+                    # Reading the inputs failed (e.g. the URL file); finish what was
+                    # started, then let process_batch raise it
+                    input_error = e
+                while pending:
+                    if not self._hand_off(pending.popleft(), handoff, stop):
+                        return
+                if input_error is not None:
+                    handoff.put(input_error)
+            finally:
+                for _, _, future in pending:
+                    future.cancel()
+                handoff.put(None)
+    
+    @staticmethod
+    def _hand_off(entry: tuple, handoff: queue.Queue, stop: threading.Event) -> bool:
+        """Wait for one download and queue its outcome; False once the consumer has stopped."""
+        i, url, future = entry
+        try:
+            outcome = future.result()
+        except Exception as e:
+            outcome = e
+        if stop.is_set():
+            return False
+        handoff.put((i, url, outcome))
+        return True
+    
+    def _prepare_source(self, source_input: str, download_path: str) -> tuple[Dict[str, Any], str]:
+        """Validate a URL and download its audio, deriving metadata from the same yt-dlp call."""
+        if not self.validate_input(source_input):
+            raise ValueError(f"Invalid YouTube URL: {source_input}")
+        
+        info_dict, audio_file = self._fetch_and_download(source_input, download_path)
+        if not info_dict:
+            raise Exception("Failed to extract video metadata")
+        if not audio_file:
+            raise Exception("Failed to download audio")
+        
+        metadata = self._build_metadata(info_dict, source_input)
+        self._cache_metadata(metadata)
+        return metadata, audio_file
+    
+    def _build_processed_data(self, source_input: str, metadata: Dict[str, Any], transcript: str,
+                              detected_language: str, start_time: float) -> Dict[str, Any]:
+        """Create the processed data structure for a transcribed video."""
+        now_iso = datetime.now().isoformat()
+        return {
+            'source_url': source_input,
+            'metadata': metadata,
+            'transcription': {
+                'text': transcript,
+                'language': detected_language,
+                'model_used': self.whisper_model_size,
+                'transcription_time': now_iso
+            },
+            'processing_info': {
+                'processed_at': now_iso,
+                'processing_duration': time.time() - start_time,
+                'data_source_type': self.get_data_source_type()
+            }
+        }
+    
+    def _record_success(self, metadata: Dict[str, Any]):
+        """Update statistics after a video was processed successfully."""
+        with self._stats_lock:
+            self._stats['processed'] += 1
+            self._stats['successful'] += 1
+            if self._n_durations == len(self._durations):
+                self._durations = np.resize(self._durations, 2 * len(self._durations))
+            self._durations[self._n_durations] = metadata.get('duration') or 0
+            self._n_durations += 1
+        
+        self._log_info("Successfully processed video: %s", metadata['title'])
+    
+    def _record_failure(self, source_input: str, error: Exception):
+        """Update statistics after a video failed to process."""
+        with self._stats_lock:
+            self._stats['processed'] += 1
+            self._stats['failed'] += 1
+        self._log_error("Error processing %s: %s", source_input, error)
     
     def get_processing_stats(self) -> Dict[str, Any]:
         """
@@ -287,22 +1538,43 @@ class SubjectiveYouTubeDataSource(SubjectiveDataSource):
         Returns:
             Dict containing processing statistics
         """
+        with self._stats_lock:
+            durations = self._durations[:self._n_durations].copy()
+        if durations.size:
+            median, p95 = np.quantile(durations, [0.5, 0.95])
+        else:
+            median = p95 = 0.0
         return {
             'total_processed': self._stats['processed'],
             'successful': self._stats['successful'],
             'failed': self._stats['failed'],
             'success_rate': (self._stats['successful'] / max(self._stats['processed'], 1)) * 100,
-            'total_video_duration': self._stats['total_duration'],
-            'average_duration': self._stats['total_duration'] / max(self._stats['successful'], 1),
+            'total_video_duration': float(durations.sum(dtype=np.float64)),
+            'average_duration': float(durations.mean()) if durations.size else 0.0,
+            'median_duration': float(median),
+            'p95_duration': float(p95),
             'data_source_type': self.get_data_source_type()
         }
     
-    def cleanup(self):
-        """Clean up resources used by the data source."""
-        if self.whisper_model is not None:
-            # Whisper models don't need explicit cleanup, but we can clear the reference
+    def cleanup(self, force: bool = False):
+        """
+        Clean up resources used by the data source.
+        
+        The Whisper model stays resident so later process_source/process_batch
+        calls skip the model load and kernel warm-up; pass force=True to drop this
+        instance's reference. The process-wide model cache is left intact so other
+        instances keep reusing the loaded model.
+        """
+        if self.whisper_model is not None and force:
             self.whisper_model = None
             self._log_info("Cleaned up Whisper model")
+        if self._transcriber is not None and force:
+            self._transcriber.close()
+            self._transcriber = None
+            self._log_info("Stopped Whisper transcriber process")
+        if force:
+            while not self._idle_script_workers.empty():
+                self._idle_script_workers.get().close()
     
     # Abstract methods from SubjectiveDataSource that must be implemented
     
@@ -328,6 +1600,11 @@ class SubjectiveYouTubeDataSource(SubjectiveDataSource):
             },
             'configuration': {
                 'whisper_model_size': self.whisper_model_size,
+                'whisper_device': self.device,
+                'whisper_compute_type': self.compute_type,
+                'beam_size': self.beam_size,
+                'vad_filter': self.vad_filter,
+                'vad_min_silence_ms': self.vad_min_silence_ms,
                 'max_retries': self.max_retries,
                 'audio_quality': self.audio_quality
             },
@@ -335,265 +1612,41 @@ class SubjectiveYouTubeDataSource(SubjectiveDataSource):
             'status': 'ready'
         }
     
-    def get_connection_data(self) -> Dict[str, Any]:
+    def get_connection_data(self, deep_check: bool = False) -> Dict[str, Any]:
         """
         Get connection data for the YouTube data source.
         
         Returns a comprehensive connection form that covers all available YouTube processing features.
         This allows users to select the appropriate processing mode based on their input type and needs.
         
+        Args:
+            deep_check: Also run the slow health diagnostics (a yt-dlp extraction and
+                `ffmpeg -version`); meant for troubleshooting, not UI rendering
+        
         Returns:
             Dict containing connection form configuration with all available features
         """
         # Test YouTube service availability
-        test_connection = self._test_youtube_connection()
+        checks, last_tested = self._get_connection_test(deep_check)
+        if not checks['network']:
+            connection_status = 'disconnected'
+        elif checks['extractor'] is False:
+            # YouTube is reachable but yt-dlp cannot extract from it
+            connection_status = 'degraded'
+        else:
+            connection_status = 'connected'
         
         return {
-            'service_name': 'YouTube Data Processor',
-            'service_url': 'https://www.youtube.com',
-            'connection_status': 'connected' if test_connection else 'disconnected',
-            'last_tested': datetime.now().isoformat(),
-            'description': 'Comprehensive YouTube content processing with multiple output formats and analysis options',
-            
-            # Connection form fields for user input
-            'connection_form': {
-                'input_type': {
-                    'type': 'select',
-                    'label': 'Input Type',
-                    'required': True,
-                    'options': [
-                        {'value': 'single_url', 'label': 'Single YouTube URL'},
-                        {'value': 'url_list_file', 'label': 'File with YouTube URLs (Batch Processing)'},
-                        {'value': 'search_query', 'label': 'YouTube Search Query'},
-                        {'value': 'hardcoded_list', 'label': 'Predefined URL List'}
-                    ],
-                    'default': 'single_url',
-                    'description': 'Choose how you want to provide YouTube content to process'
-                },
-                
-                'processing_mode': {
-                    'type': 'select',
-                    'label': 'Processing Mode',
-                    'required': True,
-                    'options': [
-                        {'value': 'audio_only', 'label': 'Audio Download Only', 'script': 'youtube_download_audio.py'},
-                        {'value': 'transcription_english', 'label': 'Transcription + Summary (English)', 'script': 'youtube_extractor_english.py'},
-                        {'value': 'transcription_spanish', 'label': 'Transcription + Summary (Spanish)', 'script': 'youtube_extractor_spanish.py'},
-                        {'value': 'transcription_auto', 'label': 'Transcription + Summary (Auto Language)', 'script': 'youtube_text_extract.py'},
-                        {'value': 'transcription_improved', 'label': 'Enhanced Multi-language + Translation', 'script': 'youtube_text_extract_improved.py'},
-                        {'value': 'context_generation', 'label': 'BrainBoost Context Files', 'script': 'youtube_to_context.py'},
-                        {'value': 'body_language', 'label': 'Body Language Analysis', 'script': 'youtube_bodylanguage_extractor.py'},
-                        {'value': 'body_language_live', 'label': 'Real-time Body Language Analysis', 'script': 'youtube_bodylanguage_extractor_1.py'},
-                        {'value': 'search_summary', 'label': 'Search Results Summary', 'script': 'youtube_summary.py'},
-                        {'value': 'custom_class', 'label': 'Use SubjectiveYouTubeDataSource Class', 'script': 'SubjectiveYouTubeDataSource.py'}
-                    ],
-                    'default': 'context_generation',
-                    'description': 'Select the type of processing you want to perform'
-                },
-                
-                'input_data': {
-                    'type': 'textarea',
-                    'label': 'Input Data',
-                    'required': True,
-                    'placeholder': 'Enter YouTube URL, search query, or file path...',
-                    'description': 'Provide the input based on your selected input type',
-                    'validation': {
-                        'single_url': r'(?:https?://)?(?:www\.)?(?:youtube\.com/watch\?v=|youtu\.be/|youtube\.com/live/|youtube\.com/shorts/)[\w-]+',
-                        'search_query': r'.{3,}',  # At least 3 characters
-                        'url_list_file': r'.*\.txt$',  # File path ending in .txt
-                    }
-                },
-                
-                'whisper_model': {
-                    'type': 'select',
-                    'label': 'Whisper Model Size',
-                    'required': False,
-                    'options': [
-                        {'value': 'tiny', 'label': 'Tiny (fastest, least accurate)'},
-                        {'value': 'base', 'label': 'Base (balanced)'},
-                        {'value': 'small', 'label': 'Small (good accuracy)'},
-                        {'value': 'medium', 'label': 'Medium (better accuracy)'},
-                        {'value': 'large', 'label': 'Large (best accuracy, slowest)'}
-                    ],
-                    'default': 'base',
-                    'description': 'Select Whisper model size for transcription (applicable to transcription modes)',
-                    'show_when': ['transcription_english', 'transcription_spanish', 'transcription_auto', 'transcription_improved', 'context_generation', 'custom_class']
-                },
-                
-                'batch_options': {
-                    'type': 'group',
-                    'label': 'Batch Processing Options',
-                    'show_when': ['url_list_file'],
-                    'fields': {
-                        'batch_size': {
-                            'type': 'number',
-                            'label': 'Batch Size',
-                            'default': 10,
-                            'min': 1,
-                            'max': 50,
-                            'description': 'Number of videos to process in each batch'
-                        },
-                        'start_index': {
-                            'type': 'number',
-                            'label': 'Start Index',
-                            'default': 0,
-                            'min': 0,
-                            'description': 'Index to start processing from (for resume capability)'
-                        },
-                        'interactive_mode': {
-                            'type': 'checkbox',
-                            'label': 'Interactive Mode',
-                            'default': True,
-                            'description': 'Enable progress bars and interactive feedback'
-                        },
-                        'continue_on_error': {
-                            'type': 'checkbox',
-                            'label': 'Continue on Error',
-                            'default': True,
-                            'description': 'Continue processing even if some videos fail'
-                        }
-                    }
-                },
-                
-                'search_options': {
-                    'type': 'group',
-                    'label': 'Search Options',
-                    'show_when': ['search_summary'],
-                    'fields': {
-                        'max_results': {
-                            'type': 'number',
-                            'label': 'Maximum Results',
-                            'default': 10,
-                            'min': 1,
-                            'max': 50,
-                            'description': 'Maximum number of videos to process from search results'
-                        }
-                    }
-                },
-                
-                'output_options': {
-                    'type': 'group',
-                    'label': 'Output Options',
-                    'fields': {
-                        'output_format': {
-                            'type': 'select',
-                            'label': 'Output Format',
-                            'options': [
-                                {'value': 'text', 'label': 'Text Files (.txt)'},
-                                {'value': 'json', 'label': 'JSON Files (.json)'},
-                                {'value': 'both', 'label': 'Both Text and JSON'}
-                            ],
-                            'default': 'json',
-                            'description': 'Choose output file format'
-                        },
-                        'include_metadata': {
-                            'type': 'checkbox',
-                            'label': 'Include Video Metadata',
-                            'default': True,
-                            'description': 'Include video title, duration, views, etc. in output'
-                        },
-                        'clean_urls_first': {
-                            'type': 'checkbox',
-                            'label': 'Clean URLs Before Processing',
-                            'default': True,
-                            'description': 'Test and filter URLs before processing (recommended for batch)',
-                            'show_when': ['url_list_file']
-                        },
-                        'convert_live_urls': {
-                            'type': 'checkbox',
-                            'label': 'Convert Live URLs to Video URLs',
-                            'default': True,
-                            'description': 'Automatically convert live stream URLs to video URLs',
-                            'show_when': ['url_list_file']
-                        }
-                    }
-                },
-                
-                'advanced_options': {
-                    'type': 'group',
-                    'label': 'Advanced Options',
-                    'collapsed': True,
-                    'fields': {
-                        'audio_quality': {
-                            'type': 'select',
-                            'label': 'Audio Quality',
-                            'options': [
-                                {'value': '128', 'label': '128 kbps (lower quality, faster)'},
-                                {'value': '192', 'label': '192 kbps (balanced)'},
-                                {'value': '256', 'label': '256 kbps (higher quality)'},
-                                {'value': '320', 'label': '320 kbps (highest quality)'}
-                            ],
-                            'default': '192',
-                            'description': 'Audio quality for downloaded files'
-                        },
-                        'max_retries': {
-                            'type': 'number',
-                            'label': 'Maximum Retries',
-                            'default': 3,
-                            'min': 1,
-                            'max': 10,
-                            'description': 'Number of retry attempts for failed downloads'
-                        },
-                        'rate_limit_delay': {
-                            'type': 'number',
-                            'label': 'Rate Limit Delay (seconds)',
-                            'default': 2,
-                            'min': 0,
-                            'max': 30,
-                            'description': 'Delay between video processing to avoid rate limiting'
-                        }
-                    }
-                }
-            },
-            
-            # Available features mapping
-            'features_mapping': {
-                'single_url': {
-                    'audio_only': {'script': 'youtube_download_audio.py', 'output': 'MP3 file'},
-                    'transcription_english': {'script': 'youtube_extractor_english.py', 'output': 'Text file with English transcription + summary'},
-                    'transcription_spanish': {'script': 'youtube_extractor_spanish.py', 'output': 'Text file with Spanish transcription + summary'},
-                    'transcription_auto': {'script': 'youtube_text_extract.py', 'output': 'Text file with auto-language transcription + summary'},
-                    'transcription_improved': {'script': 'youtube_text_extract_improved.py', 'output': 'Text file with enhanced multi-language processing'},
-                    'context_generation': {'script': 'youtube_to_context.py', 'output': 'JSON context files for BrainBoost'},
-                    'body_language': {'script': 'youtube_bodylanguage_extractor.py', 'output': 'Video analysis + body language report'},
-                    'body_language_live': {'script': 'youtube_bodylanguage_extractor_1.py', 'output': 'Real-time body language analysis'},
-                    'custom_class': {'script': 'SubjectiveYouTubeDataSource.py', 'output': 'Structured data via Python class'}
-                },
-                'url_list_file': {
-                    'context_generation': {'script': 'process_youtube_batch.py + youtube_to_context.py', 'output': 'Multiple JSON context files'},
-                    'custom_class': {'script': 'SubjectiveYouTubeDataSource.py', 'output': 'Batch processing via Python class'}
-                },
-                'search_query': {
-                    'search_summary': {'script': 'youtube_summary.py', 'output': 'Combined summary of search results'}
-                },
-                'hardcoded_list': {
-                    'transcription_dual': {'script': 'youtube_batch_interviews.py', 'output': 'Both Spanish and English processing'}
-                }
-            },
-            
-            # Utility scripts information
-            'utility_scripts': {
-                'clean_youtube_links.py': 'Test and filter YouTube URLs for accessibility',
-                'convert_live_to_video_urls.py': 'Convert live stream URLs to video URLs'
-            },
-            
-            # Service capabilities
-            'capabilities': {
-                'supported_formats': ['youtube.com/watch', 'youtu.be', 'youtube.com/live', 'youtube.com/shorts'],
-                'languages_supported': ['Auto-detect', 'English', 'Spanish', 'Multi-language with translation'],
-                'output_formats': ['MP3', 'TXT', 'JSON', 'Video frames', 'Analysis reports'],
-                'batch_processing': True,
-                'real_time_analysis': True,
-                'search_integration': True,
-                'body_language_analysis': True,
-                'brainboost_integration': True
-            },
+            **_CONNECTION_DATA_TEMPLATE,
+            'connection_status': connection_status,
+            'last_tested': last_tested,
             
             # Status information
             'status': {
-                'connection_test': test_connection,
+                'connection_test': connection_status == 'connected',
+                'connection_checks': checks,
                 'scripts_available': self._check_script_availability(),
-                'dependencies_status': self._check_dependencies_status()
+                'dependencies_status': self._check_dependencies_status(deep_check)
             }
         }
     
@@ -602,112 +1655,428 @@ class SubjectiveYouTubeDataSource(SubjectiveDataSource):
         Get an icon representation for the YouTube data source.
         Returns SVG content, preferring a local icon.svg file when present.
         """
-        icon_path = os.path.join(os.path.dirname(__file__), 'icon.svg')
+        if SubjectiveYouTubeDataSource._icon_svg is None:
+            icon = _DEFAULT_ICON_SVG
+            icon_path = os.path.join(os.path.dirname(__file__), 'icon.svg')
+            try:
+                if os.path.exists(icon_path):
+                    with open(icon_path, 'r', encoding='utf-8') as f:
+                        icon = f.read()
+            except Exception:
+                pass
+            SubjectiveYouTubeDataSource._icon_svg = icon
+        return SubjectiveYouTubeDataSource._icon_svg
+    
+    # Private helper methods
+    
+    @staticmethod
+    def _detect_device() -> str:
+        """Return 'cuda' when a CUDA device is available, otherwise 'cpu'."""
+        try:
+            import torch
+            return "cuda" if torch.cuda.is_available() else "cpu"
+        except ImportError:
+            return "cpu"
+    
+    @staticmethod
+    def _resolve_compute_type(device: str) -> str:
+        """
+        Pick the CTranslate2 compute type for the given device.
+        
+        FP16 on CUDA halves weight bandwidth versus FP32; on CPU, INT8 weights with
+        FP32 activations use the VNNI dot-product instructions when available,
+        plain INT8 otherwise.
+        """
+        if device == "cuda":
+            return "float16"
+        return "int8_float32" if SubjectiveYouTubeDataSource._cpu_has_vnni() else "int8"
+    
+    @staticmethod
+    def _supports_flash_attention(device: str) -> bool:
+        """FlashAttention kernels need an Ampere (sm >= 8.0) or newer GPU."""
+        if device != "cuda":
+            return False
         try:
-            if os.path.exists(icon_path):
-                with open(icon_path, 'r', encoding='utf-8') as f:
-                    return f.read()
+            import torch
+            major, _ = torch.cuda.get_device_capability()
+            return major >= 8
         except Exception:
+            return False
+    
+    @staticmethod
+    def _cpu_has_vnni() -> bool:
+        """Return True when /proc/cpuinfo advertises AVX-512 VNNI."""
+        try:
+            with open('/proc/cpuinfo', 'r') as f:
+                for line in f:
+                    if line.startswith('flags'):
+                        return 'avx512_vnni' in line.split()
+        except OSError:
             pass
-        return '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24"><rect width="24" height="24" rx="4" fill="#ff0000"/><path fill="#fff" d="M10 8l6 4-6 4z"/></svg>'
+        return False
     
-    # Private helper methods
+    def _model_kwargs(self) -> Dict[str, Any]:
+        """Keyword arguments used to construct the WhisperModel."""
+        kwargs = {
+            'model_size_or_path': self.whisper_model_size,
+            'device': self.device,
+            'compute_type': self.compute_type,
+            'cpu_threads': os.cpu_count() or 0,
+            'num_workers': self.whisper_num_workers,
+        }
+        if self.flash_attention:
+            # Forwarded to ctranslate2.models.Whisper: fused QK/softmax/PV attention
+            kwargs['flash_attention'] = True
+        return kwargs
+    
+    def _get_transcriber(self) -> _TranscriberWorker:
+        """Start the transcriber process on first use."""
+        if self._transcriber is None:
+            self._log_info("Starting Whisper transcriber process (%s) on %s...", self.whisper_model_size, self.device)
+            self._transcriber = _TranscriberWorker(self._model_kwargs(), self.gpu_features)
+        return self._transcriber
+    
+    def _whisper_cache_key(self) -> tuple:
+        """Key identifying a loaded model in _WHISPER_CACHE."""
+        if self.whisper_backend == 'openvino':
+            return ('openvino', self.openvino_model_dir, self.openvino_device)
+        if self.whisper_backend == 'onnx':
+            return ('onnx', self.whisper_model_size, self.device)
+        return (self.whisper_model_size, self.device, self.compute_type, self.flash_attention,
+                self.gpu_features, self.whisper_num_workers)
     
     def _load_whisper_model(self):
-        """Load the Whisper model for transcription."""
+        """
+        Load the Whisper model for transcription, reusing a process-wide copy.
+        
+        This is a faster-whisper (CTranslate2) WhisperModel, or an _OpenVINOWhisper /
+        _ONNXWhisper when whisper_backend is 'openvino' / 'onnx'.
+        """
         if self.whisper_model is None:
-            self._log_info(f"Loading Whisper model ({self.whisper_model_size})...")
-            self.whisper_model = whisper.load_model(self.whisper_model_size)
+            key = self._whisper_cache_key()
+            with _WHISPER_CACHE_LOCK:
+                model = _WHISPER_CACHE.get(key)
+                if model is None:
+                    model = self._create_whisper_model()
+                    if self.whisper_warmup:
+                        self._warm_up_whisper_model(model)
+                    _WHISPER_CACHE[key] = model
+            self.whisper_model = model
         return self.whisper_model
     
+    def _release_whisper_model(self):
+        """Drop the model from this instance and the process-wide cache so its memory can be freed."""
+        with _WHISPER_CACHE_LOCK:
+            released = _WHISPER_CACHE.pop(self._whisper_cache_key(), None) is not None
+        self.whisper_model = None
+        # torch is only imported when GPU feature extraction is in use
+        torch = sys.modules.get('torch')
+        if torch is not None and self.device == 'cuda':
+            torch.cuda.empty_cache()
+        if released:
+            self._log_info("Released Whisper model (%s)", self.whisper_model_size)
+    
+    def _create_whisper_model(self):
+        """Construct the model for the configured backend."""
+        if self.whisper_backend == 'openvino':
+            self._log_info("Loading OpenVINO Whisper model from %s on %s...", self.openvino_model_dir, self.openvino_device)
+            return _OpenVINOWhisper(self.openvino_model_dir, self.openvino_device,
+                                    os.path.join(self.cache_dir, 'openvino'))
+        if self.whisper_backend == 'onnx':
+            self._log_info("Loading ONNX Runtime Whisper model (%s) on %s...", self.whisper_model_size, self.device)
+            return _ONNXWhisper(self.whisper_model_size, self.device, os.path.join(self.cache_dir, 'onnx'))
+        
+        self._log_info("Loading Whisper model (%s) on %s with compute type %s...", self.whisper_model_size, self.device, self.compute_type)
+        model = WhisperModel(**self._model_kwargs())
+        if self.gpu_features and _enable_gpu_features(model, self.device):
+            self._log_info("Computing Whisper features on the GPU")
+        return model
+    
+    def _warm_up_whisper_model(self, model):
+        """Run one silent window through the model so kernel selection happens before real work."""
+        try:
+            silence = np.zeros(_WHISPER_SAMPLE_RATE, dtype=np.float32)
+            segments, _ = model.transcribe(silence, beam_size=1, language='en')
+            for _ in segments:
+                pass
+            self._log_info("Warmed up Whisper model")
+        except Exception as e:
+            self._log_warning("Whisper model warm-up failed: %s", e)
+    
     def _download_audio(self, video_url: str, download_path: str) -> Optional[str]:
         """Download the audio stream of a YouTube video using yt-dlp."""
-        ydl_opts = {
-            'format': 'bestaudio/best',
-            'outtmpl': os.path.join(download_path, '%(id)s.%(ext)s'),
-            'postprocessors': [{
-                'key': 'FFmpegExtractAudio',
-                'preferredcodec': 'mp3',
-                'preferredquality': self.audio_quality,
-            }],
-            'quiet': True,
-            'no_warnings': True,
-            'retries': self.max_retries,
-        }
+        _, audio_file = self._fetch_and_download(video_url, download_path)
+        return audio_file
+    
+    def _get_audio_downloader(self) -> YoutubeDL:
+        """
+        Return this thread's audio-download YoutubeDL, creating it on first use.
+        
+        Instances are reused across videos so extractor setup is paid once per
+        worker thread; the target directory is set per call through 'paths'.
+        """
+        ydl = getattr(self._ydl_local, 'audio', None)
+        if ydl is None:
+            ydl = YoutubeDL({
+                'format': 'bestaudio/best',
+                'outtmpl': '%(id)s.%(ext)s',
+                # No postprocessor: the downloaded stream is decoded straight into
+                # Whisper's format by _iter_audio_chunks, so nothing is re-encoded
+                'quiet': True,
+                'no_warnings': True,
+                'retries': self.max_retries,
+                # Start the HTTP downloader with large read/write blocks so a batch of
+                # concurrent downloads issues far fewer write() syscalls
+                'buffersize': self.download_buffer_size,
+                'concurrent_fragment_downloads': self.fragment_downloads,
+            })
+            self._ydl_local.audio = ydl
+        return ydl
+    
+    def _fetch_and_download(self, video_url: str, download_path: Optional[str]) -> tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Resolve and download a video's audio with a single yt-dlp extract_info call.
+        
+        With download_path=None only the info dict is resolved, using the shared
+        metadata extractor.
         
+        Returns:
+            Tuple of (info_dict, audio_file); either may be None on failure
+        """
+        error = None
         for attempt in range(self.max_retries):
             try:
-                with YoutubeDL(ydl_opts) as ydl:
-                    info_dict = ydl.extract_info(video_url, download=True)
-                    self._log_info(f"Downloaded video: {info_dict.get('title', 'Unknown Title')}")
+                self._throttle()
+                if download_path is None:
+                    return self._ydl.extract_info(video_url, download=False), None
+                
+                ydl = self._get_audio_downloader()
+                ydl.params['paths'] = {'home': download_path}
+                info_dict = ydl.extract_info(video_url, download=True)
+                # yt-dlp reports the final path of what it wrote; fall back to the template
+                downloads = info_dict.get('requested_downloads') or [{}]
+                audio_file = downloads[-1].get('filepath') or ydl.prepare_filename(info_dict)
+                self._log_info("Downloaded video: %s", info_dict.get('title', 'Unknown Title'))
                 
-                # Find the mp3 file
-                mp3_files = glob.glob(os.path.join(download_path, "*.mp3"))
-                if mp3_files:
-                    audio_file = mp3_files[0]
-                    self._log_info(f"Found audio file: {audio_file}")
-                    return audio_file
+                if os.path.exists(audio_file):
+                    self._log_info("Found audio file: %s", audio_file)
+                    return info_dict, audio_file
                 else:
-                    self._log_error("No MP3 file was found after download.")
-                    return None
+                    self._log_error("No audio file was found after download.")
+                    return info_dict, None
                     
             except Exception as e:
-                self._log_error(f"Attempt {attempt + 1} - Error downloading {video_url}: {e}")
+                error = e
+                self._log_error("Attempt %d - Error fetching %s: %s", attempt + 1, video_url, e)
+                if any(err in str(e) for err in _TERMINAL_ERRORS):
+                    break
+                if self._limiter is not None and 'HTTP Error 429' in str(e):
+                    # Back off for every worker: as long as YouTube asks, else doubling per attempt
+                    self._limiter.pause(self._retry_after(e) or min(60, 5 * 2 ** attempt))
                 if attempt < self.max_retries - 1:
-                    time.sleep(3)
-                else:
-                    return None
+                    # Exponential backoff with jitter so parallel workers do not retry in lockstep
+                    delay = self.retry_base_delay * 2 ** attempt
+                    time.sleep(min(60, delay + random.uniform(0, self.retry_jitter * delay)))
+        
+        video_id = self._extract_video_id(video_url)
+        if self._meta_cache is not None and video_id and any(err in str(error) for err in _CACHEABLE_ERRORS):
+            self._meta_cache.set(video_id, {'error': str(error)}, expire=self.metadata_error_ttl)
+        return None, None
+    
+    @staticmethod
+    def _retry_after(error: BaseException) -> Optional[float]:
+        """Seconds from the Retry-After header of the HTTP error behind a yt-dlp exception, if any."""
+        seen = set()
+        while error is not None and id(error) not in seen:
+            seen.add(id(error))
+            response = getattr(error, 'response', None)
+            value = response.headers.get('Retry-After') if response is not None else None
+            if value and value.strip().isdigit():
+                return float(value)
+            exc_info = getattr(error, 'exc_info', None)
+            error = (exc_info[1] if exc_info else None) or error.__cause__ or error.__context__
+        return None
     
-    def _convert_to_mono_wav(self, mp3_path: str, output_path: str) -> Optional[str]:
-        """Convert an MP3 file to a mono WAV file."""
+    def _iter_audio_chunks(self, audio_path: str) -> Iterator[np.ndarray]:
+        """
+        Stream-decode an audio file with ffmpeg into Whisper's 16 kHz mono float32 layout.
+        
+        Yields chunks of stream_chunk_seconds (the whole file when 0), so memory per
+        worker stays bounded regardless of video length.
+        """
+        # ffmpeg emits float32 samples directly, so chunks need no int16 conversion
+        chunk_bytes = self.stream_chunk_seconds * _WHISPER_SAMPLE_RATE * 4 if self.stream_chunk_seconds else -1
+        proc = subprocess.Popen(
+            ['ffmpeg', '-nostdin', '-loglevel', 'error', '-i', audio_path,
+             '-ac', '1', '-ar', str(_WHISPER_SAMPLE_RATE), '-f', 'f32le', '-'],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        )
         try:
-            audio = AudioSegment.from_mp3(mp3_path)
-            audio = audio.set_channels(1)  # Convert to mono
-            audio.export(output_path, format="wav")
-            self._log_info(f"Converted {mp3_path} to mono WAV at {output_path}.")
-            return output_path
-        except Exception as e:
-            self._log_error(f"Error converting {mp3_path} to WAV: {e}")
-            return None
+            while True:
+                raw = proc.stdout.read(chunk_bytes)
+                if not raw:
+                    break
+                yield np.frombuffer(raw, np.float32)
+            _, stderr = proc.communicate()
+            if proc.returncode:
+                raise subprocess.CalledProcessError(proc.returncode, proc.args, stderr=stderr)
+        finally:
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
     
-    def _transcribe_audio(self, audio_path: str, model) -> tuple[str, str]:
-        """Transcribe audio to text using Whisper."""
+    def _decode_ahead(self, audio_path: str) -> Iterator[np.ndarray]:
+        """
+        Run _iter_audio_chunks on a background thread so ffmpeg decodes the next
+        chunks while the caller transcribes the current one.
+        
+        At most DECODE_AHEAD_CHUNKS decoded chunks are held in memory; ffmpeg
+        errors are re-raised in the caller.
+        """
+        chunks = queue.Queue(maxsize=self.DECODE_AHEAD_CHUNKS)
+        stop = threading.Event()
+        
+        def decode():
+            decoder = self._iter_audio_chunks(audio_path)
+            outcome = None
+            try:
+                for chunk in decoder:
+                    if stop.is_set():
+                        break
+                    chunks.put(chunk)
+            except Exception as e:
+                outcome = e
+            finally:
+                decoder.close()
+            chunks.put(outcome)
+        
+        decoder_thread = threading.Thread(target=decode, daemon=True)
+        decoder_thread.start()
         try:
-            result = model.transcribe(audio_path)
-            transcript = result.get('text', "")
-            language = result.get('language', "unknown")
-            self._log_info(f"Transcribed audio file {audio_path} with detected language: {language}.")
+            while (item := chunks.get()) is not None:
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            # Unblock the decoder if we stopped early, then wait for it
+            stop.set()
+            while decoder_thread.is_alive():
+                try:
+                    chunks.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+    
+    def _transcribe_audio(self, audio_path: str, model, **options) -> tuple[str, str]:
+        """
+        Transcribe audio to text using faster-whisper.
+        
+        `model` may be a WhisperModel or a BatchedInferencePipeline; extra options
+        (e.g. batch_size for the pipeline) are forwarded to its transcribe call.
+        When the transcriber process is enabled, `model` is ignored and the audio
+        is sent to that process instead.
+        
+        Audio is transcribed chunk by chunk while ffmpeg decodes the next ones;
+        each chunk is prompted with the previous chunk's text and reuses the
+        language detected on the first one.
+        """
+        try:
+            options = {
+                'beam_size': self.beam_size,
+                'vad_filter': self.vad_filter,
+                'vad_parameters': {'min_silence_duration_ms': self.vad_min_silence_ms},
+                **options
+            }
+            texts = []
+            language = None
+            for chunk in self._decode_ahead(audio_path):
+                chunk_options = dict(options)
+                if texts and texts[-1].strip():
+                    chunk_options['initial_prompt'] = texts[-1]
+                if language and 'language' not in chunk_options:
+                    chunk_options['language'] = language
+                
+                if self.use_transcriber_process:
+                    text, chunk_language = self._get_transcriber().transcribe(chunk, **chunk_options)
+                else:
+                    text, chunk_language = _run_transcription(model, chunk, chunk_options)
+                texts.append(text)
+                language = language or chunk_language
+            
+            transcript = "".join(texts)
+            language = language or "unknown"
+            self._log_info("Transcribed audio file %s with detected language: %s.", audio_path, language)
             return transcript, language
         except Exception as e:
-            self._log_error(f"Error transcribing {audio_path}: {e}")
+            self._log_error("Error transcribing %s: %s", audio_path, e)
             return "", "unknown"
     
     def _sanitize_filename(self, name: str) -> str:
         """Sanitize the video title to create a valid filename."""
-        name = name.replace(' ', '_')
-        name = re.sub(r'[^\w\-]', '', name)
-        return name[:50]  # Limit length
+        return _SANITIZE_RE.sub('', name.translate(_SPACE_TABLE))[:50]  # Limit length
     
-    def _test_youtube_connection(self) -> bool:
-        """Test if YouTube service is accessible."""
+    def _get_connection_test(self, deep_check: bool = False) -> tuple[Dict[str, Optional[bool]], str]:
+        """
+        Return (connection checks, ISO time of the test), re-testing at most once per
+        CONNECTION_TEST_TTL. deep_check bypasses the cache and also tests yt-dlp.
+        """
+        if deep_check:
+            return self._test_youtube_connection(deep_check=True), datetime.now().isoformat()
+        cached = SubjectiveYouTubeDataSource._connection_test_cache
+        if cached is not None and time.monotonic() - cached[0] < self.CONNECTION_TEST_TTL:
+            return dict(cached[1]), cached[2]
+        
+        checks = self._test_youtube_connection()
+        SubjectiveYouTubeDataSource._connection_test_cache = (time.monotonic(), checks, datetime.now().isoformat())
+        return dict(checks), SubjectiveYouTubeDataSource._connection_test_cache[2]
+    
+    def _test_youtube_connection(self, deep_check: bool = False) -> Dict[str, Optional[bool]]:
+        """
+        Test if YouTube service is accessible.
+        
+        'network' is a TCP handshake with www.youtube.com, which answers "is YouTube
+        reachable?" without running the extractor. With deep_check, 'extractor' asks
+        yt-dlp for a known video's metadata (without resolving formats) to catch a
+        broken or blocked yt-dlp; otherwise it is None (not checked).
+        """
+        checks = {'network': False, 'extractor': None}
+        try:
+            socket.create_connection(('www.youtube.com', 443), timeout=2).close()
+            checks['network'] = True
+        except OSError as e:
+            self._log_warning("YouTube connection test failed: %s", e)
+            return checks
+        
+        if not deep_check:
+            return checks
         try:
-            # Test with a known, stable YouTube video (Rick Astley - Never Gonna Give You Up)
-            test_url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
-            with YoutubeDL({'quiet': True, 'skip_download': True}) as ydl:
-                info_dict = ydl.extract_info(test_url, download=False)
-                # If we can extract basic info, the connection is working
-                return info_dict is not None and 'title' in info_dict
+            # Not routed through the download rate limiter: a diagnostic must not
+            # wait for, or use up, tokens meant for downloads
+            info_dict = self._ydl.extract_info(_CONNECTION_TEST_URL, download=False, process=False)
+            checks['extractor'] = bool(info_dict and info_dict.get('title'))
         except Exception as e:
-            self._log_warning(f"YouTube connection test failed: {e}")
-            return False
+            self._log_warning("YouTube extractor test failed: %s", e)
+            checks['extractor'] = False
+        return checks
 
     def _check_script_availability(self) -> Dict[str, bool]:
         """
         Check which YouTube processing scripts are available in the current directory.
         
+        The directory is scanned at most once per SCRIPT_SCAN_TTL for each working
+        directory; calls in between return a copy of the last scan.
+        
         Returns:
             Dict mapping script names to their availability status
         """
+        cwd = os.getcwd()
+        cache = SubjectiveYouTubeDataSource._script_availability_cache
+        cached = cache.get(cwd)
+        if cached is None or time.monotonic() - cached[0] >= self.SCRIPT_SCAN_TTL:
+            cached = cache[cwd] = (time.monotonic(), self._scan_scripts())
+        return dict(cached[1])
+
+    def _scan_scripts(self) -> Dict[str, bool]:
+        """Look up each processing script in the current directory."""
         scripts = [
             'youtube_download_audio.py',
             'youtube_extractor_english.py', 
@@ -724,68 +2093,50 @@ class SubjectiveYouTubeDataSource(SubjectiveDataSource):
             'convert_live_to_video_urls.py'
         ]
         
-        import os
-        script_status = {}
-        for script in scripts:
-            script_status[script] = os.path.exists(script)
+        # One directory listing instead of a stat() per script
+        with os.scandir('.') as entries:
+            present = {entry.name for entry in entries if entry.is_file()}
         
-        return script_status
+        return {script: script in present for script in scripts}
 
-    def _check_dependencies_status(self) -> Dict[str, bool]:
+    def _check_dependencies_status(self, deep_check: bool = False) -> Dict[str, bool]:
         """
         Check the availability of key dependencies for YouTube processing.
         
+        The probe (module lookups plus an ffmpeg PATH lookup) runs once per process;
+        later calls return a copy of the first result.
+        
+        Args:
+            deep_check: Bypass the cache and run `ffmpeg -version` (2 s timeout) to
+                confirm the binary actually starts, for health diagnostics
+        
         Returns:
             Dict mapping dependency names to their availability status
         """
-        dependencies_status = {}
+        if deep_check:
+            dependencies_status = self._probe_dependencies()
+            try:
+                # Only the exit status matters; DEVNULL discards the banner without pipes
+                subprocess.run(['ffmpeg', '-version'], stdout=subprocess.DEVNULL,
+                               stderr=subprocess.DEVNULL, check=True, timeout=2)
+            except (subprocess.CalledProcessError, OSError, subprocess.TimeoutExpired):
+                dependencies_status['ffmpeg-system'] = False
+            return dependencies_status
+        if SubjectiveYouTubeDataSource._dependencies_status_cache is None:
+            SubjectiveYouTubeDataSource._dependencies_status_cache = self._probe_dependencies()
+        return dict(SubjectiveYouTubeDataSource._dependencies_status_cache)
+
+    def _probe_dependencies(self) -> Dict[str, bool]:
+        """Locate each Python dependency and the ffmpeg executable to see what is installed."""
+        # Check Python packages; find_spec only searches sys.path, nothing is imported
+        dependencies_status = {
+            name: importlib.util.find_spec(module) is not None
+            for name, module in _PYTHON_DEPENDENCIES.items()
+        }
+        
+        # Check system dependencies; a PATH lookup, without starting ffmpeg
+        dependencies_status['ffmpeg-system'] = shutil.which('ffmpeg') is not None
         
-        # Check Python packages
-        try:
-            import yt_dlp
-            dependencies_status['yt-dlp'] = True
-        except ImportError:
-            dependencies_status['yt-dlp'] = False
-            
-        try:
-            import whisper
-            dependencies_status['openai-whisper'] = True
-        except ImportError:
-            dependencies_status['openai-whisper'] = False
-            
-        try:
-            import cv2
-            dependencies_status['opencv-python'] = True
-        except ImportError:
-            dependencies_status['opencv-python'] = False
-            
-        try:
-            import mediapipe  # type: ignore[import]
-            dependencies_status['mediapipe'] = True
-        except ImportError:
-            dependencies_status['mediapipe'] = False
-            
-        try:
-            from pydub import AudioSegment
-            dependencies_status['pydub'] = True
-        except ImportError:
-            dependencies_status['pydub'] = False
-            
-        try:
-            import ffmpeg
-            dependencies_status['ffmpeg-python'] = True
-        except ImportError:
-            dependencies_status['ffmpeg-python'] = False
-            
-        # Check system dependencies
-        import subprocess
-        try:
-            subprocess.run(['ffmpeg', '-version'], 
-                         capture_output=True, check=True, timeout=5)
-            dependencies_status['ffmpeg-system'] = True
-        except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
-            dependencies_status['ffmpeg-system'] = False
-            
         return dependencies_status
 
     def process_connection_form_data(self, form_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -807,22 +2158,16 @@ class SubjectiveYouTubeDataSource(SubjectiveDataSource):
             if not all([input_type, processing_mode, input_data]):
                 raise ValueError("Missing required form fields: input_type, processing_mode, or input_data")
             
-            self._log_info(f"Processing form data - Input Type: {input_type}, Mode: {processing_mode}")
+            self._log_info("Processing form data - Input Type: %s, Mode: %s", input_type, processing_mode)
             
             # Route to appropriate processing method based on input type and processing mode
-            if input_type == 'single_url':
-                return self._process_single_url(input_data, processing_mode, form_data)
-            elif input_type == 'url_list_file':
-                return self._process_url_list_file(input_data, processing_mode, form_data)
-            elif input_type == 'search_query':
-                return self._process_search_query(input_data, processing_mode, form_data)
-            elif input_type == 'hardcoded_list':
-                return self._process_hardcoded_list(processing_mode, form_data)
-            else:
+            handler = self._INPUT_HANDLERS.get(input_type)
+            if handler is None:
                 raise ValueError(f"Unsupported input type: {input_type}")
+            return getattr(self, handler)(input_data, processing_mode, form_data)
                 
         except Exception as e:
-            self._log_error(f"Error processing connection form data: {e}")
+            self._log_error("Error processing connection form data: %s", e)
             return {
                 'success': False,
                 'error': str(e),
@@ -837,38 +2182,26 @@ class SubjectiveYouTubeDataSource(SubjectiveDataSource):
                 raise ValueError(f"Invalid YouTube URL: {url}")
             
             if processing_mode == 'custom_class':
-                # Use the class's built-in processing
-                metadata = self.extract_metadata(url)
+                # Use the class's built-in processing (metadata comes from the same yt-dlp call)
                 processed_data = self.process_source(url)
                 return {
                     'success': True,
                     'processing_mode': processing_mode,
                     'script_used': 'SubjectiveYouTubeDataSource.py',
-                    'metadata': metadata,
+                    'metadata': processed_data['metadata'],
                     'processed_data': processed_data,
                     'output_info': 'Processed using SubjectiveYouTubeDataSource class methods'
                 }
             else:
                 # Route to external script
-                script_mapping = {
-                    'audio_only': 'youtube_download_audio.py',
-                    'transcription_english': 'youtube_extractor_english.py',
-                    'transcription_spanish': 'youtube_extractor_spanish.py',
-                    'transcription_auto': 'youtube_text_extract.py',
-                    'transcription_improved': 'youtube_text_extract_improved.py',
-                    'context_generation': 'youtube_to_context.py',
-                    'body_language': 'youtube_bodylanguage_extractor.py',
-                    'body_language_live': 'youtube_bodylanguage_extractor_1.py'
-                }
-                
-                script_name = script_mapping.get(processing_mode)
+                script_name = _SINGLE_URL_SCRIPTS.get(processing_mode)
                 if not script_name:
                     raise ValueError(f"Unsupported processing mode for single URL: {processing_mode}")
                 
                 return self._execute_external_script(script_name, url, form_data)
                 
         except Exception as e:
-            self._log_error(f"Error processing single URL {url}: {e}")
+            self._log_error("Error processing single URL %s: %s", url, e)
             return {
                 'success': False,
                 'error': str(e),
@@ -879,22 +2212,33 @@ class SubjectiveYouTubeDataSource(SubjectiveDataSource):
     def _process_url_list_file(self, file_path: str, processing_mode: str, form_data: Dict[str, Any]) -> Dict[str, Any]:
         """Process a file containing multiple YouTube URLs."""
         try:
-            import os
-            if not os.path.exists(file_path):
+            if not os.path.isfile(file_path):
                 raise ValueError(f"URL list file not found: {file_path}")
             
             if processing_mode == 'custom_class':
-                # Use the class's batch processing
-                with open(file_path, 'r') as f:
-                    urls = [line.strip() for line in f if line.strip()]
-                
-                results = self.process_batch(urls, **form_data.get('batch_options', {}))
+                # Use the class's batch processing, reading the file lazily
+                urls = self._iter_urls(file_path)
+                batch_options = dict(form_data.get('batch_options', {}))
+                max_concurrent = batch_options.pop('max_concurrent', 1)
+                if max_concurrent > 1:
+                    fields = _CONNECTION_FORM['batch_options']['fields']
+                    unsupported = sorted(name for name, value in batch_options.items()
+                                         if name not in _PARALLEL_BATCH_OPTIONS
+                                         and value != fields.get(name, {}).get('default'))
+                    if unsupported:
+                        raise ValueError(f"Batch options not supported with max_concurrent > 1: {', '.join(unsupported)}")
+                    results, failed_urls = asyncio.run(self._transcribe_chunks_parallel(
+                        self._expand_playlists(urls), max_concurrent, batch_options.get('continue_on_error', True)))
+                else:
+                    results, failed_urls = self._run_batch(urls, **batch_options)
                 return {
                     'success': True,
                     'processing_mode': processing_mode,
                     'script_used': 'SubjectiveYouTubeDataSource.py',
                     'batch_results': results,
                     'total_processed': len(results),
+                    'failed_urls': failed_urls,
+                    'total_failed': len(failed_urls),
                     'output_info': 'Processed using SubjectiveYouTubeDataSource batch processing'
                 }
             elif processing_mode == 'context_generation':
@@ -904,7 +2248,7 @@ class SubjectiveYouTubeDataSource(SubjectiveDataSource):
                 raise ValueError(f"Unsupported processing mode for batch processing: {processing_mode}")
                 
         except Exception as e:
-            self._log_error(f"Error processing URL list file {file_path}: {e}")
+            self._log_error("Error processing URL list file %s: %s", file_path, e)
             return {
                 'success': False,
                 'error': str(e),
@@ -912,6 +2256,90 @@ class SubjectiveYouTubeDataSource(SubjectiveDataSource):
                 'processing_mode': processing_mode
             }
 
+    async def _transcribe_chunks_parallel(self, urls: Iterable[str], max_concurrent: int = 5,
+                                          continue_on_error: bool = True) -> tuple[List[Dict[str, Any]], List[Dict[str, str]]]:
+        """
+        Run process_source for several URLs at once, at most max_concurrent at a time.
+        
+        Downloads of one video overlap with transcription of another. The Whisper model
+        is shared; set whisper_num_workers to max_concurrent so CTranslate2 can run the
+        transcriptions side by side instead of queueing them.
+        
+        Returns the processed data in input order and the failures as {'url', 'error'}
+        dicts. With continue_on_error=False no new URL is started after the first failure.
+        """
+        # Workers share one iterator, so URLs are read lazily and at most
+        # max_concurrent are in flight; results keep their input order.
+        # Reading it may hit the network (playlist expansion), so next() runs on a
+        # thread, one at a time
+        pending = enumerate(urls, 1)
+        pending_lock = asyncio.Lock()
+        stop = asyncio.Event()
+        results = {}
+        failed_urls = []
+        
+        async def worker():
+            while not stop.is_set():
+                async with pending_lock:
+                    if stop.is_set():
+                        return
+                    item = await asyncio.to_thread(next, pending, None)
+                if item is None:
+                    return
+                i, url = item
+                try:
+                    results[i] = await asyncio.to_thread(self.process_source, url)
+                except Exception as e:
+                    # process_source has already logged it and updated the stats
+                    failed_urls.append({'url': url, 'error': str(e)})
+                    if not continue_on_error:
+                        stop.set()
+        
+        await asyncio.gather(*(worker() for _ in range(max(1, max_concurrent))))
+        
+        success_count = len(results)
+        failure_count = len(failed_urls)
+        total = success_count + failure_count
+        success_rate = (success_count / total) * 100 if total else 0
+        self._log_info("Batch processing complete: %d successful, %d failed (%.1f%% success rate)", success_count, failure_count, success_rate)
+        return [results[i] for i in sorted(results)], failed_urls
+    
+    def _expand_playlists(self, urls: Iterable[str]) -> Iterator[str]:
+        """
+        Yield urls with each playlist or channel URL replaced by its videos' watch URLs.
+        
+        Entries come from a flat extraction (one request per playlist page), so
+        no video is resolved until it is downloaded.
+        """
+        for url in urls:
+            if not (isinstance(url, str) and _PLAYLIST_RE.match(url)):
+                yield url
+                continue
+            if self._flat_ydl is None:
+                self._flat_ydl = YoutubeDL({'quiet': True, 'extract_flat': 'in_playlist'})
+            try:
+                self._throttle()
+                info = self._flat_ydl.extract_info(url.strip(), download=False)
+            except Exception as e:
+                self._log_error("Failed to list playlist %s: %s", url, e)
+                continue
+            count = 0
+            for entry in info.get('entries') or []:
+                # Channel pages also list sub-playlists (tabs); only videos are kept
+                if entry and entry.get('id') and entry.get('ie_key', 'Youtube') == 'Youtube':
+                    count += 1
+                    yield f"https://www.youtube.com/watch?v={entry['id']}"
+            self._log_info("Expanded playlist %s into %d videos", url, count)
+    
+    @staticmethod
+    def _iter_urls(file_path: str) -> Iterator[str]:
+        """Yield the stripped URLs of a URL list file, skipping blank lines and # comments."""
+        with open(file_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                url = line.strip()
+                if url and not url.startswith('#'):
+                    yield url
+    
     def _process_search_query(self, query: str, processing_mode: str, form_data: Dict[str, Any]) -> Dict[str, Any]:
         """Process a YouTube search query."""
         try:
@@ -921,7 +2349,7 @@ class SubjectiveYouTubeDataSource(SubjectiveDataSource):
                 raise ValueError(f"Unsupported processing mode for search query: {processing_mode}")
                 
         except Exception as e:
-            self._log_error(f"Error processing search query '{query}': {e}")
+            self._log_error("Error processing search query '%s': %s", query, e)
             return {
                 'success': False,
                 'error': str(e),
@@ -929,8 +2357,8 @@ class SubjectiveYouTubeDataSource(SubjectiveDataSource):
                 'processing_mode': processing_mode
             }
 
-    def _process_hardcoded_list(self, processing_mode: str, form_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Process a hardcoded list of URLs (typically interviews)."""
+    def _process_hardcoded_list(self, input_data: str, processing_mode: str, form_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Process a hardcoded list of URLs (typically interviews); input_data is not used."""
         try:
             if processing_mode == 'transcription_dual':
                 return self._execute_external_script('youtube_batch_interviews.py', None, form_data)
@@ -938,7 +2366,7 @@ class SubjectiveYouTubeDataSource(SubjectiveDataSource):
                 raise ValueError(f"Unsupported processing mode for hardcoded list: {processing_mode}")
                 
         except Exception as e:
-            self._log_error(f"Error processing hardcoded list: {e}")
+            self._log_error("Error processing hardcoded list: %s", e)
             return {
                 'success': False,
                 'error': str(e),
@@ -947,15 +2375,14 @@ class SubjectiveYouTubeDataSource(SubjectiveDataSource):
 
     def _execute_external_script(self, script_name: str, input_data: str, form_data: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Execute an external YouTube processing script.
+        Execute an external YouTube processing script in a script worker process.
         
-        Note: This is a placeholder implementation. In a real system, you would:
-        1. Import and execute the script as a module
-        2. Use subprocess to run the script
-        3. Create a unified interface for all scripts
+        The worker imports the script once and calls its main(): with input_data
+        when main takes an argument, otherwise with input_data as sys.argv[1], the
+        same way the script is run from a shell. Workers are reused, so later calls
+        skip the interpreter start, the imports and the Whisper model load. Up to
+        `script_workers` scripts run at once; `script_timeout` (seconds) bounds a run.
         """
-        import os
-        
         if not os.path.exists(script_name):
             return {
                 'success': False,
@@ -963,15 +2390,32 @@ class SubjectiveYouTubeDataSource(SubjectiveDataSource):
                 'script_name': script_name
             }
         
-        # For now, return a placeholder response indicating the script would be executed
+        try:
+            with self._script_worker_slots:
+                try:
+                    worker = self._idle_script_workers.get_nowait()
+                except queue.Empty:
+                    worker = _ScriptWorker()
+                try:
+                    return_value = worker.run(os.path.abspath(script_name), input_data, self.script_timeout)
+                finally:
+                    self._idle_script_workers.put(worker)
+        except Exception as e:
+            self._log_error("Error executing %s: %s", script_name, e)
+            return {
+                'success': False,
+                'error': str(e),
+                'script_name': script_name
+            }
+        
         return {
             'success': True,
             'processing_mode': form_data.get('processing_mode'),
             'script_used': script_name,
             'input_data': input_data,
             'form_options': form_data,
-            'output_info': f"Would execute {script_name} with input: {input_data}",
-            'note': 'This is a placeholder - actual script execution would happen here'
+            'return_value': return_value,
+            'output_info': f"Executed {script_name} with input: {input_data}"
         }
 
 
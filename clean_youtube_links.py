@@ -3,78 +3,132 @@
 Clean YouTube links file by removing problematic links
 """
 
+import os
+import random
 import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from tqdm import tqdm
 from yt_dlp import YoutubeDL
 import time
 
+# Links probed at once; the work is network-bound
+MAX_WORKERS = 16
+# Attempts per link when YouTube rate-limits or the connection fails
+MAX_ATTEMPTS = 3
+BACKOFF_BASE_SECONDS = 1.0
+# Errors worth retrying; anything else (private, unavailable, ...) is final
+TRANSIENT_ERRORS = ("HTTP Error 429", "Too Many Requests", "timed out", "Connection reset", "HTTP Error 5")
+
 def test_youtube_link(url):
-    """Test if a YouTube link is accessible."""
-    try:
-        with YoutubeDL({'quiet': True, 'skip_download': True}) as ydl:
-            info_dict = ydl.extract_info(url, download=False)
-            return True, info_dict.get('title', 'Unknown')
-    except Exception as e:
-        error_msg = str(e)
-        if "This live event will begin in a few moments" in error_msg:
-            return False, "Future live event"
-        elif "Private video" in error_msg:
-            return False, "Private video"
-        elif "Video unavailable" in error_msg:
-            return False, "Video unavailable"
-        else:
-            return False, f"Error: {error_msg[:100]}"
+    """Test if a YouTube link is accessible, retrying transient errors with jittered backoff."""
+    for attempt in range(MAX_ATTEMPTS):
+        try:
+            with YoutubeDL({'quiet': True, 'skip_download': True}) as ydl:
+                info_dict = ydl.extract_info(url, download=False)
+                return True, info_dict.get('title', 'Unknown')
+        except Exception as e:
+            error_msg = str(e)
+            if attempt + 1 < MAX_ATTEMPTS and any(marker in error_msg for marker in TRANSIENT_ERRORS):
+                delay = BACKOFF_BASE_SECONDS * (2 ** attempt)
+                time.sleep(delay + random.uniform(-0.1 * delay, 0.1 * delay))
+                continue
+            return False, describe_error(error_msg)
+
+def describe_error(error_msg):
+    """Short reason for a failed link."""
+    if "This live event will begin in a few moments" in error_msg:
+        return "Future live event"
+    elif "Private video" in error_msg:
+        return "Private video"
+    elif "Video unavailable" in error_msg:
+        return "Video unavailable"
+    else:
+        return f"Error: {error_msg[:100]}"
+
+def iter_links(input_file):
+    """Yield the links of a list file, skipping blank lines and comments."""
+    with open(input_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            link = line.strip()
+            if link and not line.startswith('#'):
+                yield link
+
+def check_links(links, executor):
+    """
+    Yield (link, (is_valid, reason)) in input order.
+    
+    At most 2 * MAX_WORKERS checks are queued at once, so the input is read
+    lazily instead of being held in memory.
+    """
+    pending = deque()
+    for link in links:
+        pending.append((link, executor.submit(test_youtube_link, link)))
+        if len(pending) >= 2 * MAX_WORKERS:
+            link, future = pending.popleft()
+            yield link, future.result()
+    while pending:
+        link, future = pending.popleft()
+        yield link, future.result()
 
 def clean_youtube_links(input_file, output_file):
     """Clean YouTube links file by removing problematic links."""
     
-    # Read all links
-    with open(input_file, 'r', encoding='utf-8') as f:
-        all_links = [line.strip() for line in f if line.strip() and not line.startswith('#')]
-    
-    print(f"🔍 Testing {len(all_links)} YouTube links...")
+    rejected_file = f"{output_file}.rejected"
+    # Both files are written under .tmp names and renamed into place only once the
+    # run completes, so an interrupted run never leaves a truncated output behind
+    # (its partial results stay in the .tmp files)
+    valid_tmp = f"{output_file}.tmp"
+    rejected_tmp = f"{rejected_file}.tmp"
+    print(f"🔍 Testing YouTube links from {input_file}...")
     print("=" * 60)
     
-    valid_links = []
-    invalid_links = []
+    valid_count = 0
+    invalid_count = 0
     
-    for i, link in enumerate(all_links, 1):
-        print(f"[{i}/{len(all_links)}] Testing: {link}")
+    # Results are written as they arrive; invalid links go to a .rejected file
+    # next to the output
+    with open(valid_tmp, 'w', encoding='utf-8') as valid_out, \
+            open(rejected_tmp, 'w', encoding='utf-8') as rejected_out:
+        valid_out.write("# Clean YouTube links (tested and verified)\n")
+        valid_out.write(f"# Generated from {input_file}\n\n")
+        rejected_out.write(f"# Rejected YouTube links from {input_file}\n\n")
         
-        is_valid, reason = test_youtube_link(link)
+        # Progress goes to a rate-limited bar instead of several prints per link
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor, \
+                tqdm(desc="Testing", unit="link") as progress:
+            for link, (is_valid, reason) in check_links(iter_links(input_file), executor):
+                if is_valid:
+                    valid_count += 1
+                    valid_out.write(f"{link}\n")
+                else:
+                    invalid_count += 1
+                    rejected_out.write(f"{link}  # {reason}\n")
+                progress.update(1)
         
-        if is_valid:
-            valid_links.append(link)
-            print(f"✅ Valid: {reason}")
-        else:
-            invalid_links.append((link, reason))
-            print(f"❌ Invalid: {reason}")
-        
-        # Small delay to avoid rate limiting
-        time.sleep(0.5)
+        valid_out.write(f"\n# Valid links: {valid_count}/{valid_count + invalid_count}\n")
+        for out in (valid_out, rejected_out):
+            out.flush()
+            os.fsync(out.fileno())
     
     print("\n" + "=" * 60)
     print(f"📊 RESULTS:")
-    print(f"✅ Valid links: {len(valid_links)}")
-    print(f"❌ Invalid links: {len(invalid_links)}")
+    print(f"✅ Valid links: {valid_count}")
+    print(f"❌ Invalid links: {invalid_count}")
     print("=" * 60)
     
-    if invalid_links:
-        print("\n❌ Invalid links found:")
-        for link, reason in invalid_links:
-            print(f"  • {link} - {reason}")
+    if invalid_count:
+        os.replace(rejected_tmp, rejected_file)
+        print(f"\n❌ Invalid links and reasons saved to: {rejected_file}")
+    else:
+        os.remove(rejected_tmp)
     
-    if valid_links:
-        # Save valid links to output file
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write("# Clean YouTube links (tested and verified)\n")
-            f.write(f"# Generated from {input_file}\n")
-            f.write(f"# Valid links: {len(valid_links)}/{len(all_links)}\n\n")
-            for link in valid_links:
-                f.write(f"{link}\n")
-        
-        print(f"\n✅ Saved {len(valid_links)} valid links to: {output_file}")
+    if valid_count:
+        os.replace(valid_tmp, output_file)
+        print(f"\n✅ Saved {valid_count} valid links to: {output_file}")
         return True
     else:
+        os.remove(valid_tmp)
         print("\n💥 No valid links found!")
         return False
 
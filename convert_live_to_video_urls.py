@@ -4,14 +4,19 @@ Convert YouTube live URLs to regular video URLs
 Many live streams become regular videos after they finish
 """
 
+import os
 import sys
 import re
 
+# Format: https://youtube.com/live/VIDEO_ID?feature=share
+LIVE_URL_RE = re.compile(r'youtube\.com/live/([a-zA-Z0-9_-]+)')
+# A whole non-comment line holding a live URL, matched across the file in one pass
+LIVE_URL_LINE_RE = re.compile(r'^(?![ \t]*#)[^\n]*?youtube\.com/live/([a-zA-Z0-9_-]+)[^\n]*$', re.MULTILINE)
+
 def convert_live_to_video_url(live_url):
     """Convert a YouTube live URL to a regular video URL."""
     # Extract video ID from live URL
-    # Format: https://youtube.com/live/VIDEO_ID?feature=share
-    match = re.search(r'youtube\.com/live/([a-zA-Z0-9_-]+)', live_url)
+    match = LIVE_URL_RE.search(live_url)
     
     if match:
         video_id = match.group(1)
@@ -20,7 +25,7 @@ def convert_live_to_video_url(live_url):
     else:
         return live_url  # Return unchanged if not a live URL
 
-def convert_youtube_links_file(input_file, output_file):
+def convert_youtube_links_file(input_file, output_file, verbose=False):
     """Convert all live URLs in a file to regular video URLs."""
     
     print(f"🔄 Converting YouTube live URLs to video URLs...")
@@ -28,37 +33,31 @@ def convert_youtube_links_file(input_file, output_file):
     print(f"📁 Output: {output_file}")
     print("=" * 50)
     
-    # Read all links
+    # Read the whole file and rewrite every live URL line in a single regex pass;
+    # comments, empty lines and other URLs are kept as they are
     with open(input_file, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
+        content = f.read()
     
-    converted_lines = []
-    conversion_count = 0
+    def to_video_url(match):
+        converted_url = f"https://www.youtube.com/watch?v={match.group(1)}"
+        if verbose:
+            print(f"🔄 Converted: {match.group(0).strip()}")
+            print(f"   ➡️  To: {converted_url}")
+        return converted_url
     
-    for line in lines:
-        line = line.strip()
-        
-        if line and not line.startswith('#'):
-            # Check if it's a live URL
-            if 'youtube.com/live/' in line:
-                converted_url = convert_live_to_video_url(line)
-                converted_lines.append(converted_url + '\n')
-                conversion_count += 1
-                print(f"🔄 Converted: {line}")
-                print(f"   ➡️  To: {converted_url}")
-            else:
-                converted_lines.append(line + '\n')
-                print(f"✅ Kept: {line}")
-        else:
-            # Keep comments and empty lines
-            converted_lines.append(line + '\n')
+    converted_content, conversion_count = LIVE_URL_LINE_RE.subn(to_video_url, content)
+    if converted_content and not converted_content.endswith('\n'):
+        converted_content += '\n'
     
-    # Write converted URLs
-    with open(output_file, 'w', encoding='utf-8') as f:
+    # Write converted URLs to a temporary file and rename it into place, so a
+    # crash mid-write never leaves a truncated output file
+    tmp_file = f"{output_file}.tmp"
+    with open(tmp_file, 'w', encoding='utf-8') as f:
         f.write("# Converted YouTube URLs (live URLs changed to video URLs)\n")
         f.write(f"# Converted {conversion_count} live URLs to video URLs\n")
         f.write("# Note: Some videos may still be unavailable if the live stream hasn't finished\n\n")
-        f.writelines(converted_lines)
+        f.write(converted_content)
+    os.replace(tmp_file, output_file)
     
     print("\n" + "=" * 50)
     print(f"📊 CONVERSION COMPLETE!")
@@ -71,16 +70,17 @@ def convert_youtube_links_file(input_file, output_file):
     print(f"   python3 process_youtube_batch.py {output_file.replace('.txt', '_clean.txt')} --interactive")
 
 def main():
-    if len(sys.argv) != 3:
-        print("Usage: python3 convert_live_to_video_urls.py <input_file> <output_file>")
+    args = [arg for arg in sys.argv[1:] if arg != '--verbose']
+    verbose = len(args) != len(sys.argv) - 1
+    if len(args) != 2:
+        print("Usage: python3 convert_live_to_video_urls.py <input_file> <output_file> [--verbose]")
         print("Example: python3 convert_live_to_video_urls.py youtube_list_of_links.txt youtube_video_links.txt")
         sys.exit(1)
     
-    input_file = sys.argv[1]
-    output_file = sys.argv[2]
+    input_file, output_file = args
     
     try:
-        convert_youtube_links_file(input_file, output_file)
+        convert_youtube_links_file(input_file, output_file, verbose=verbose)
     except Exception as e:
         print(f"❌ Error: {e}")
         sys.exit(1)
@@ -3,9 +3,10 @@
 Batch process YouTube links with error handling and resume capability
 """
 
+import os
 import sys
-import time
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from youtube_to_context import YouTubeToContextProcessor
 
 try:
@@ -14,54 +15,61 @@ try:
 except ImportError:
     ALIVE_BAR_AVAILABLE = False
 
-def process_batch_with_progress(unique_links, batch_start, batch_size, processor, progress_bar):
-    """Process a batch of links with progress bar updates."""
-    batch_end = min(batch_start + batch_size, len(unique_links))
-    batch_links = unique_links[batch_start:batch_end]
-    
+def iter_batch_results(processor, unique_links, batch_start, batch_size):
+    """
+    Process one batch of links concurrently, yielding (index, link, ok, error) as each finishes.
+    
+    Videos are handled on a thread pool of min(batch_size, CPU count) workers, so
+    downloads overlap with transcription; the processor serializes use of the
+    shared Whisper model. index is the link's 0-based position in unique_links.
+    """
+    batch_links = unique_links[batch_start:batch_start + batch_size]
+    executor = ThreadPoolExecutor(max_workers=max(1, min(len(batch_links), os.cpu_count() or 1)))
+    try:
+        futures = {
+            executor.submit(processor.process_youtube_video, link): (batch_start + i, link)
+            for i, link in enumerate(batch_links)
+        }
+        for future in as_completed(futures):
+            index, link = futures[future]
+            try:
+                ok, error = future.result(), None
+            except Exception as e:
+                ok, error = False, e
+            yield index, link, ok, error
+    finally:
+        # On interrupt, drop the links that have not started yet
+        executor.shutdown(wait=False, cancel_futures=True)
+
+def resume_index(batch_start, batch_size, total, completed):
+    """First index of the current batch that has not finished processing."""
+    pending = set(range(batch_start, min(batch_start + batch_size, total))) - completed
+    return min(pending) if pending else min(batch_start + batch_size, total)
+
+def process_batch_with_progress(unique_links, batch_start, batch_size, processor, progress_bar, completed):
+    """Process a batch of links with progress bar updates, adding finished indices to completed."""
     batch_successful = 0
     batch_failed = 0
     
-    for i, link in enumerate(batch_links):
-        link_index = batch_start + i + 1
-        progress_bar.text(f"Processing {link_index}/{len(unique_links)}: {link[:50]}...")
-        
-        try:
-            if processor.process_youtube_video(link):
-                batch_successful += 1
-            else:
-                batch_failed += 1
-        except KeyboardInterrupt:
-            raise  # Re-raise to handle in main function
-        except Exception as e:
+    for index, link, ok, error in iter_batch_results(processor, unique_links, batch_start, batch_size):
+        completed.add(index)
+        if ok:
+            batch_successful += 1
+        else:
             batch_failed += 1
-        
+        progress_bar.text(f"Finished {index + 1}/{len(unique_links)}: {link[:50]}...")
         progress_bar()  # Update progress bar
-        
-        # Small delay between videos (reduced for progress bar mode)
-        if i < len(batch_links) - 1:
-            time.sleep(1)
-    
-    # Longer pause between batches (reduced for progress bar mode)
-    if batch_end < len(unique_links):
-        time.sleep(3)
     
     return batch_successful, batch_failed
 
 def process_youtube_batch(links_file, start_index=0, batch_size=10, interactive=False):
     """Process YouTube links in batches with resume capability."""
     
-    # Read all links
+    # Read all links, dropping duplicates while preserving order (dicts keep insertion order)
     with open(links_file, 'r', encoding='utf-8') as f:
-        all_links = [line.strip() for line in f if line.strip() and not line.startswith('#')]
-    
-    # Remove duplicates while preserving order
-    seen = set()
-    unique_links = []
-    for link in all_links:
-        if link not in seen:
-            seen.add(link)
-            unique_links.append(link)
+        unique_links = list(dict.fromkeys(
+            link for link in (line.strip() for line in f) if link and not link.startswith('#')
+        ))
     
     print(f"🚀 YOUTUBE BATCH PROCESSOR")
     print(f"=" * 50)
@@ -89,65 +97,52 @@ def process_youtube_batch(links_file, start_index=0, batch_size=10, interactive=
         with alive_bar(total_videos, title="Processing YouTube videos", bar="filling") as bar:
             try:
                 for batch_start in range(start_index, len(unique_links), batch_size):
+                    completed = set()
                     batch_successful, batch_failed = process_batch_with_progress(
-                        unique_links, batch_start, batch_size, processor, bar
+                        unique_links, batch_start, batch_size, processor, bar, completed
                     )
                     total_successful += batch_successful
                     total_failed += batch_failed
             except KeyboardInterrupt:
                 print(f"\n⏹️  Processing interrupted by user")
-                current_index = start_index + total_successful + total_failed
+                current_index = resume_index(batch_start, batch_size, len(unique_links), completed)
                 print(f"📊 Resume with: python3 process_youtube_batch.py {links_file} {current_index}")
                 return total_successful, total_failed
     else:
         # Original batch processing without progress bar
         for batch_start in range(start_index, len(unique_links), batch_size):
             batch_end = min(batch_start + batch_size, len(unique_links))
-            batch_links = unique_links[batch_start:batch_end]
             
             print(f"\n📦 BATCH {(batch_start//batch_size)+1}: Processing links {batch_start+1}-{batch_end}")
             print(f"=" * 40)
             
             batch_successful = 0
             batch_failed = 0
+            completed = set()
             
-            for i, link in enumerate(batch_links):
-                link_index = batch_start + i + 1
-                print(f"\n[{link_index}/{len(unique_links)}] Processing: {link}")
-                
-                try:
-                    if processor.process_youtube_video(link):
+            try:
+                for index, link, ok, error in iter_batch_results(processor, unique_links, batch_start, batch_size):
+                    completed.add(index)
+                    print(f"\n[{index + 1}/{len(unique_links)}] Finished: {link}")
+                    if ok:
                         batch_successful += 1
                         total_successful += 1
                         print(f"✅ Success!")
                     else:
                         batch_failed += 1
                         total_failed += 1
-                        print(f"❌ Failed!")
-                except KeyboardInterrupt:
-                    print(f"\n⏹️  Processing interrupted by user")
-                    print(f"📊 Resume with: python3 process_youtube_batch.py {links_file} {link_index}")
-                    return total_successful, total_failed
-                except Exception as e:
-                    batch_failed += 1
-                    total_failed += 1
-                    print(f"❌ Error: {e}")
-                
-                # Small delay between videos
-                if i < len(batch_links) - 1:
-                    print("⏳ Waiting 3 seconds...")
-                    time.sleep(3)
+                        print(f"❌ Error: {error}" if error else f"❌ Failed!")
+            except KeyboardInterrupt:
+                print(f"\n⏹️  Processing interrupted by user")
+                current_index = resume_index(batch_start, batch_size, len(unique_links), completed)
+                print(f"📊 Resume with: python3 process_youtube_batch.py {links_file} {current_index}")
+                return total_successful, total_failed
             
             # Batch summary
             print(f"\n📊 Batch {(batch_start//batch_size)+1} Summary:")
             print(f"✅ Successful: {batch_successful}")
             print(f"❌ Failed: {batch_failed}")
             print(f"📈 Batch success rate: {(batch_successful/(batch_successful+batch_failed)*100):.1f}%")
-            
-            # Longer pause between batches
-            if batch_end < len(unique_links):
-                print(f"⏳ Pausing 10 seconds before next batch...")
-                time.sleep(10)
     
     # Final summary
     print(f"\n" + "=" * 50)
@@ -8,10 +8,15 @@ with new context JSON files from the context directory.
 
 import os
 import json
-import glob
 from datetime import datetime
 from typing import List, Dict, Any
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class ContextUpdater:
     """
@@ -28,20 +33,66 @@ class ContextUpdater:
         """
         self.context_dir = context_dir
         self.context_txt_path = context_txt_path
+        # Sidecar index of the context files already appended to context.txt
+        self.manifest_path = os.path.splitext(context_txt_path)[0] + ".manifest.json"
         self.processed_files = set()
         
         # Load already processed files if context.txt exists
         self._load_processed_files()
     
     def _load_processed_files(self):
-        """Load the list of already processed files from context.txt."""
+        """Load the list of already processed files from the manifest, or from context.txt."""
+        if not os.path.exists(self.context_txt_path):
+            return
+        if self._load_manifest():
+            return
+        self._scan_context_txt()
+        # Write the manifest so later runs don't have to re-scan context.txt
+        self._save_manifest()
+    
+    def _load_manifest(self) -> bool:
+        """
+        Load processed filenames from the manifest sidecar.
+        
+        Returns:
+            True if the manifest exists and matches the current context.txt
+        """
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not read {self.manifest_path}: {e}")
+            return False
+        # context.txt changed outside this class (e.g. edited by hand); fall back to a scan
+        if manifest.get('context_size') != os.path.getsize(self.context_txt_path):
+            return False
+        self.processed_files = set(manifest.get('files', []))
+        return True
+    
+    def _save_manifest(self):
+        """Atomically rewrite the manifest with the current set of processed files."""
+        tmp_path = self.manifest_path + ".tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'files': sorted(self.processed_files),
+                    'context_size': os.path.getsize(self.context_txt_path)
+                }, f)
+            os.replace(tmp_path, self.manifest_path)
+        except OSError as e:
+            print(f"Warning: Could not write {self.manifest_path}: {e}")
+    
+    def _scan_context_txt(self):
+        """Recover the processed filenames by scanning context.txt."""
         if os.path.exists(self.context_txt_path):
             try:
-                with open(self.context_txt_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                # Stream line by line so the transcriptions are never held in memory at once
+                with open(self.context_txt_path, 'r', buffering=1 << 20, encoding='utf-8') as f:
                     # Extract context filenames that are already in context.txt
                     # This is a simple implementation - you might want to make it more robust
-                    for line in content.split('\n'):
+                    for line in f:
                         if line.startswith('# Context from:'):
                             filename = line.split(':', 1)[1].strip()
                             self.processed_files.add(filename)
@@ -58,17 +109,17 @@ class ContextUpdater:
         if not os.path.exists(self.context_dir):
             return []
         
-        all_context_files = glob.glob(os.path.join(self.context_dir, "context-*.json"))
-        new_files = []
-        
-        for file_path in all_context_files:
-            filename = os.path.basename(file_path)
-            if filename not in self.processed_files:
-                new_files.append(file_path)
+        # One scandir pass; DirEntry.stat() supplies the mtime without a second lookup per file
+        with os.scandir(self.context_dir) as entries:
+            new_files = [
+                (entry.path, entry.stat().st_mtime) for entry in entries
+                if entry.name.startswith("context-") and entry.name.endswith(".json")
+                and entry.name not in self.processed_files and entry.is_file()
+            ]
         
         # Sort by modification time (newest first)
-        new_files.sort(key=lambda x: os.path.getmtime(x), reverse=True)
-        return new_files
+        new_files.sort(key=lambda x: x[1], reverse=True)
+        return [file_path for file_path, _ in new_files]
     
     def load_context_data(self, context_file_path: str) -> Dict[str, Any]:
         """
@@ -81,8 +132,10 @@ class ContextUpdater:
             Dictionary containing context data
         """
         try:
-            with open(context_file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            # Read raw bytes; both parsers decode UTF-8 themselves
+            with open(context_file_path, 'rb') as f:
+                data = f.read()
+            return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
         except Exception as e:
             print(f"Error loading context file {context_file_path}: {e}")
             return {}
@@ -100,22 +153,24 @@ class ContextUpdater:
         """
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
-        entry = f"\n# Context from: {context_filename}\n"
-        entry += f"# Added: {timestamp}\n"
-        entry += f"# Video: {context_data.get('video_filename', 'Unknown')}\n"
-        entry += f"# Source: {context_data.get('video_path', 'Unknown')}\n"
-        entry += "-" * 80 + "\n\n"
+        parts = [
+            f"\n# Context from: {context_filename}\n",
+            f"# Added: {timestamp}\n",
+            f"# Video: {context_data.get('video_filename', 'Unknown')}\n",
+            f"# Source: {context_data.get('video_path', 'Unknown')}\n",
+            "-" * 80 + "\n\n",
+        ]
         
         # Add the transcription content
         transcription = context_data.get('transcription', '')
         if transcription:
-            entry += transcription + "\n\n"
+            parts.append(transcription + "\n\n")
         else:
-            entry += "No transcription available.\n\n"
+            parts.append("No transcription available.\n\n")
         
-        entry += "=" * 80 + "\n"
+        parts.append("=" * 80 + "\n")
         
-        return entry
+        return ''.join(parts)
     
     def update_context_txt(self, new_context_files: List[str]) -> int:
         """
@@ -133,8 +188,8 @@ class ContextUpdater:
         added_count = 0
         
         try:
-            # Open context.txt in append mode
-            with open(self.context_txt_path, 'a', encoding='utf-8') as f:
+            # Open context.txt in append mode; the 1 MiB buffer batches entries into few write() calls
+            with open(self.context_txt_path, 'a', encoding='utf-8', buffering=1 << 20) as f:
                 for context_file_path in new_context_files:
                     try:
                         context_data = self.load_context_data(context_file_path)
@@ -152,8 +207,10 @@ class ContextUpdater:
                             print(f"⚠️  Skipped {context_file_path} (no data)")
                     except Exception as e:
                         print(f"❌ Error processing {context_file_path}: {e}")
+                f.flush()
             
             if added_count > 0:
+                self._save_manifest()
                 print(f"📄 Updated context.txt with {added_count} new entries")
             
         except Exception as e:
@@ -182,11 +239,14 @@ class ContextUpdater:
         if not os.path.exists(self.context_txt_path):
             try:
                 with open(self.context_txt_path, 'w', encoding='utf-8') as f:
-                    f.write("# BrainBoost Context File\n")
-                    f.write("# Generated from YouTube video transcriptions\n")
-                    f.write(f"# Created: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                    f.write("# This file contains transcriptions and metadata from processed videos\n")
-                    f.write("=" * 80 + "\n\n")
+                    f.write(''.join([
+                        "# BrainBoost Context File\n",
+                        "# Generated from YouTube video transcriptions\n",
+                        f"# Created: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+                        "# This file contains transcriptions and metadata from processed videos\n",
+                        "=" * 80 + "\n\n",
+                    ]))
+                self._save_manifest()
                 print(f"✅ Created initial context.txt file")
             except Exception as e:
                 print(f"❌ Error creating context.txt: {e}")
@@ -1,5 +1,21 @@
 #!/usr/bin/env python3
-import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+from youtube_extractor_spanish import extract_spanish
+from youtube_extractor_english import extract_english
+
+# Links processed concurrently; Whisper transcription itself is serialized per model
+MAX_WORKERS = 4
+
+def extract_both(link):
+    # Run the Spanish extractor
+    print(f"Processing Spanish extraction for: {link}")
+    spanish_summary = extract_spanish(link)
+    
+    # Run the English extractor
+    print(f"Processing English extraction for: {link}")
+    english_summary = extract_english(link)
+    return spanish_summary, english_summary
 
 def main():
     links = [
@@ -12,14 +28,14 @@ def main():
         "https://youtube.com/live/3FVJX5v49lo?feature=share"
     ]
 
-    for link in links:
-        # Execute the Spanish extractor script
-        print(f"Processing Spanish extraction for: {link}")
-        subprocess.run(["python3", "youtube_extractor_spanish.py", link], check=True)
-        
-        # Execute the English extractor script
-        print(f"Processing English extraction for: {link}")
-        subprocess.run(["python3", "youtube_extractor_english.py", link], check=True)
+    # The extractors run in this process, so each Whisper model is loaded once
+    # and reused for every link instead of once per subprocess
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        results = list(executor.map(extract_both, links))
+
+    for link, (spanish_summary, english_summary) in zip(links, results):
+        if spanish_summary is None or english_summary is None:
+            print(f"Extraction incomplete for: {link}")
 
 if __name__ == "__main__":
     main()
@@ -5,6 +5,10 @@ import yt_dlp
 import mediapipe as mp
 from collections import defaultdict
 import argparse
+import itertools
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from tqdm import tqdm
 import sys
 
@@ -19,6 +23,76 @@ pose = mp_pose.Pose(static_image_mode=False,
                     min_detection_confidence=0.6,  # Adjusted detection confidence
                     min_tracking_confidence=0.6)    # Adjusted tracking confidence
 
+# Landmark pairs measured on every frame, with the distance below which each pair
+# counts as touching: elbows near the opposite shoulder (arms crossed) and wrists
+# near the same-side hip (hands on hips)
+_LANDMARK = mp_pose.PoseLandmark
+PAIR_FROM = np.array([_LANDMARK.LEFT_ELBOW.value, _LANDMARK.RIGHT_ELBOW.value,
+                      _LANDMARK.LEFT_WRIST.value, _LANDMARK.RIGHT_WRIST.value])
+PAIR_TO = np.array([_LANDMARK.RIGHT_SHOULDER.value, _LANDMARK.LEFT_SHOULDER.value,
+                    _LANDMARK.LEFT_HIP.value, _LANDMARK.RIGHT_HIP.value])
+PAIR_THRESHOLDS = np.array([0.25, 0.25, 0.3, 0.3], dtype=np.float32)
+# Columns of the matrix returned by classify_poses
+GESTURES = ('Arms Crossed', 'Hands on Hips', 'Upright Posture')
+
+def classify_poses(lm_all):
+    """
+    Classify every analyzed frame at once.
+    
+    lm_all is an (F, 33, 2) array of landmark coordinates, NaN for frames without
+    a detected pose (those match nothing). Returns an (F, 3) boolean matrix with
+    one column per GESTURES entry.
+    """
+    diff = lm_all[:, PAIR_FROM] - lm_all[:, PAIR_TO]
+    # Squared distances against squared thresholds, so no square roots are taken
+    close = (diff * diff).sum(axis=2) < PAIR_THRESHOLDS ** 2
+    # Upright: nose above the average y-coordinate of the hips
+    average_hip_y = (lm_all[:, _LANDMARK.LEFT_HIP.value, 1] + lm_all[:, _LANDMARK.RIGHT_HIP.value, 1]) / 2
+    upright = lm_all[:, _LANDMARK.NOSE.value, 1] < average_hip_y - 0.1  # Adjust threshold as needed
+    return np.stack([
+        close[:, 0] & close[:, 1],  # Elbows near the opposite shoulders
+        close[:, 2] & close[:, 3],  # Wrists near the hips
+        upright,
+    ], axis=1)
+
+class FrameWriter:
+    """
+    Writes frames as JPEG files on background threads.
+    
+    cv2.imwrite releases the GIL while it encodes and writes, so saving overlaps
+    with reading the next frames and running pose inference. At most max_pending
+    frames wait to be written at any time.
+    """
+    def __init__(self, max_workers=4, max_pending=64):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+        self.failed = 0
+
+    def write(self, path, frame):
+        """Queue frame to be written to path; the caller must not modify frame afterwards."""
+        self._slots.acquire()
+        future = self._executor.submit(cv2.imwrite, path, frame)
+        future.add_done_callback(self._done)
+
+    def _done(self, future):
+        self._slots.release()
+        if future.exception() is not None or not future.result():
+            with self._lock:
+                self.failed += 1
+
+    def close(self):
+        """Wait for every queued frame to be written."""
+        self._executor.shutdown(wait=True)
+        if self.failed:
+            print(f"Warning: {self.failed} frames could not be saved.")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
 def download_hook(d):
     if d['status'] == 'downloading':
         total_bytes = d.get('total_bytes') or d.get('total_bytes_estimate')
@@ -81,10 +155,10 @@ def download_youtube_video(url, download_path='videos'):
         print(f"Error retrieving video information: {e}")
         sys.exit(1)
 
-def extract_frames(video_path, max_frames=None, frame_interval=5):
+def iter_frames(video_path, max_frames=None, frame_interval=5, save_frames=False):
     """
-    Extract frames from the video with a progress bar, sampling every 'frame_interval' frames.
-    Saves all extracted frames for manual inspection.
+    Yield every 'frame_interval'-th frame of the video, at most 'max_frames' of them.
+    Saves each yielded frame for manual inspection if 'save_frames' is True.
     """
     cap = cv2.VideoCapture(video_path)
     if not cap.isOpened():
@@ -99,51 +173,120 @@ def extract_frames(video_path, max_frames=None, frame_interval=5):
     print(f"Total Frames: {total_frames}")
     print(f"Duration (seconds): {duration_sec}")
     
-    frames = []
-    
     # Directory to save all extracted frames
     extracted_dir = 'extracted_frames'
-    if not os.path.exists(extracted_dir):
+    if save_frames and not os.path.exists(extracted_dir):
         os.makedirs(extracted_dir)
     
-    # Initialize the tqdm progress bar
-    frames_to_extract = total_frames // frame_interval if not max_frames else min(max_frames, total_frames // frame_interval)
-    with tqdm(total=frames_to_extract, desc='Extracting Frames', unit='frame', ascii=True) as bar:
-        count = 0
-        extracted = 0
-        while cap.isOpened():
-            ret, frame = cap.read()
-            if not ret:
-                break
-            if count % frame_interval == 0:
-                frames.append(frame)
-                # Save the frame for manual inspection
-                frame_filename = f"frame_{count}.jpg"
-                cv2.imwrite(os.path.join(extracted_dir, frame_filename), frame)
-                extracted += 1
-                bar.update(1)
-                if max_frames and extracted >= max_frames:
-                    break
-            count += 1
+    try:
+        with FrameWriter() as writer:
+            count = 0
+            extracted = 0
+            # grab() only demuxes; the skipped frames are never decoded to BGR
+            while cap.grab():
+                if count % frame_interval == 0:
+                    ret, frame = cap.retrieve()
+                    if not ret:
+                        break
+                    if save_frames:
+                        # Save the frame for manual inspection
+                        frame_filename = f"frame_{count}.jpg"
+                        writer.write(os.path.join(extracted_dir, frame_filename), frame)
+                    extracted += 1
+                    yield frame
+                    if max_frames and extracted >= max_frames:
+                        break
+                count += 1
+    finally:
+        cap.release()
+
+def count_sampled_frames(video_path, max_frames=None, frame_interval=5):
+    """
+    Estimated number of frames iter_frames will yield, from the container's frame count.
+    Only good for sizing progress bars: many webm/VFR files report 0 and still decode.
+    Returns None when the count is unknown.
+    """
+    cap = cv2.VideoCapture(video_path)
+    total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT)) if cap.isOpened() else 0
     cap.release()
-    print(f"Extracted and saved {len(frames)} frames to the '{extracted_dir}' directory.")
+    if total_frames <= 0:
+        return None
+    sampled = -(-total_frames // frame_interval)
+    return min(max_frames, sampled) if max_frames else sampled
+
+def extract_frames(video_path, max_frames=None, frame_interval=5):
+    """
+    Extract frames from the video with a progress bar, sampling every 'frame_interval' frames.
+    Saves all extracted frames for manual inspection.
+    """
+    frames_to_extract = count_sampled_frames(video_path, max_frames, frame_interval)
+    with tqdm(total=frames_to_extract, desc='Extracting Frames', unit='frame', ascii=True) as bar:
+        frames = []
+        for frame in iter_frames(video_path, max_frames, frame_interval, save_frames=True):
+            frames.append(frame)
+            bar.update(1)
+    print(f"Extracted and saved {len(frames)} frames to the 'extracted_frames' directory.")
     return frames
 
-def analyze_body_language(frames, save_annotated=True):
+def read_ahead(iterable, maxsize=16):
+    """
+    Consume 'iterable' on a background thread, yielding its items through a bounded
+    queue so that, e.g., frame decoding overlaps with pose inference in the caller.
+    Errors raised by the iterable are re-raised in the caller.
+    """
+    items = queue.Queue(maxsize=maxsize)
+    done = object()
+    stop = threading.Event()
+
+    def produce():
+        outcome = done
+        try:
+            for item in iterable:
+                if stop.is_set():
+                    break
+                items.put(item)
+        except BaseException as e:  # includes sys.exit() from the reader
+            outcome = e
+        items.put(outcome)
+
+    reader = threading.Thread(target=produce, daemon=True)
+    reader.start()
+    try:
+        while (item := items.get()) is not done:
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        # Unblock the reader if we stopped early, then wait for it
+        stop.set()
+        while reader.is_alive():
+            try:
+                items.get(timeout=0.1)
+            except queue.Empty:
+                pass
+
+def analyze_body_language(frames, save_annotated=True, total_frames=None):
     """
     Analyze body language using pose landmarks with a progress bar.
     Returns a summary of detected gestures/postures.
     Saves annotated frames if 'save_annotated' is True.
+    'frames' may be any iterable (e.g. a read_ahead stream); 'total_frames' sizes
+    the progress bar when it has no len().
     """
     analysis = defaultdict(int)
-    total_frames = len(frames)
+    if total_frames is None and hasattr(frames, '__len__'):
+        total_frames = len(frames)
+    # One (33, 2) landmark array per frame, NaN where no pose was detected
+    no_pose = np.full((len(_LANDMARK), 2), np.nan, dtype=np.float32)
+    landmark_rows = []
     
     # Directory to save all annotated frames
     annotated_dir = 'annotated_frames'
     if not os.path.exists(annotated_dir):
         os.makedirs(annotated_dir)
     
-    with tqdm(total=total_frames, desc='Analyzing Frames', unit='frame', ascii=True) as bar:
+    with tqdm(total=total_frames, desc='Analyzing Frames', unit='frame', ascii=True) as bar, \
+            FrameWriter() as writer:
         for idx, frame in enumerate(frames):
             # Convert the BGR image to RGB before processing.
             image_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
@@ -164,53 +307,32 @@ def analyze_body_language(frames, save_annotated=True):
                     mp_drawing.DrawingSpec(color=(0, 0, 255), thickness=2)
                 )
 
-                # Example Analysis 1: Arms Crossed
-                left_shoulder = landmarks[mp_pose.PoseLandmark.LEFT_SHOULDER.value]
-                right_shoulder = landmarks[mp_pose.PoseLandmark.RIGHT_SHOULDER.value]
-                left_elbow = landmarks[mp_pose.PoseLandmark.LEFT_ELBOW.value]
-                right_elbow = landmarks[mp_pose.PoseLandmark.RIGHT_ELBOW.value]
-
-                # Simple heuristic: If left elbow is near right shoulder and vice versa
-                distance_lr = np.sqrt((left_elbow.x - right_shoulder.x)**2 + (left_elbow.y - right_shoulder.y)**2)
-                distance_rl = np.sqrt((right_elbow.x - left_shoulder.x)**2 + (right_elbow.y - left_shoulder.y)**2)
-                if distance_lr < 0.25 and distance_rl < 0.25:  # Further increased threshold
-                    analysis['Arms Crossed'] += 1
-                    print(f"Frame {idx}: Arms Crossed detected.")
-
-                # Example Analysis 2: Hands on Hips
-                left_wrist = landmarks[mp_pose.PoseLandmark.LEFT_WRIST.value]
-                right_wrist = landmarks[mp_pose.PoseLandmark.RIGHT_WRIST.value]
-                left_hip = landmarks[mp_pose.PoseLandmark.LEFT_HIP.value]
-                right_hip = landmarks[mp_pose.PoseLandmark.RIGHT_HIP.value]
-
-                distance_lw = np.sqrt((left_wrist.x - left_hip.x)**2 + (left_wrist.y - left_hip.y)**2)
-                distance_rw = np.sqrt((right_wrist.x - right_hip.x)**2 + (right_wrist.y - right_hip.y)**2)
-                if distance_lw < 0.3 and distance_rw < 0.3:  # Further increased threshold
-                    analysis['Hands on Hips'] += 1
-                    print(f"Frame {idx}: Hands on Hips detected.")
-
-                # Example Analysis 3: Upright Posture
-                nose = landmarks[mp_pose.PoseLandmark.NOSE.value]
-                left_hip = landmarks[mp_pose.PoseLandmark.LEFT_HIP.value]
-                right_hip = landmarks[mp_pose.PoseLandmark.RIGHT_HIP.value]
-
-                # Calculate the average y-coordinate of hips
-                average_hip_y = (left_hip.y + right_hip.y) / 2
-                if nose.y < average_hip_y - 0.1:  # Adjust threshold as needed
-                    analysis['Upright Posture'] += 1
-                    print(f"Frame {idx}: Upright Posture detected.")
+                # Landmarks are collected here and classified for all frames after the loop
+                landmark_rows.append(np.fromiter((v for p in landmarks for v in (p.x, p.y)),
+                                                 dtype=np.float32, count=2 * len(landmarks)).reshape(-1, 2))
             else:
                 print(f"Frame {idx}: No pose detected.")
+                landmark_rows.append(no_pose)
 
             # Save the annotated frame
             if save_annotated:
                 annotated_frame_path = os.path.join(annotated_dir, f"frame_{idx}.jpg")
-                cv2.imwrite(annotated_frame_path, annotated_frame)
+                writer.write(annotated_frame_path, annotated_frame)
 
             bar.update(1)
 
+    analyzed_frames = len(landmark_rows)
+    if not analyzed_frames:
+        return {}
+    detections = classify_poses(np.stack(landmark_rows))
+    for idx, gesture_idx in zip(*np.nonzero(detections)):
+        print(f"Frame {idx}: {GESTURES[gesture_idx]} detected.")
+    for gesture, count in zip(GESTURES, detections.sum(axis=0)):
+        if count:
+            analysis[gesture] += int(count)
+
     # Convert counts to percentages
-    summary = {k: f"{(v / total_frames) * 100:.2f}%" for k, v in analysis.items()}
+    summary = {k: f"{(v / analyzed_frames) * 100:.2f}%" for k, v in analysis.items()}
     print(f"Analysis Summary: {summary}")
     return summary
 
@@ -229,17 +351,29 @@ def generate_report(analysis, report_path='body_language_report.txt'):
         print(f"Error writing report: {e}")
         sys.exit(1)
 
-def main(youtube_url):
+def main(youtube_url, debug_frames=False):
     video_path = download_youtube_video(youtube_url)
-    frames = extract_frames(video_path, frame_interval=5)  # Adjust 'frame_interval' as needed
-    if not frames:
+    frame_interval = 5  # Adjust 'frame_interval' as needed
+    # Frames are decoded on a background thread while earlier ones go through pose
+    # inference; annotated frames are written by FrameWriter threads.
+    # Raw frames are only dumped to extracted_frames/ when debugging; the annotated
+    # copies written during analysis are the normal output
+    frames = read_ahead(iter_frames(video_path, frame_interval=frame_interval,
+                                    save_frames=debug_frames))
+    first_frame = next(frames, None)
+    if first_frame is None:
         print("No frames were extracted. Exiting.")
         sys.exit(1)
-    analysis = analyze_body_language(frames)
+    analysis = analyze_body_language(
+        itertools.chain([first_frame], frames),
+        total_frames=count_sampled_frames(video_path, frame_interval=frame_interval)
+    )
     generate_report(analysis)
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='YouTube Body Language Analyzer')
     parser.add_argument('url', type=str, help='YouTube video URL to analyze')
+    parser.add_argument('--debug-frames', action='store_true',
+                        help="Also save every raw sampled frame to 'extracted_frames/'")
     args = parser.parse_args()
-    main(args.url)
+    main(args.url, debug_frames=args.debug_frames)
@@ -1,30 +1,43 @@
 import os
 import re
+import subprocess
 import sys
-import glob
 import tempfile
+import threading
 import time
 from datetime import datetime
 from yt_dlp import YoutubeDL
+import numpy as np
 import whisper
+import torch
 from transformers import pipeline
 import logging
-from pydub import AudioSegment  # Used to convert audio format
 
 # ---------------------------- Configuration ---------------------------- #
 
 # Whisper model size: choose among 'tiny', 'base', 'small', 'medium', 'large'
 WHISPER_MODEL_SIZE = 'base'  # Adjust based on your system's capabilities
+# Run Whisper on the GPU in FP16 when one is available
+WHISPER_DEVICE = 'cuda' if torch.cuda.is_available() else 'cpu'
 
 # Summarization models
 ENGLISH_SUMMARIZATION_MODEL = "facebook/bart-large-cnn"
 
-# Logging configuration
-logging.basicConfig(
-    filename='single_video_summary_english.log',
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
+# Logging configuration; the file handler is attached by configure_logging() on first
+# use, so importing this module leaves the root logger alone
+LOG_FILE = 'single_video_summary_english.log'
+logger = logging.getLogger('youtube_extractor_english')
+_logging_lock = threading.Lock()
+
+# The Whisper model is loaded once per process (see load_whisper_model)
+_whisper_model = None
+_whisper_lock = threading.Lock()
+# model.transcribe installs KV-cache hooks on the model, so calls on the same
+# model must not run in parallel
+_transcribe_lock = threading.Lock()
+# Summarization pipelines, keyed by model name
+_summarizers = {}
+_summarizer_lock = threading.Lock()
 
 # ------------------------ Helper Functions ----------------------------- #
 
@@ -61,52 +74,91 @@ def download_audio(video_url, download_path, max_retries=3):
         try:
             with YoutubeDL(ydl_opts) as ydl:
                 info_dict = ydl.extract_info(video_url, download=True)
-                logging.info(f"Downloaded video info for {video_url}: {info_dict.get('title', 'Unknown Title')}")
-            # After download, find the mp3 file in the download folder
-            mp3_files = glob.glob(os.path.join(download_path, "*.mp3"))
-            if mp3_files:
-                audio_file = mp3_files[0]
-                logging.info(f"Found audio file: {audio_file}")
+                logger.info(f"Downloaded video info for {video_url}: {info_dict.get('title', 'Unknown Title')}")
+            # The ExtractAudio postprocessor records the final .mp3 path on the info dict
+            downloads = info_dict.get('requested_downloads') or [{}]
+            audio_file = downloads[-1].get('filepath') or os.path.join(download_path, f"{info_dict['id']}.mp3")
+            if os.path.exists(audio_file):
+                logger.info(f"Found audio file: {audio_file}")
                 return audio_file
             else:
-                logging.error("No MP3 file was found after download.")
+                logger.error("No MP3 file was found after download.")
                 return None
         except Exception as e:
             attempt += 1
-            logging.error(f"Attempt {attempt} - Error downloading {video_url}: {e}")
+            logger.error(f"Attempt {attempt} - Error downloading {video_url}: {e}")
             if attempt < max_retries:
                 time.sleep(3)  # Wait a bit before retrying
             else:
                 return None
 
-def convert_to_mono_wav(mp3_path, output_path):
+def decode_to_mono_array(mp3_path):
     """
-    Convert an MP3 file to a mono WAV file.
+    Decode an audio file with ffmpeg into a 16 kHz mono float32 array.
     """
     try:
-        audio = AudioSegment.from_mp3(mp3_path)
-        audio = audio.set_channels(1)  # Convert to mono
-        audio.export(output_path, format="wav")
-        logging.info(f"Converted {mp3_path} to mono WAV at {output_path}.")
-        return output_path
-    except Exception as e:
-        logging.error(f"Error converting {mp3_path} to WAV: {e}")
+        # ffmpeg decodes, downmixes and resamples to Whisper's input format in one
+        # process; the samples come back over the pipe with no intermediate WAV file
+        proc = subprocess.run(
+            ['ffmpeg', '-nostdin', '-loglevel', 'error', '-i', mp3_path,
+             '-vn', '-ac', '1', '-ar', str(whisper.audio.SAMPLE_RATE), '-f', 'f32le', '-'],
+            check=True, capture_output=True
+        )
+        audio = np.frombuffer(proc.stdout, np.float32)
+        logger.info(f"Decoded {mp3_path} to 16 kHz mono audio.")
+        return audio
+    except (OSError, subprocess.CalledProcessError) as e:
+        logger.error(f"Error decoding {mp3_path}: {e}")
         return None
 
-def transcribe_audio(audio_path, model):
+def configure_logging():
+    """Send this module's log records to LOG_FILE; safe to call more than once."""
+    with _logging_lock:
+        if not logger.handlers:
+            handler = logging.FileHandler(LOG_FILE, encoding='utf-8')
+            handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+            logger.addHandler(handler)
+            logger.setLevel(logging.INFO)
+            logger.propagate = False
+
+def load_whisper_model():
+    """
+    Load the Whisper model on first use and reuse it afterwards, so several
+    extractions in the same process don't reload it.
+    """
+    global _whisper_model
+    with _whisper_lock:
+        if _whisper_model is None:
+            print(f"Loading Whisper model ({WHISPER_MODEL_SIZE})...")
+            logger.info(f"Loading Whisper model '{WHISPER_MODEL_SIZE}'.")
+            model = whisper.load_model(WHISPER_MODEL_SIZE, device=WHISPER_DEVICE)
+            _whisper_model = model
+        return _whisper_model
+
+def load_summarizer(model_name):
+    """
+    Build the summarization pipeline for 'model_name' on first use and reuse it afterwards.
+    """
+    with _summarizer_lock:
+        if model_name not in _summarizers:
+            _summarizers[model_name] = pipeline("summarization", model=model_name)
+        return _summarizers[model_name]
+
+def transcribe_audio(audio, model):
     """
     Transcribe audio to text using Whisper.
     Returns both the transcript and the detected language code.
     """
     try:
         # Specify language to improve accuracy
-        result = model.transcribe(audio_path, language="en")
+        with _transcribe_lock:
+            result = model.transcribe(audio, language="en", fp16=(WHISPER_DEVICE == 'cuda'))
         transcript = result.get('text', "")
         language = result.get('language', "en")
-        logging.info(f"Transcribed audio file {audio_path} with detected language: {language}.")
+        logger.info(f"Transcribed {len(audio) / whisper.audio.SAMPLE_RATE:.1f} s of audio with detected language: {language}.")
         return transcript, language
     except Exception as e:
-        logging.error(f"Error transcribing {audio_path}: {e}")
+        logger.error(f"Error transcribing audio: {e}")
         return "", "en"
 
 def summarize_text(text, summarizer):
@@ -122,22 +174,21 @@ def summarize_text(text, summarizer):
             summary = summarizer(chunk, max_length=150, min_length=40, do_sample=False)[0]['summary_text']
             summaries.append(summary)
         full_summary = ' '.join(summaries)
-        logging.info("Generated summary for transcript.")
+        logger.info("Generated summary for transcript.")
         return full_summary
     except Exception as e:
-        logging.error(f"Error summarizing text: {e}")
+        logger.error(f"Error summarizing text: {e}")
         return ""
 
 # --------------------------- Main Script ------------------------------- #
 
-def main():
-    if len(sys.argv) != 2:
-        print("Usage: python youtube_extractor_english.py <YouTube_Video_URL>")
-        print("Example: python youtube_extractor_english.py https://www.youtube.com/watch?v=1234567890A")
-        sys.exit(1)
-    
-    video_url = sys.argv[1]
-    logging.info(f"Started processing video URL: '{video_url}'.")
+def extract_english(video_url):
+    """
+    Download, transcribe and summarize a YouTube video in English.
+    Returns the path of the saved summary file, or None if any step failed.
+    """
+    configure_logging()
+    logger.info(f"Started processing video URL: '{video_url}'.")
     
     # Fetch video information (e.g., title) using yt-dlp
     try:
@@ -146,8 +197,8 @@ def main():
             video_title = info_dict.get('title', 'Unknown_Video')
     except Exception as e:
         print(f"Error fetching video info for {video_url}: {e}")
-        logging.error(f"Error fetching video info for {video_url}: {e}")
-        sys.exit(1)
+        logger.error(f"Error fetching video info for {video_url}: {e}")
+        return None
     
     print(f"Processing Video: {video_title}")
     print(f"URL: {video_url}")
@@ -158,10 +209,8 @@ def main():
     summary_filename = f"{sanitized_title}-{timestamp}.txt"
     summary_filepath = os.path.join(os.getcwd(), summary_filename)
     
-    # Load the Whisper model for transcription
-    print(f"Loading Whisper model ({WHISPER_MODEL_SIZE})...")
-    logging.info(f"Loading Whisper model '{WHISPER_MODEL_SIZE}'.")
-    whisper_model = whisper.load_model(WHISPER_MODEL_SIZE)
+    # Load (or reuse) the Whisper model for transcription
+    whisper_model = load_whisper_model()
     
     # Create a temporary folder to store the downloaded audio
     with tempfile.TemporaryDirectory() as tmpdirname:
@@ -169,49 +218,43 @@ def main():
         audio_file = download_audio(video_url, tmpdirname)
         if audio_file:
             print(f"Downloaded audio to {audio_file}")
-            logging.info(f"Successfully downloaded audio to {audio_file}.")
-
-            # Convert MP3 to mono WAV for better transcription accuracy
-            wav_path = os.path.join(tmpdirname, "audio_mono.wav")
-            converted_audio = convert_to_mono_wav(audio_file, wav_path)
-            if not converted_audio:
-                print("Failed to convert audio to WAV. Exiting.")
-                logging.error("Audio conversion failed.")
-                sys.exit(1)
+            logger.info(f"Successfully downloaded audio to {audio_file}.")
+
+            # Decode to 16 kHz mono in memory, ready for Whisper
+            audio = decode_to_mono_array(audio_file)
+            if audio is None:
+                print("Failed to decode audio. Exiting.")
+                logger.error("Audio decoding failed.")
+                return None
             
-            # Check audio file duration
-            try:
-                audio = AudioSegment.from_wav(converted_audio)
-                duration = audio.duration_seconds
-                print(f"Audio duration (s): {duration:.1f}")
-                logging.info(f"Audio duration: {duration:.1f} seconds")
-            except Exception as e:
-                logging.error(f"Could not determine audio duration: {e}")
+            duration = len(audio) / whisper.audio.SAMPLE_RATE
+            print(f"Audio duration (s): {duration:.1f}")
+            logger.info(f"Audio duration: {duration:.1f} seconds")
             
             # Transcribe the downloaded audio using Whisper
-            transcript, lang = transcribe_audio(converted_audio, whisper_model)
+            transcript, lang = transcribe_audio(audio, whisper_model)
             if transcript.strip():
                 print("Transcription completed.")
-                logging.info("Transcription completed successfully.")
+                logger.info("Transcription completed successfully.")
                 
                 # Load the appropriate summarization model based on detected language
                 if lang == "es":
                     print("Detected Spanish audio; loading Spanish summarization model...")
-                    logging.info("Detected language: Spanish. Using Spanish summarization model.")
-                    summarizer = pipeline("summarization", model="mrm8488/bert2bert_shared-spanish-finetuned-summarization")
+                    logger.info("Detected language: Spanish. Using Spanish summarization model.")
+                    summarizer = load_summarizer("mrm8488/bert2bert_shared-spanish-finetuned-summarization")
                 else:
                     print("Using English summarization model...")
-                    logging.info("Using English summarization model.")
-                    summarizer = pipeline("summarization", model=ENGLISH_SUMMARIZATION_MODEL)
+                    logger.info("Using English summarization model.")
+                    summarizer = load_summarizer(ENGLISH_SUMMARIZATION_MODEL)
                 
                 # Summarize the transcript text
                 print("Generating summary...")
-                logging.info("Starting summarization of transcript.")
+                logger.info("Starting summarization of transcript.")
                 summary = summarize_text(transcript, summarizer)
                 
                 if not summary.strip():
                     print("Summary generation failed or returned empty. Exiting.")
-                    logging.warning("Summary was empty after summarization.")
+                    logger.warning("Summary was empty after summarization.")
                     summary = "No summary was generated."
                 
                 print("\n--- Summary ---\n")
@@ -234,16 +277,27 @@ def main():
                     with open(summary_filepath, 'w', encoding='utf-8') as f:
                         f.write(file_content)
                     print(f"\nSummary saved to '{summary_filename}'.")
-                    logging.info(f"Summary saved to '{summary_filepath}'.")
+                    logger.info(f"Summary saved to '{summary_filepath}'.")
+                    return summary_filepath
                 except Exception as e:
                     print(f"Error saving summary to file: {e}")
-                    logging.error(f"Error saving file '{summary_filepath}': {e}")
+                    logger.error(f"Error saving file '{summary_filepath}': {e}")
             else:
                 print("No transcript was generated. Exiting.")
-                logging.warning("Transcript was empty after audio processing.")
+                logger.warning("Transcript was empty after audio processing.")
         else:
             print("Failed to download audio. Exiting.")
-            logging.error("Audio download failed for the provided video URL.")
+            logger.error("Audio download failed for the provided video URL.")
+    return None
+
+def main():
+    if len(sys.argv) != 2:
+        print("Usage: python youtube_extractor_english.py <YouTube_Video_URL>")
+        print("Example: python youtube_extractor_english.py https://www.youtube.com/watch?v=1234567890A")
+        sys.exit(1)
+    
+    if extract_english(sys.argv[1]) is None:
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
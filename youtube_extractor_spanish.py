@@ -1,30 +1,40 @@
 #!/usr/bin/env python3
 import os
 import re
+import subprocess
 import sys
-import glob
 import tempfile
+import threading
 import time
 from datetime import datetime
 from yt_dlp import YoutubeDL
+import numpy as np
 import whisper
+import torch
 from sumy.parsers.plaintext import PlaintextParser
 from sumy.nlp.tokenizers import Tokenizer
 from sumy.summarizers.lex_rank import LexRankSummarizer
 import logging
-from pydub import AudioSegment  # Usado para convertir el formato de audio
 
 # ---------------------------- Configuración ---------------------------- #
 
 # Tamaño del modelo Whisper: elegir entre 'tiny', 'base', 'small', 'medium', 'large'
 WHISPER_MODEL_SIZE = 'base'  # Ajusta según las capacidades de tu sistema
+# Ejecutar Whisper en la GPU con FP16 cuando haya una disponible
+WHISPER_DEVICE = 'cuda' if torch.cuda.is_available() else 'cpu'
 
-# Configuración de logging
-logging.basicConfig(
-    filename='single_video_summary_spanish.log',
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
+# Configuración de logging; configure_logging() añade el manejador de archivo en el primer
+# uso, así que importar este módulo no modifica el logger raíz
+LOG_FILE = 'single_video_summary_spanish.log'
+logger = logging.getLogger('youtube_extractor_spanish')
+_logging_lock = threading.Lock()
+
+# El modelo Whisper se carga una sola vez por proceso (ver load_whisper_model)
+_whisper_model = None
+_whisper_lock = threading.Lock()
+# model.transcribe instala hooks de caché KV en el modelo, así que las llamadas
+# sobre el mismo modelo no pueden ejecutarse en paralelo
+_transcribe_lock = threading.Lock()
 
 # ------------------------ Funciones Auxiliares ----------------------------- #
 
@@ -61,52 +71,82 @@ def download_audio(video_url, download_path, max_retries=3):
         try:
             with YoutubeDL(ydl_opts) as ydl:
                 info_dict = ydl.extract_info(video_url, download=True)
-                logging.info(f"Descargado info del video para {video_url}: {info_dict.get('title', 'Título Desconocido')}")
-            # Después de la descarga, encuentra el archivo mp3 en la carpeta de descarga
-            mp3_files = glob.glob(os.path.join(download_path, "*.mp3"))
-            if mp3_files:
-                audio_file = mp3_files[0]
-                logging.info(f"Archivo de audio encontrado: {audio_file}")
+                logger.info(f"Descargado info del video para {video_url}: {info_dict.get('title', 'Título Desconocido')}")
+            # El postprocesador ExtractAudio guarda la ruta final del .mp3 en info_dict
+            downloads = info_dict.get('requested_downloads') or [{}]
+            audio_file = downloads[-1].get('filepath') or os.path.join(download_path, f"{info_dict['id']}.mp3")
+            if os.path.exists(audio_file):
+                logger.info(f"Archivo de audio encontrado: {audio_file}")
                 return audio_file
             else:
-                logging.error("No se encontró ningún archivo MP3 después de la descarga.")
+                logger.error("No se encontró ningún archivo MP3 después de la descarga.")
                 return None
         except Exception as e:
             attempt += 1
-            logging.error(f"Intento {attempt} - Error al descargar {video_url}: {e}")
+            logger.error(f"Intento {attempt} - Error al descargar {video_url}: {e}")
             if attempt < max_retries:
                 time.sleep(3)  # Espera un poco antes de reintentar
             else:
                 return None
 
-def convert_to_mono_wav(mp3_path, output_path):
+def decode_to_mono_array(mp3_path):
     """
-    Convierte un archivo MP3 a un archivo WAV mono.
+    Decodifica un archivo de audio con ffmpeg a un arreglo float32 mono de 16 kHz.
     """
     try:
-        audio = AudioSegment.from_mp3(mp3_path)
-        audio = audio.set_channels(1)  # Convierte a mono
-        audio.export(output_path, format="wav")
-        logging.info(f"Convertido {mp3_path} a WAV mono en {output_path}.")
-        return output_path
-    except Exception as e:
-        logging.error(f"Error al convertir {mp3_path} a WAV: {e}")
+        # ffmpeg decodifica, mezcla a mono y remuestrea al formato que usa Whisper
+        # en un solo proceso; las muestras llegan por la tubería sin archivo WAV intermedio
+        proc = subprocess.run(
+            ['ffmpeg', '-nostdin', '-loglevel', 'error', '-i', mp3_path,
+             '-vn', '-ac', '1', '-ar', str(whisper.audio.SAMPLE_RATE), '-f', 'f32le', '-'],
+            check=True, capture_output=True
+        )
+        audio = np.frombuffer(proc.stdout, np.float32)
+        logger.info(f"Decodificado {mp3_path} a audio mono de 16 kHz.")
+        return audio
+    except (OSError, subprocess.CalledProcessError) as e:
+        logger.error(f"Error al decodificar {mp3_path}: {e}")
         return None
 
-def transcribe_audio(audio_path, model):
+def configure_logging():
+    """Envía los registros de este módulo a LOG_FILE; se puede llamar más de una vez."""
+    with _logging_lock:
+        if not logger.handlers:
+            handler = logging.FileHandler(LOG_FILE, encoding='utf-8')
+            handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+            logger.addHandler(handler)
+            logger.setLevel(logging.INFO)
+            logger.propagate = False
+
+def load_whisper_model():
+    """
+    Carga el modelo Whisper la primera vez que se llama y lo reutiliza en las siguientes,
+    para que varias extracciones en el mismo proceso no lo vuelvan a cargar.
+    """
+    global _whisper_model
+    with _whisper_lock:
+        if _whisper_model is None:
+            print(f"Cargando modelo Whisper ({WHISPER_MODEL_SIZE})...")
+            logger.info(f"Cargando modelo Whisper '{WHISPER_MODEL_SIZE}'.")
+            model = whisper.load_model(WHISPER_MODEL_SIZE, device=WHISPER_DEVICE)
+            _whisper_model = model
+        return _whisper_model
+
+def transcribe_audio(audio, model):
     """
     Transcribe el audio a texto usando Whisper.
     Devuelve tanto la transcripción como el código del idioma detectado.
     """
     try:
         # Especifica el idioma para mejorar la precisión
-        result = model.transcribe(audio_path, language="es")
+        with _transcribe_lock:
+            result = model.transcribe(audio, language="es", fp16=(WHISPER_DEVICE == 'cuda'))
         transcript = result.get('text', "")
         language = result.get('language', "es")
-        logging.info(f"Transcrito el archivo de audio {audio_path} con idioma detectado: {language}.")
+        logger.info(f"Transcritos {len(audio) / whisper.audio.SAMPLE_RATE:.1f} s de audio con idioma detectado: {language}.")
         return transcript, language
     except Exception as e:
-        logging.error(f"Error al transcribir {audio_path}: {e}")
+        logger.error(f"Error al transcribir el audio: {e}")
         return "", "es"
 
 def summarize_text_sumy(text, sentence_count=5):
@@ -118,22 +158,21 @@ def summarize_text_sumy(text, sentence_count=5):
         summarizer = LexRankSummarizer()
         summary = summarizer(parser.document, sentences_count=sentence_count)
         summary_text = ' '.join([str(sentence) for sentence in summary])
-        logging.info("Resumen generado utilizando sumy.")
+        logger.info("Resumen generado utilizando sumy.")
         return summary_text
     except Exception as e:
-        logging.error(f"Error al resumir el texto con sumy: {e}")
+        logger.error(f"Error al resumir el texto con sumy: {e}")
         return ""
 
 # --------------------------- Script Principal ------------------------------- #
 
-def main():
-    if len(sys.argv) != 2:
-        print("Uso: python youtube_extractor_spanish.py <URL_de_YouTube>")
-        print("Ejemplo: python youtube_extractor_spanish.py https://www.youtube.com/watch?v=1234567890A")
-        sys.exit(1)
-    
-    video_url = sys.argv[1]
-    logging.info(f"Iniciado procesamiento de la URL del video: '{video_url}'.")
+def extract_spanish(video_url):
+    """
+    Descarga, transcribe y resume un video de YouTube en español.
+    Devuelve la ruta del archivo de resumen guardado, o None si falló algún paso.
+    """
+    configure_logging()
+    logger.info(f"Iniciado procesamiento de la URL del video: '{video_url}'.")
     
     # Obtiene la información del video (por ejemplo, el título) usando yt-dlp
     try:
@@ -142,8 +181,8 @@ def main():
             video_title = info_dict.get('title', 'Título_Desconocido')
     except Exception as e:
         print(f"Error al obtener la información del video para {video_url}: {e}")
-        logging.error(f"Error al obtener la información del video para {video_url}: {e}")
-        sys.exit(1)
+        logger.error(f"Error al obtener la información del video para {video_url}: {e}")
+        return None
     
     print(f"Procesando Video: {video_title}")
     print(f"URL: {video_url}")
@@ -154,10 +193,8 @@ def main():
     summary_filename = f"{sanitized_title}-{timestamp}.txt"
     summary_filepath = os.path.join(os.getcwd(), summary_filename)
     
-    # Carga el modelo Whisper para la transcripción
-    print(f"Cargando modelo Whisper ({WHISPER_MODEL_SIZE})...")
-    logging.info(f"Cargando modelo Whisper '{WHISPER_MODEL_SIZE}'.")
-    whisper_model = whisper.load_model(WHISPER_MODEL_SIZE)
+    # Carga (o reutiliza) el modelo Whisper para la transcripción
+    whisper_model = load_whisper_model()
     
     # Crea una carpeta temporal para almacenar el audio descargado
     with tempfile.TemporaryDirectory() as tmpdirname:
@@ -165,39 +202,33 @@ def main():
         audio_file = download_audio(video_url, tmpdirname)
         if audio_file:
             print(f"Audio descargado en {audio_file}")
-            logging.info(f"Audio descargado exitosamente en {audio_file}.")
+            logger.info(f"Audio descargado exitosamente en {audio_file}.")
             
-            # Convierte MP3 a WAV mono para mejorar la precisión de la transcripción
-            wav_path = os.path.join(tmpdirname, "audio_mono.wav")
-            converted_audio = convert_to_mono_wav(audio_file, wav_path)
-            if not converted_audio:
-                print("Error al convertir el audio a WAV. Saliendo.")
-                logging.error("Conversión de audio fallida.")
-                sys.exit(1)
+            # Decodifica el audio a 16 kHz mono en memoria, listo para Whisper
+            audio = decode_to_mono_array(audio_file)
+            if audio is None:
+                print("Error al decodificar el audio. Saliendo.")
+                logger.error("Decodificación de audio fallida.")
+                return None
             
-            # Verifica la duración del archivo de audio
-            try:
-                audio = AudioSegment.from_wav(converted_audio)
-                duration = audio.duration_seconds
-                print(f"Duración del audio (s): {duration:.1f}")
-                logging.info(f"Duración del audio: {duration:.1f} segundos")
-            except Exception as e:
-                logging.error(f"No se pudo determinar la duración del audio: {e}")
+            duration = len(audio) / whisper.audio.SAMPLE_RATE
+            print(f"Duración del audio (s): {duration:.1f}")
+            logger.info(f"Duración del audio: {duration:.1f} segundos")
             
             # Transcribe el audio descargado usando Whisper
-            transcript, lang = transcribe_audio(converted_audio, whisper_model)
+            transcript, lang = transcribe_audio(audio, whisper_model)
             if transcript.strip():
                 print("Transcripción completada.")
-                logging.info("Transcripción completada exitosamente.")
+                logger.info("Transcripción completada exitosamente.")
                 
                 # Genera el resumen del texto transcrito utilizando sumy
                 print("Generando resumen...")
-                logging.info("Iniciando resumen de la transcripción utilizando sumy.")
+                logger.info("Iniciando resumen de la transcripción utilizando sumy.")
                 summary = summarize_text_sumy(transcript, sentence_count=5)  # Ajusta el número de frases según tus necesidades
                 
                 if not summary.strip():
                     print("Error al generar el resumen o el resumen está vacío. Saliendo.")
-                    logging.warning("El resumen está vacío después de la generación.")
+                    logger.warning("El resumen está vacío después de la generación.")
                     summary = "No se generó ningún resumen."
                 
                 print("\n--- Resumen ---\n")
@@ -220,16 +251,27 @@ def main():
                     with open(summary_filepath, 'w', encoding='utf-8') as f:
                         f.write(file_content)
                     print(f"\nResumen guardado en '{summary_filename}'.")
-                    logging.info(f"Resumen guardado en '{summary_filepath}'.")
+                    logger.info(f"Resumen guardado en '{summary_filepath}'.")
+                    return summary_filepath
                 except Exception as e:
                     print(f"Error al guardar el resumen en el archivo: {e}")
-                    logging.error(f"Error al guardar el archivo '{summary_filepath}': {e}")
+                    logger.error(f"Error al guardar el archivo '{summary_filepath}': {e}")
             else:
                 print("No se generó ninguna transcripción. Saliendo.")
-                logging.warning("La transcripción estaba vacía después del procesamiento del audio.")
+                logger.warning("La transcripción estaba vacía después del procesamiento del audio.")
         else:
             print("Error al descargar el audio. Saliendo.")
-            logging.error("La descarga del audio falló para la URL proporcionada.")
+            logger.error("La descarga del audio falló para la URL proporcionada.")
+    return None
+
+def main():
+    if len(sys.argv) != 2:
+        print("Uso: python youtube_extractor_spanish.py <URL_de_YouTube>")
+        print("Ejemplo: python youtube_extractor_spanish.py https://www.youtube.com/watch?v=1234567890A")
+        sys.exit(1)
+    
+    if extract_spanish(sys.argv[1]) is None:
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
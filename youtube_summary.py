@@ -8,6 +8,7 @@ import random
 from datetime import datetime
 from yt_dlp import YoutubeDL
 import whisper
+import torch
 from transformers import pipeline
 import logging
 
@@ -15,6 +16,8 @@ import logging
 
 # Whisper model size: 'tiny', 'base', 'small', 'medium', 'large'
 WHISPER_MODEL_SIZE = 'base'  # Adjust based on your system's capabilities
+# Run Whisper on the GPU in FP16 when one is available
+WHISPER_DEVICE = 'cuda' if torch.cuda.is_available() else 'cpu'
 
 # Summarization model
 SUMMARIZATION_MODEL = "facebook/bart-large-cnn"  # You can choose other models if desired
@@ -100,7 +103,7 @@ def transcribe_audio(audio_path, model):
     Transcribe audio to text using Whisper.
     """
     try:
-        result = model.transcribe(audio_path)
+        result = model.transcribe(audio_path, fp16=(WHISPER_DEVICE == 'cuda'))
         logging.info(f"Transcribed audio file {audio_path}.")
         return result['text']
     except Exception as e:
@@ -161,7 +164,7 @@ def main():
     # Initialize Whisper model
     print(f"Loading Whisper model ({WHISPER_MODEL_SIZE})...")
     logging.info(f"Loading Whisper model '{WHISPER_MODEL_SIZE}'.")
-    whisper_model = whisper.load_model(WHISPER_MODEL_SIZE)
+    whisper_model = whisper.load_model(WHISPER_MODEL_SIZE, device=WHISPER_DEVICE)
     
     # Initialize summarization pipeline
     print(f"Loading summarization model ({SUMMARIZATION_MODEL})...")
@@ -1,20 +1,23 @@
 import os
 import re
+import subprocess
 import sys
-import glob
 import tempfile
 import time
 from datetime import datetime
 from yt_dlp import YoutubeDL
+import numpy as np
 import whisper
+import torch
 from transformers import pipeline
 import logging
-from pydub import AudioSegment  # Used to convert audio format
 
 # ---------------------------- Configuration ---------------------------- #
 
 # Whisper model size: choose among 'tiny', 'base', 'small', 'medium', 'large'
 WHISPER_MODEL_SIZE = 'base'  # Adjust based on your system's capabilities
+# Run Whisper on the GPU in FP16 when one is available
+WHISPER_DEVICE = 'cuda' if torch.cuda.is_available() else 'cpu'
 
 # Summarization models
 ENGLISH_SUMMARIZATION_MODEL = "facebook/bart-large-cnn"
@@ -63,10 +66,10 @@ def download_audio(video_url, download_path, max_retries=3):
             with YoutubeDL(ydl_opts) as ydl:
                 info_dict = ydl.extract_info(video_url, download=True)
                 logging.info(f"Downloaded video info for {video_url}: {info_dict.get('title', 'Unknown Title')}")
-            # After download, find the mp3 file in the download folder
-            mp3_files = glob.glob(os.path.join(download_path, "*.mp3"))
-            if mp3_files:
-                audio_file = mp3_files[0]
+            # The ExtractAudio postprocessor records the final .mp3 path on the info dict
+            downloads = info_dict.get('requested_downloads') or [{}]
+            audio_file = downloads[-1].get('filepath') or os.path.join(download_path, f"{info_dict['id']}.mp3")
+            if os.path.exists(audio_file):
                 logging.info(f"Found audio file: {audio_file}")
                 return audio_file
             else:
@@ -80,34 +83,39 @@ def download_audio(video_url, download_path, max_retries=3):
             else:
                 return None
 
-def convert_to_mono_wav(mp3_path, output_path):
+def decode_to_mono_array(mp3_path):
     """
-    Convert an MP3 file to a mono WAV file.
+    Decode an audio file with ffmpeg into a 16 kHz mono float32 array.
     """
     try:
-        audio = AudioSegment.from_mp3(mp3_path)
-        audio = audio.set_channels(1)  # Convert to mono
-        audio.export(output_path, format="wav")
-        logging.info(f"Converted {mp3_path} to mono WAV at {output_path}.")
-        return output_path
-    except Exception as e:
-        logging.error(f"Error converting {mp3_path} to WAV: {e}")
+        # ffmpeg decodes, downmixes and resamples to Whisper's input format in one
+        # process; the samples come back over the pipe with no intermediate WAV file
+        proc = subprocess.run(
+            ['ffmpeg', '-nostdin', '-loglevel', 'error', '-i', mp3_path,
+             '-vn', '-ac', '1', '-ar', str(whisper.audio.SAMPLE_RATE), '-f', 'f32le', '-'],
+            check=True, capture_output=True
+        )
+        audio = np.frombuffer(proc.stdout, np.float32)
+        logging.info(f"Decoded {mp3_path} to 16 kHz mono audio.")
+        return audio
+    except (OSError, subprocess.CalledProcessError) as e:
+        logging.error(f"Error decoding {mp3_path}: {e}")
         return None
 
-def transcribe_audio(audio_path, model):
+def transcribe_audio(audio, model):
     """
     Transcribe audio to text using Whisper.
     Returns both the transcript and the detected language code.
     """
     try:
         # Specify language to improve accuracy
-        result = model.transcribe(audio_path, language="es")
+        result = model.transcribe(audio, language="es", fp16=(WHISPER_DEVICE == 'cuda'))
         transcript = result.get('text', "")
         language = result.get('language', "es")
-        logging.info(f"Transcribed audio file {audio_path} with detected language: {language}.")
+        logging.info(f"Transcribed {len(audio) / whisper.audio.SAMPLE_RATE:.1f} s of audio with detected language: {language}.")
         return transcript, language
     except Exception as e:
-        logging.error(f"Error transcribing {audio_path}: {e}")
+        logging.error(f"Error transcribing audio: {e}")
         return "", "es"
 
 def summarize_text(text, summarizer):
@@ -162,7 +170,7 @@ def main():
     # Load the Whisper model for transcription
     print(f"Loading Whisper model ({WHISPER_MODEL_SIZE})...")
     logging.info(f"Loading Whisper model '{WHISPER_MODEL_SIZE}'.")
-    whisper_model = whisper.load_model(WHISPER_MODEL_SIZE)
+    whisper_model = whisper.load_model(WHISPER_MODEL_SIZE, device=WHISPER_DEVICE)
     
     # Create a temporary folder to store the downloaded audio
     with tempfile.TemporaryDirectory() as tmpdirname:
@@ -172,25 +180,19 @@ def main():
             print(f"Downloaded audio to {audio_file}")
             logging.info(f"Successfully downloaded audio to {audio_file}.")
 
-            # Convert MP3 to mono WAV for better transcription accuracy
-            wav_path = os.path.join(tmpdirname, "audio_mono.wav")
-            converted_audio = convert_to_mono_wav(audio_file, wav_path)
-            if not converted_audio:
-                print("Failed to convert audio to WAV. Exiting.")
-                logging.error("Audio conversion failed.")
+            # Decode to 16 kHz mono in memory, ready for Whisper
+            audio = decode_to_mono_array(audio_file)
+            if audio is None:
+                print("Failed to decode audio. Exiting.")
+                logging.error("Audio decoding failed.")
                 sys.exit(1)
             
-            # Check audio file duration
-            try:
-                audio = AudioSegment.from_wav(converted_audio)
-                duration = audio.duration_seconds
-                print(f"Audio duration (s): {duration:.1f}")
-                logging.info(f"Audio duration: {duration:.1f} seconds")
-            except Exception as e:
-                logging.error(f"Could not determine audio duration: {e}")
+            duration = len(audio) / whisper.audio.SAMPLE_RATE
+            print(f"Audio duration (s): {duration:.1f}")
+            logging.info(f"Audio duration: {duration:.1f} seconds")
             
             # Transcribe the downloaded audio using Whisper
-            transcript, lang = transcribe_audio(converted_audio, whisper_model)
+            transcript, lang = transcribe_audio(audio, whisper_model)
             if transcript.strip():
                 print("Transcription completed.")
                 logging.info("Transcription completed successfully.")
@@ -6,6 +6,7 @@ import logging
 from datetime import datetime
 from yt_dlp import YoutubeDL
 import whisper
+import torch
 from transformers import pipeline, MarianMTModel, MarianTokenizer
 from langdetect import detect
 
@@ -13,6 +14,8 @@ from langdetect import detect
 
 # Whisper model size: 'tiny', 'base', 'small', 'medium', 'large'
 WHISPER_MODEL_SIZE = 'large'  # Use a larger model for better accuracy
+# Run Whisper on the GPU in FP16 when one is available
+WHISPER_DEVICE = 'cuda' if torch.cuda.is_available() else 'cpu'
 
 # Summarization models
 SUMMARIZATION_MODELS = {
@@ -68,7 +71,7 @@ def transcribe_audio(audio_path, model):
     Transcribe audio to text using Whisper.
     """
     try:
-        result = model.transcribe(audio_path, task="transcribe")
+        result = model.transcribe(audio_path, task="transcribe", fp16=(WHISPER_DEVICE == 'cuda'))
         logging.info(f"Transcribed audio file {audio_path}.")
         return result['text'], result['language']
     except Exception as e:
@@ -134,7 +137,7 @@ def main():
     summary_filepath = os.path.join(os.getcwd(), summary_filename)
 
     logging.info(f"Loading Whisper model '{WHISPER_MODEL_SIZE}'.")
-    whisper_model = whisper.load_model(WHISPER_MODEL_SIZE)
+    whisper_model = whisper.load_model(WHISPER_MODEL_SIZE, device=WHISPER_DEVICE)
 
     with tempfile.TemporaryDirectory() as tmpdirname:
         audio_file = download_audio(video_url, tmpdirname)
@@ -8,18 +8,35 @@ import os
 import re
 import sys
 import json
-import glob
+import random
+import subprocess
 import tempfile
+import threading
 import time
 from datetime import datetime
 from yt_dlp import YoutubeDL
 import whisper
+import torch
 import logging
-from pydub import AudioSegment
+import numpy as np
 from update_context_txt import ContextUpdater
 
 # Configuration
 WHISPER_MODEL_SIZE = 'base'  # Adjust based on your system's capabilities
+# Run Whisper on the GPU in FP16 when one is available
+WHISPER_DEVICE = 'cuda' if torch.cuda.is_available() else 'cpu'
+# Quantize Whisper's linear layers to INT8 weights on CPU (needs optimum-quanto). Off by
+# default since it trades some accuracy for speed; YOUTUBE_TO_CONTEXT_QUANTIZE=1 turns it on
+QUANTIZE_WHISPER = os.environ.get('YOUTUBE_TO_CONTEXT_QUANTIZE') == '1'
+# Seconds of audio decoded and transcribed at a time, bounding memory on long videos
+TRANSCRIBE_CHUNK_SECONDS = 300
+# Download retries back off exponentially from this many seconds, plus random jitter
+RETRY_BASE_DELAY = 1.0
+RETRY_JITTER_FRAC = 0.5
+# Download errors that retrying cannot fix
+TERMINAL_DOWNLOAD_ERRORS = ('Private video', 'Video unavailable', 'Sign in to confirm your age', 'HTTP Error 404')
+# Characters dropped from titles when building filenames
+FILENAME_UNSAFE_RE = re.compile(r'[^\w\-]')
 
 # Logging configuration
 logging.basicConfig(
@@ -32,83 +49,152 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+class RequestRateLimiter:
+    """Thread-safe token bucket pacing requests to YouTube; allows bursts up to one minute's budget."""
+    
+    def __init__(self, requests_per_minute=30):
+        self.capacity = float(requests_per_minute)
+        self.tokens = self.capacity
+        self.fill_rate = requests_per_minute / 60.0
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def wait(self):
+        """Block until a request may be made."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.fill_rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                delay = (1 - self.tokens) / self.fill_rate
+            # Sleep without the lock so other threads can take tokens as they refill
+            time.sleep(delay)
+
 class YouTubeToContextProcessor:
-    def __init__(self):
+    def __init__(self, requests_per_minute=30):
         self.whisper_model = None
+        # Paces yt-dlp requests instead of fixed sleeps between videos
+        self.rate_limiter = RequestRateLimiter(requests_per_minute)
         self.context_updater = ContextUpdater()
+        # yt-dlp instances are built once and reused for every video: one shared
+        # metadata extractor behind a lock, and one audio downloader per thread so
+        # parallel downloads do not wait on each other
+        self._info_ydl = None
+        self._info_lock = threading.Lock()
+        self._audio_local = threading.local()
+        # Whisper's decoder installs per-call hooks on the shared model, so only one
+        # transcription runs at a time; downloads of other videos still overlap it
+        self._model_lock = threading.Lock()
+        self._transcribe_lock = threading.Lock()
+        # Serializes context file naming and context.txt updates
+        self._context_lock = threading.Lock()
         
     def load_whisper_model(self):
         """Load the Whisper model for transcription."""
-        if self.whisper_model is None:
-            print(f"Loading Whisper model ({WHISPER_MODEL_SIZE})...")
-            logger.info(f"Loading Whisper model '{WHISPER_MODEL_SIZE}'.")
-            self.whisper_model = whisper.load_model(WHISPER_MODEL_SIZE)
+        with self._model_lock:
+            if self.whisper_model is None:
+                print(f"Loading Whisper model ({WHISPER_MODEL_SIZE})...")
+                logger.info(f"Loading Whisper model '{WHISPER_MODEL_SIZE}'.")
+                model = whisper.load_model(WHISPER_MODEL_SIZE, device=WHISPER_DEVICE)
+                if QUANTIZE_WHISPER and WHISPER_DEVICE == 'cpu':
+                    self.quantize_whisper_model(model)
+                self.whisper_model = model
         return self.whisper_model
 
+    def quantize_whisper_model(self, model):
+        """Quantize the model's weights to INT8 in place; skipped when optimum-quanto is missing."""
+        # A model reused across processors (e.g. a memoized whisper.load_model) is quantized only once
+        if getattr(model, '_int8_quantized', False):
+            return
+        try:
+            from optimum.quanto import freeze, qint8, quantize
+        except ImportError:
+            logger.info("optimum-quanto not installed, keeping FP32 Whisper weights.")
+            return
+        quantize(model, weights=qint8)
+        freeze(model)
+        model._int8_quantized = True
+        logger.info("Quantized Whisper weights to INT8.")
+
     def sanitize_filename(self, name):
         """Sanitize the video title to create a valid filename."""
-        name = name.replace(' ', '_')
-        name = re.sub(r'[^\w\-]', '', name)
-        return name[:50]  # Limit length
+        return FILENAME_UNSAFE_RE.sub('', name.replace(' ', '_'))[:50]  # Limit length
+
+    def get_info_downloader(self):
+        """Return the shared metadata-only YoutubeDL, creating it on first use."""
+        if self._info_ydl is None:
+            self._info_ydl = YoutubeDL({'quiet': True, 'skip_download': True, 'forcejson': True})
+        return self._info_ydl
+
+    def get_audio_downloader(self, max_retries=3):
+        """Return this thread's audio YoutubeDL, creating it on first use."""
+        ydl = getattr(self._audio_local, 'ydl', None)
+        if ydl is None:
+            ydl = self._audio_local.ydl = YoutubeDL({
+                'format': 'bestaudio/best',
+                'outtmpl': '%(id)s.%(ext)s',
+                'postprocessors': [{
+                    'key': 'FFmpegExtractAudio',
+                    'preferredcodec': 'mp3',
+                    'preferredquality': '192',
+                }],
+                'quiet': True,
+                'no_warnings': True,
+                'retries': max_retries,
+            })
+        return ydl
 
     def get_video_info(self, video_url):
         """Get video information using yt-dlp."""
         try:
-            with YoutubeDL({'quiet': True, 'skip_download': True, 'forcejson': True}) as ydl:
-                info_dict = ydl.extract_info(video_url, download=False)
-                
-                # Parse upload date from YouTube format (YYYYMMDD) to ISO format
-                upload_date_str = info_dict.get('upload_date', '')
-                upload_date_iso = None
-                if upload_date_str and len(upload_date_str) == 8:
-                    try:
-                        # Convert YYYYMMDD to YYYY-MM-DDTHH:MM:SS format
-                        year = upload_date_str[:4]
-                        month = upload_date_str[4:6]
-                        day = upload_date_str[6:8]
-                        upload_date_iso = f"{year}-{month}-{day}T12:00:00"  # Assume noon UTC
-                    except Exception as e:
-                        logger.warning(f"Could not parse upload date '{upload_date_str}': {e}")
-                
-                return {
-                    'title': info_dict.get('title', 'Unknown_Video'),
-                    'duration': info_dict.get('duration', 0),
-                    'upload_date': upload_date_str,
-                    'upload_date_iso': upload_date_iso,
-                    'uploader': info_dict.get('uploader', 'Unknown'),
-                    'view_count': info_dict.get('view_count', 0),
-                    'description': info_dict.get('description', '')[:500]  # First 500 chars
-                }
+            self.rate_limiter.wait()
+            with self._info_lock:
+                info_dict = self.get_info_downloader().extract_info(video_url, download=False)
+            
+            # Parse upload date from YouTube format (YYYYMMDD) to ISO format
+            upload_date_str = info_dict.get('upload_date', '')
+            upload_date_iso = None
+            if upload_date_str and len(upload_date_str) == 8:
+                try:
+                    # Convert YYYYMMDD to YYYY-MM-DDTHH:MM:SS format
+                    year = upload_date_str[:4]
+                    month = upload_date_str[4:6]
+                    day = upload_date_str[6:8]
+                    upload_date_iso = f"{year}-{month}-{day}T12:00:00"  # Assume noon UTC
+                except Exception as e:
+                    logger.warning(f"Could not parse upload date '{upload_date_str}': {e}")
+            
+            return {
+                'title': info_dict.get('title', 'Unknown_Video'),
+                'duration': info_dict.get('duration', 0),
+                'upload_date': upload_date_str,
+                'upload_date_iso': upload_date_iso,
+                'uploader': info_dict.get('uploader', 'Unknown'),
+                'view_count': info_dict.get('view_count', 0),
+                'description': info_dict.get('description', '')[:500]  # First 500 chars
+            }
         except Exception as e:
             logger.error(f"Error fetching video info for {video_url}: {e}")
             return None
 
     def download_audio(self, video_url, download_path, max_retries=3):
         """Download the audio stream of a YouTube video using yt-dlp."""
-        ydl_opts = {
-            'format': 'bestaudio/best',
-            'outtmpl': os.path.join(download_path, '%(id)s.%(ext)s'),
-            'postprocessors': [{
-                'key': 'FFmpegExtractAudio',
-                'preferredcodec': 'mp3',
-                'preferredquality': '192',
-            }],
-            'quiet': True,
-            'no_warnings': True,
-            'retries': max_retries,
-        }
-        
         attempt = 0
         while attempt < max_retries:
             try:
-                with YoutubeDL(ydl_opts) as ydl:
-                    info_dict = ydl.extract_info(video_url, download=True)
-                    logger.info(f"Downloaded video: {info_dict.get('title', 'Unknown Title')}")
+                self.rate_limiter.wait()
+                ydl = self.get_audio_downloader(max_retries)
+                ydl.params['paths'] = {'home': download_path}
+                info_dict = ydl.extract_info(video_url, download=True)
+                logger.info(f"Downloaded video: {info_dict.get('title', 'Unknown Title')}")
                 
-                # Find the mp3 file
-                mp3_files = glob.glob(os.path.join(download_path, "*.mp3"))
-                if mp3_files:
-                    audio_file = mp3_files[0]
+                # The ExtractAudio postprocessor records the final .mp3 path on the info dict
+                downloads = info_dict.get('requested_downloads') or [{}]
+                audio_file = downloads[-1].get('filepath') or os.path.join(download_path, f"{info_dict['id']}.mp3")
+                if os.path.exists(audio_file):
                     logger.info(f"Found audio file: {audio_file}")
                     return audio_file
                 else:
@@ -117,29 +203,58 @@ class YouTubeToContextProcessor:
             except Exception as e:
                 attempt += 1
                 logger.error(f"Attempt {attempt} - Error downloading {video_url}: {e}")
-                if attempt < max_retries:
-                    time.sleep(3)
+                if attempt < max_retries and not any(err in str(e) for err in TERMINAL_DOWNLOAD_ERRORS):
+                    # Jittered exponential backoff so parallel downloads do not retry in lockstep
+                    delay = RETRY_BASE_DELAY * 2 ** (attempt - 1)
+                    time.sleep(min(60, delay + random.uniform(0, RETRY_JITTER_FRAC * delay)))
                 else:
                     return None
 
-    def convert_to_mono_wav(self, mp3_path, output_path):
-        """Convert an MP3 file to a mono WAV file."""
+    def iter_audio_chunks(self, audio_path, chunk_seconds=None):
+        """Decode audio with ffmpeg into 16 kHz mono float32 chunks of at most chunk_seconds."""
+        chunk_seconds = chunk_seconds or TRANSCRIBE_CHUNK_SECONDS
+        chunk_bytes = chunk_seconds * whisper.audio.SAMPLE_RATE * 4
+        proc = subprocess.Popen(
+            ['ffmpeg', '-nostdin', '-loglevel', 'error', '-i', audio_path,
+             '-ac', '1', '-ar', str(whisper.audio.SAMPLE_RATE), '-f', 'f32le', '-'],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        )
         try:
-            audio = AudioSegment.from_mp3(mp3_path)
-            audio = audio.set_channels(1)  # Convert to mono
-            audio.export(output_path, format="wav")
-            logger.info(f"Converted {mp3_path} to mono WAV at {output_path}.")
-            return output_path
-        except Exception as e:
-            logger.error(f"Error converting {mp3_path} to WAV: {e}")
-            return None
+            while True:
+                raw = proc.stdout.read(chunk_bytes)
+                if not raw:
+                    break
+                yield np.frombuffer(raw, np.float32)
+            _, stderr = proc.communicate()
+            if proc.returncode:
+                raise subprocess.CalledProcessError(proc.returncode, proc.args, stderr=stderr)
+        finally:
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
 
     def transcribe_audio(self, audio_path, model):
-        """Transcribe audio to text using Whisper."""
+        """
+        Transcribe audio to text using Whisper, chunk by chunk as ffmpeg decodes it.
+        Memory stays bounded by TRANSCRIBE_CHUNK_SECONDS however long the video is; each
+        chunk is prompted with the previous chunk's text and reuses the first chunk's language.
+        """
         try:
-            result = model.transcribe(audio_path)
-            transcript = result.get('text', "")
-            language = result.get('language', "unknown")
+            texts = []
+            language = None
+            for chunk in self.iter_audio_chunks(audio_path):
+                with self._transcribe_lock:
+                    result = model.transcribe(
+                        chunk,
+                        language=language,
+                        initial_prompt=texts[-1] if texts else None,
+                        condition_on_previous_text=False,
+                        fp16=(WHISPER_DEVICE == 'cuda'),
+                    )
+                texts.append(result.get('text', ""))
+                language = language or result.get('language')
+            transcript = "".join(texts)
+            language = language or "unknown"
             logger.info(f"Transcribed audio file {audio_path} with detected language: {language}.")
             return transcript, language
         except Exception as e:
@@ -154,9 +269,6 @@ class YouTubeToContextProcessor:
             context_filename = f"context-{timestamp}.json"
             context_filepath = os.path.join("context", context_filename)
             
-            # Ensure context directory exists
-            os.makedirs("context", exist_ok=True)
-            
             # Create video filename from title (use actual title, not sanitized)
             video_filename = video_info['title']
             
@@ -202,9 +314,16 @@ class YouTubeToContextProcessor:
                 "transcription": formatted_transcription
             }
             
-            # Save context file
-            with open(context_filepath, 'w', encoding='utf-8') as f:
-                json.dump(context_data, f, indent=2, ensure_ascii=False)
+            # Save context file; videos finishing in the same second get a numbered name
+            with self._context_lock:
+                os.makedirs("context", exist_ok=True)
+                suffix = 1
+                while os.path.exists(context_filepath):
+                    suffix += 1
+                    context_filename = f"context-{timestamp}-{suffix}.json"
+                    context_filepath = os.path.join("context", context_filename)
+                with open(context_filepath, 'w', encoding='utf-8') as f:
+                    json.dump(context_data, f, indent=2, ensure_ascii=False)
             
             logger.info(f"Created context file: {context_filepath}")
             print(f"✅ Created context file: {context_filename}")
@@ -246,17 +365,9 @@ class YouTubeToContextProcessor:
             
             print(f"✅ Downloaded audio: {os.path.basename(audio_file)}")
             
-            # Convert to WAV for better transcription
-            wav_path = os.path.join(tmpdirname, "audio_mono.wav")
-            converted_audio = self.convert_to_mono_wav(audio_file, wav_path)
-            
-            if not converted_audio:
-                print("❌ Failed to convert audio to WAV")
-                return False
-            
-            # Transcribe audio
+            # Transcribe audio (decoded straight from the download, no WAV copy)
             print("🎤 Transcribing audio...")
-            transcript, language = self.transcribe_audio(converted_audio, model)
+            transcript, language = self.transcribe_audio(audio_file, model)
             
             if not transcript.strip():
                 print("❌ No transcript was generated")
@@ -272,7 +383,8 @@ class YouTubeToContextProcessor:
                 # Update context.txt automatically
                 print("📄 Updating context.txt...")
                 try:
-                    new_count = self.context_updater.check_for_new_files()
+                    with self._context_lock:
+                        new_count = self.context_updater.check_for_new_files()
                     if new_count > 0:
                         print(f"✅ Added to context.txt (Recording #{new_count})")
                     else:
@@ -309,11 +421,6 @@ class YouTubeToContextProcessor:
                 else:
                     failed += 1
                     print(f"❌ Failed! ({failed}/{i})")
-                
-                # Small delay between videos to avoid rate limiting
-                if i < len(links):
-                    print("⏳ Waiting 5 seconds before next video...")
-                    time.sleep(5)
             
             print(f"\n" + "=" * 50)
             print(f"📊 PROCESSING COMPLETE!")